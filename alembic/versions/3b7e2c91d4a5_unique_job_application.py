@@ -0,0 +1,47 @@
+"""unique_job_application
+
+Revision ID: 3b7e2c91d4a5
+Revises: 14569ec1f31c
+Create Date: 2026-10-18 09:12:40.118302
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3b7e2c91d4a5"
+down_revision: Union[str, None] = "14569ec1f31c"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade():
+    op.add_column(
+        "job_applications", sa.Column("idempotency_key", sa.String(), nullable=True)
+    )
+
+    # Keep only the earliest application per (user_id, job_id) before constraining
+    op.execute(
+        """
+        DELETE FROM job_applications a
+        USING job_applications b
+        WHERE a.user_id = b.user_id
+          AND a.job_id = b.job_id
+          AND (a.created_at, a.id) > (b.created_at, b.id)
+        """
+    )
+
+    op.create_unique_constraint(
+        "uq_job_applications_user_job", "job_applications", ["user_id", "job_id"]
+    )
+
+
+def downgrade():
+    op.drop_constraint(
+        "uq_job_applications_user_job", "job_applications", type_="unique"
+    )
+    op.drop_column("job_applications", "idempotency_key")
@@ -0,0 +1,55 @@
+"""job_application_stats
+
+Revision ID: 8d41f0a6c2e7
+Revises: 3b7e2c91d4a5
+Create Date: 2026-10-18 10:03:17.542981
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "8d41f0a6c2e7"
+down_revision: Union[str, None] = "3b7e2c91d4a5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade():
+    op.create_table(
+        "job_application_stats",
+        sa.Column("job_id", sa.UUID(), nullable=False),
+        sa.Column("status", sa.String(), nullable=False),
+        sa.Column("application_count", sa.Integer(), nullable=False),
+        sa.Column("scored_count", sa.Integer(), nullable=False),
+        sa.Column("match_sum", sa.Float(), nullable=False),
+        sa.Column("high_match_count", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["job_id"], ["job_postings.id"]),
+        sa.PrimaryKeyConstraint("job_id", "status"),
+    )
+
+    # Backfill the rollup from existing applications
+    op.execute(
+        """
+        INSERT INTO job_application_stats
+            (job_id, status, application_count, scored_count, match_sum,
+             high_match_count)
+        SELECT job_id,
+               COALESCE(status, 'pending'),
+               COUNT(*),
+               COUNT(overall_match),
+               COALESCE(SUM(overall_match), 0),
+               SUM(CASE WHEN overall_match >= 0.8 THEN 1 ELSE 0 END)
+        FROM job_applications
+        WHERE job_id IS NOT NULL
+        GROUP BY job_id, COALESCE(status, 'pending')
+        """
+    )
+
+
+def downgrade():
+    op.drop_table("job_application_stats")
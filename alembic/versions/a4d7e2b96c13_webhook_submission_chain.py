@@ -0,0 +1,63 @@
+"""webhook_submission_chain
+
+Revision ID: a4d7e2b96c13
+Revises: d6a1f3c85e92
+Create Date: 2026-10-19 16:20:11.402734
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a4d7e2b96c13"
+down_revision: Union[str, None] = "d6a1f3c85e92"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade():
+    op.add_column(
+        "webhook_submissions",
+        sa.Column("previous_id", postgresql.UUID(as_uuid=True), nullable=True),
+    )
+    # Chain existing rows per submitter in the order they were received
+    op.execute(
+        """
+        UPDATE webhook_submissions AS s
+        SET previous_id = chained.previous_id
+        FROM (
+            SELECT id, lag(id) OVER (
+                PARTITION BY email ORDER BY created_at, id
+            ) AS previous_id
+            FROM webhook_submissions
+        ) AS chained
+        WHERE s.id = chained.id
+        """
+    )
+    op.create_index(
+        "uq_webhook_submissions_email_previous",
+        "webhook_submissions",
+        ["email", "previous_id"],
+        unique=True,
+        postgresql_nulls_not_distinct=True,
+    )
+    op.drop_index(
+        "ix_webhook_submissions_content_hash", table_name="webhook_submissions"
+    )
+
+
+def downgrade():
+    op.create_index(
+        "ix_webhook_submissions_content_hash",
+        "webhook_submissions",
+        ["content_hash"],
+    )
+    op.drop_index(
+        "uq_webhook_submissions_email_previous", table_name="webhook_submissions"
+    )
+    op.drop_column("webhook_submissions", "previous_id")
@@ -0,0 +1,40 @@
+"""etag_versions
+
+Revision ID: a7c3d9e52f18
+Revises: e1f6b2d83a94
+Create Date: 2026-10-18 15:20:07.381946
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a7c3d9e52f18"
+down_revision: Union[str, None] = "e1f6b2d83a94"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade():
+    op.add_column(
+        "users",
+        sa.Column("profile_version", sa.Integer(), nullable=False, server_default="0"),
+    )
+
+    catalog_state = op.create_table(
+        "catalog_state",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("version", sa.Integer(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.bulk_insert(catalog_state, [{"id": 1, "version": 0}])
+
+
+def downgrade():
+    op.drop_table("catalog_state")
+    op.drop_column("users", "profile_version")
@@ -0,0 +1,46 @@
+"""webhook_submissions
+
+Revision ID: b9d4e7a21c63
+Revises: f3b8c61d0e27
+Create Date: 2026-10-19 09:15:02.417760
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b9d4e7a21c63"
+down_revision: Union[str, None] = "f3b8c61d0e27"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade():
+    op.create_table(
+        "webhook_submissions",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("email", sa.String(), nullable=False),
+        sa.Column("answers", sa.JSON(), nullable=False),
+        sa.Column("status", sa.String(), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("next_attempt_at", sa.DateTime(), nullable=False),
+        sa.Column("last_error", sa.String(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("processed_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_webhook_submissions_open",
+        "webhook_submissions",
+        ["status", "next_attempt_at"],
+        postgresql_where=sa.text("status != 'done'"),
+    )
+
+
+def downgrade():
+    op.drop_index("ix_webhook_submissions_open", table_name="webhook_submissions")
+    op.drop_table("webhook_submissions")
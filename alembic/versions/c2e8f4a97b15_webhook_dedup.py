@@ -0,0 +1,44 @@
+"""webhook_dedup
+
+Revision ID: c2e8f4a97b15
+Revises: b9d4e7a21c63
+Create Date: 2026-10-19 11:02:47.681395
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c2e8f4a97b15"
+down_revision: Union[str, None] = "b9d4e7a21c63"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade():
+    op.add_column(
+        "webhook_submissions", sa.Column("content_hash", sa.String(), nullable=True)
+    )
+    op.create_index(
+        "ix_webhook_submissions_content_hash",
+        "webhook_submissions",
+        ["content_hash"],
+    )
+    op.create_index(
+        "ix_webhook_submissions_open_email",
+        "webhook_submissions",
+        ["email"],
+        postgresql_where=sa.text("status != 'done'"),
+    )
+
+
+def downgrade():
+    op.drop_index("ix_webhook_submissions_open_email", table_name="webhook_submissions")
+    op.drop_index(
+        "ix_webhook_submissions_content_hash", table_name="webhook_submissions"
+    )
+    op.drop_column("webhook_submissions", "content_hash")
@@ -0,0 +1,108 @@
+"""query_shape_indexes
+
+Revision ID: c5a9e3f17b20
+Revises: 8d41f0a6c2e7
+Create Date: 2026-10-18 11:26:05.731164
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c5a9e3f17b20"
+down_revision: Union[str, None] = "8d41f0a6c2e7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade():
+    # Denormalize company_id into the stats rollup for per-company reads
+    op.add_column(
+        "job_application_stats", sa.Column("company_id", sa.UUID(), nullable=True)
+    )
+    op.create_foreign_key(
+        "job_application_stats_company_id_fkey",
+        "job_application_stats",
+        "companies",
+        ["company_id"],
+        ["id"],
+    )
+    op.execute(
+        """
+        UPDATE job_application_stats s
+        SET company_id = j.company_id
+        FROM job_postings j
+        WHERE j.id = s.job_id
+        """
+    )
+
+    # CREATE INDEX CONCURRENTLY can't run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_job_applications_user_created",
+            "job_applications",
+            ["user_id", sa.text("created_at DESC")],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_job_applications_job_match",
+            "job_applications",
+            ["job_id", sa.text("overall_match DESC NULLS LAST"), "id"],
+            postgresql_include=[
+                "user_id",
+                "status",
+                "skills_match",
+                "wellbeing_match",
+                "values_match",
+                "created_at",
+            ],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_job_postings_company_created",
+            "job_postings",
+            ["company_id", sa.text("created_at DESC")],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_job_postings_created_at",
+            "job_postings",
+            [sa.text("created_at DESC")],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_job_application_stats_company",
+            "job_application_stats",
+            ["company_id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        for table, name in [
+            ("job_application_stats", "ix_job_application_stats_company"),
+            ("job_postings", "ix_job_postings_created_at"),
+            ("job_postings", "ix_job_postings_company_created"),
+            ("job_applications", "ix_job_applications_job_match"),
+            ("job_applications", "ix_job_applications_user_created"),
+        ]:
+            op.drop_index(
+                name, table_name=table, postgresql_concurrently=True, if_exists=True
+            )
+
+    op.drop_constraint(
+        "job_application_stats_company_id_fkey",
+        "job_application_stats",
+        type_="foreignkey",
+    )
+    op.drop_column("job_application_stats", "company_id")
@@ -0,0 +1,50 @@
+"""snapshot_dependencies
+
+Revision ID: d6a1f3c85e92
+Revises: c2e8f4a97b15
+Create Date: 2026-10-19 13:27:09.553146
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d6a1f3c85e92"
+down_revision: Union[str, None] = "c2e8f4a97b15"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade():
+    # Existing snapshots have no dependency rows; drop them, they are
+    # recomputed on demand
+    op.execute("DELETE FROM recommendation_snapshots")
+    op.add_column(
+        "recommendation_snapshots", sa.Column("score_bound", sa.Float(), nullable=True)
+    )
+    op.create_table(
+        "recommendation_snapshot_jobs",
+        sa.Column("job_id", sa.UUID(), nullable=False),
+        sa.Column("user_id", sa.UUID(), nullable=False),
+        sa.ForeignKeyConstraint(["job_id"], ["job_postings.id"]),
+        sa.ForeignKeyConstraint(["user_id"], ["recommendation_snapshots.user_id"]),
+        sa.PrimaryKeyConstraint("job_id", "user_id"),
+    )
+    op.create_index(
+        op.f("ix_recommendation_snapshot_jobs_user_id"),
+        "recommendation_snapshot_jobs",
+        ["user_id"],
+    )
+
+
+def downgrade():
+    op.drop_index(
+        op.f("ix_recommendation_snapshot_jobs_user_id"),
+        table_name="recommendation_snapshot_jobs",
+    )
+    op.drop_table("recommendation_snapshot_jobs")
+    op.drop_column("recommendation_snapshots", "score_bound")
@@ -0,0 +1,92 @@
+"""job_status_lifecycle
+
+Revision ID: e1f6b2d83a94
+Revises: c5a9e3f17b20
+Create Date: 2026-10-18 12:48:51.204573
+
+"""
+
+from datetime import date
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.core.lifecycle import parse_deadline
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e1f6b2d83a94"
+down_revision: Union[str, None] = "c5a9e3f17b20"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade():
+    op.add_column(
+        "job_postings",
+        sa.Column("status", sa.String(), nullable=False, server_default="active"),
+    )
+
+    # Expire postings whose deadline has already passed, parsed as the sweeper
+    # does; a deadline it can't parse (free text, "2024-02-30") is left alone
+    job_postings = sa.table(
+        "job_postings",
+        sa.column("id"),
+        sa.column("application_deadline"),
+        sa.column("status"),
+    )
+    bind = op.get_bind()
+    rows = bind.execute(
+        sa.select(job_postings.c.id, job_postings.c.application_deadline).where(
+            job_postings.c.application_deadline.is_not(None)
+        )
+    )
+    today = date.today()
+    overdue = []
+    for job_id, deadline in rows:
+        parsed = parse_deadline(deadline)
+        if parsed is not None and parsed < today:
+            overdue.append(job_id)
+    for start in range(0, len(overdue), 1000):
+        bind.execute(
+            job_postings.update()
+            .where(job_postings.c.id.in_(overdue[start : start + 1000]))
+            .values(status="expired")
+        )
+
+    # Catalog queries only read active rows; replace the full created_at index
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_job_postings_active_created",
+            "job_postings",
+            [sa.text("created_at DESC"), "id"],
+            postgresql_where=sa.text("status = 'active'"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_job_postings_created_at",
+            table_name="job_postings",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_job_postings_created_at",
+            "job_postings",
+            [sa.text("created_at DESC")],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_job_postings_active_created",
+            table_name="job_postings",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+    op.drop_column("job_postings", "status")
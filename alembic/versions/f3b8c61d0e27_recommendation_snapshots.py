@@ -0,0 +1,36 @@
+"""recommendation_snapshots
+
+Revision ID: f3b8c61d0e27
+Revises: a7c3d9e52f18
+Create Date: 2026-10-18 16:42:31.905214
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f3b8c61d0e27"
+down_revision: Union[str, None] = "a7c3d9e52f18"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade():
+    op.create_table(
+        "recommendation_snapshots",
+        sa.Column("user_id", sa.UUID(), nullable=False),
+        sa.Column("profile_version", sa.Integer(), nullable=False),
+        sa.Column("catalog_version", sa.Integer(), nullable=False),
+        sa.Column("recommendations", sa.JSON(), nullable=False),
+        sa.Column("computed_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("user_id"),
+    )
+
+
+def downgrade():
+    op.drop_table("recommendation_snapshots")
@@ -0,0 +1,41 @@
+# app/api/etag.py
+import hashlib
+from typing import Optional
+
+from fastapi import Response
+
+# User-specific payloads: any cache may keep them but must revalidate first
+PRIVATE_REVALIDATE = "private, no-cache"
+
+
+def make_etag(*parts) -> str:
+    """Strong ETag from the values a response is derived from"""
+    key = "|".join(str(part) for part in parts).encode()
+    return '"%s"' % hashlib.blake2b(key, digest_size=16).hexdigest()
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match check; uses weak comparison, as RFC 9110 requires"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    return etag in candidates
+
+
+def conditional_response(
+    response: Response,
+    if_none_match: Optional[str],
+    etag: str,
+    cache_control: str = PRIVATE_REVALIDATE,
+) -> Optional[Response]:
+    """Set validators on the response; return a 304 if the client's copy is current
+
+    Call it before doing the expensive work, and return its result if it isn't None.
+    """
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return None
@@ -0,0 +1,15 @@
+# app/api/metrics.py
+from fastapi import APIRouter
+from fastapi.responses import Response
+
+from app.core.metrics import registry
+
+router = APIRouter()
+
+PROMETHEUS_MEDIA_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Every registered metric in the Prometheus text exposition format"""
+    return Response(registry.render(), media_type=PROMETHEUS_MEDIA_TYPE)
@@ -0,0 +1,34 @@
+# app/api/profiles.py
+import hmac
+
+from fastapi import APIRouter, Depends, Header, HTTPException
+from fastapi.responses import FileResponse
+
+from app.config import get_settings
+from app.core.profiler import ADMIN_TOKEN_HEADER, get_profile_store
+
+router = APIRouter()
+
+
+def require_profiler_token(
+    token: str = Header("", alias=ADMIN_TOKEN_HEADER),
+) -> None:
+    """Admin check: the request must carry PROFILER_SECRET"""
+    secret = get_settings().PROFILER_SECRET
+    if not secret or not hmac.compare_digest(token, secret):
+        raise HTTPException(status_code=403, detail="Invalid profiler token")
+
+
+@router.get("/profiles", dependencies=[Depends(require_profiler_token)])
+async def list_profiles():
+    """Stored request profiles, newest first"""
+    return {"profiles": get_profile_store().list()}
+
+
+@router.get("/profiles/{name}", dependencies=[Depends(require_profiler_token)])
+async def download_profile(name: str):
+    """Download one profile; load it with pstats.Stats or snakeviz"""
+    path = get_profile_store().path(name)
+    if path is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return FileResponse(path, media_type="application/octet-stream", filename=name)
@@ -0,0 +1,114 @@
+# app/api/question_catalog.py
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+import gzip
+import json
+
+from fastapi import Response
+
+from app.api.etag import etag_matches, make_etag
+from app.core.dimensions import AssessmentDimensions, AssessmentType
+from app.schemas.assessment import QuestionResponse
+
+# Questions are only written in English so far; catalogs are keyed by locale so
+# translations can be added without changing the serving path
+DEFAULT_LOCALE = "en"
+
+# Questions only change on deploy; after that the ETag makes clients refetch
+CACHE_CONTROL = "public, max-age=3600, stale-while-revalidate=86400"
+
+
+@dataclass(frozen=True)
+class RenderedCatalog:
+    """A question catalog serialized once, in plain and gzip form"""
+
+    body: bytes
+    gzip_body: bytes
+    etag: str
+    gzip_etag: str
+
+
+_catalogs: Dict[Tuple[AssessmentType, str], RenderedCatalog] = {}
+
+
+def render_catalog(assessment_type: AssessmentType) -> RenderedCatalog:
+    """Validate and serialize one assessment's questions"""
+    questions = [
+        QuestionResponse(
+            id=f"{assessment_type}_{idx}",
+            dimension=q["dimension"],
+            dimension_title=q["dimension_title"],
+            question_text=q["question"],
+            theory=q["theory"],
+        ).model_dump()
+        for idx, q in enumerate(AssessmentDimensions.get_questions(assessment_type))
+    ]
+    # Same encoding as FastAPI's JSONResponse
+    body = json.dumps(questions, ensure_ascii=False, separators=(",", ":")).encode()
+    etag = make_etag("questions", assessment_type.value, body)
+    return RenderedCatalog(
+        body=body,
+        gzip_body=gzip.compress(body, compresslevel=9, mtime=0),
+        etag=etag,
+        # Each encoding is its own representation, so it needs its own tag
+        gzip_etag=etag[:-1] + '-gzip"',
+    )
+
+
+def load_question_catalogs() -> None:
+    """Render every assessment's question catalog; run once at startup"""
+    for assessment_type in AssessmentType:
+        _catalogs[(assessment_type, DEFAULT_LOCALE)] = render_catalog(assessment_type)
+
+
+def _quality(params: str) -> float:
+    """An Accept-Encoding entry's q value; 1 when absent or malformed"""
+    for param in params.split(";"):
+        name, _, value = param.partition("=")
+        if name.strip().lower() == "q":
+            try:
+                return float(value)
+            except ValueError:
+                return 1.0
+    return 1.0
+
+
+def _accepts_gzip(accept_encoding: Optional[str]) -> bool:
+    qualities = {}
+    for coding in (accept_encoding or "").split(","):
+        name, _, params = coding.partition(";")
+        qualities.setdefault(name.strip().lower(), _quality(params))
+    # An explicit gzip entry overrides the wildcard
+    return qualities.get("gzip", qualities.get("*", 0)) > 0
+
+
+def question_catalog_response(
+    assessment_type: AssessmentType,
+    accept_encoding: Optional[str] = None,
+    if_none_match: Optional[str] = None,
+) -> Response:
+    """Serve a pre-rendered catalog, gzipped if the client accepts it"""
+    key = (assessment_type, DEFAULT_LOCALE)
+    catalog = _catalogs.get(key)
+    if catalog is None:
+        # Not loaded at startup (e.g. app used without its lifespan)
+        catalog = _catalogs[key] = render_catalog(assessment_type)
+
+    use_gzip = _accepts_gzip(accept_encoding)
+    headers = {
+        "ETag": catalog.gzip_etag if use_gzip else catalog.etag,
+        "Cache-Control": CACHE_CONTROL,
+        "Content-Language": DEFAULT_LOCALE,
+        "Vary": "Accept-Encoding",
+    }
+    if etag_matches(if_none_match, catalog.etag) or etag_matches(
+        if_none_match, catalog.gzip_etag
+    ):
+        return Response(status_code=304, headers=headers)
+
+    if use_gzip:
+        headers["Content-Encoding"] = "gzip"
+        return Response(
+            catalog.gzip_body, media_type="application/json", headers=headers
+        )
+    return Response(catalog.body, media_type="application/json", headers=headers)
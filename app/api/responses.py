@@ -0,0 +1,60 @@
+# app/api/responses.py
+from typing import Any, Mapping, Optional
+from uuid import UUID
+
+import orjson
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel, TypeAdapter
+
+JSON_MEDIA_TYPE = "application/json"
+
+
+def _orjson_default(value: Any):
+    """Encode what orjson doesn't handle natively"""
+    if isinstance(value, UUID):
+        # orjson only takes exact uuid.UUID; asyncpg returns a subclass
+        return str(value)
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(content: Any, option: int = 0) -> bytes:
+    """orjson.dumps with our default hook"""
+    return orjson.dumps(content, default=_orjson_default, option=option)
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response for content we built ourselves; skips jsonable_encoder"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def json_response(
+    content: Any, headers: Optional[Mapping[str, str]] = None
+) -> ORJSONResponse:
+    """Serialize trusted content (plain dicts/lists from our own queries)"""
+    return ORJSONResponse(content, headers=dict(headers or {}))
+
+
+def model_response(
+    adapter: TypeAdapter, value: Any, headers: Optional[Mapping[str, str]] = None
+) -> Response:
+    """Serialize already-validated models in pydantic-core, without revalidating"""
+    return Response(
+        adapter.dump_json(value),
+        media_type=JSON_MEDIA_TYPE,
+        headers=dict(headers or {}),
+    )
+
+
+def validated_response(
+    adapter: TypeAdapter,
+    data: Any,
+    headers: Optional[Mapping[str, str]] = None,
+    from_attributes: bool = False,
+) -> Response:
+    """Validate raw data (dicts or ORM rows) once, then serialize it"""
+    value = adapter.validate_python(data, from_attributes=from_attributes)
+    return model_response(adapter, value, headers)
@@ -1,19 +1,31 @@
 # app/api/routes.py
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Header, Query, Request, Response
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Literal, Tuple
 from uuid import UUID
-from app.db.models import Company, JobPosting, User  # Add this with the other imports
+from app.db.models import (  # Add this with the other imports
+    ApplicationStatus,
+    Company,
+    JobPosting,
+    JobStatus,
+    User,
+)
 from sqlalchemy.orm import selectinload
+import asyncio
+import heapq
 import logging
-import json
 
 from app.schemas.table import TableDataResponse, TableRowResponse
 
 logger = logging.getLogger(__name__)
 # Add these imports to the top of routes.py
-from app.schemas.company import CompanyResponse
+from app.schemas.company import (
+    CompanyResponse,
+    CompanyUpdate,
+    JobPostingResponse,
+    JobPostingUpdate,
+)
 from app.schemas.user import (
     UserCreate,
     UserResponse,
@@ -21,21 +33,56 @@ from app.schemas.user import (
 from app.schemas.job import (
     JobMatch,
     JobApplication,
+    BatchMatchRequest,
+    BatchMatchResponse,
 )  # You'll need to create these schemas
 from datetime import datetime
 
 
-from app.db.database import get_db
+from app.db.database import get_db, get_read_db, replica_router, AsyncSessionLocal
+from app.db.instrumentation import query_budget
+from app.db.pagination import encode_cursor, decode_cursor
+from app.api.streaming import ndjson_response
+from app.api.etag import conditional_response, make_etag
+from app.api.question_catalog import question_catalog_response
+from app.api.responses import json_response, model_response, validated_response
+from app.schemas.adapters import (
+    company_list_adapter,
+    job_posting_list_adapter,
+    profile_adapter,
+    table_data_adapter,
+)
 from app.db.crud import (
     create_job_application,
     get_application,
+    get_application_context,
+    get_user_applications as get_applications_by_user,
     get_user_by_email,
+    get_cached_user,
+    get_cached_user_by_id,
+    get_cached_users,
+    get_jobs_with_companies,
     get_or_create_user,
     get_applications_by_company,
-    update_user_assessment,
+    get_job_applicants_page,
+    stream_applications_by_company,
+    get_application_stats,
+    get_application_stats_by_company,
+    update_application_status,
+    update_user_assessments,
     get_active_jobs,
     get_job_posting,
-    get_company_by_id,
+    get_companies_page,
+    get_active_job_counts,
+    get_latest_active_jobs,
+    get_catalog_version,
+    get_recommendation_snapshot,
+    requeue_dead_submissions,
+    stream_companies,
+    stream_active_jobs_with_companies,
+    set_job_status,
+    update_company,
+    update_job_posting,
 )
 from sqlalchemy.util._concurrency_py3k import greenlet_spawn
 from app.core.dimensions import (
@@ -43,7 +90,19 @@ from app.core.dimensions import (
     AssessmentType,
     DimensionComparisonResponse,
 )
-from app.core.matching import MatchingSystem
+from app.core.matching import get_matching_system
+from app.core.metrics import recommendation_snapshot_lookups
+from app.core.recommendations import (
+    compute_recommendations,
+    decode_job_handle,
+    get_completed_profiles,
+    match_inputs,
+    recommendation_jobs,
+)
+from app.core.cache import profile_cache
+from app.core.lifecycle import expire_overdue_jobs
+from app.core.scheduler import Priority, scheduler
+from app.core.webhook_queue import webhook_queue
 from app.schemas.assessment import (
     AssessmentResponse,
     QuestionResponse,
@@ -52,14 +111,9 @@ from app.schemas.assessment import (
 )
 
 from app.db.seed import seed_data
-import logging
 
 seed_router = APIRouter()
 
-# Set up logger
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
-
 
 @seed_router.post("/seed-data")
 async def load_seed_data(db: AsyncSession = Depends(get_db)):
@@ -68,101 +122,371 @@ async def load_seed_data(db: AsyncSession = Depends(get_db)):
     return {"message": "Seed data loaded successfully"}
 
 
+@seed_router.post("/jobs/expire")
+async def expire_jobs(db: AsyncSession = Depends(get_db)):
+    """Run the job expiry sweep now"""
+    expired = await expire_overdue_jobs(db)
+    return {"expired": expired}
+
+
+@seed_router.patch("/jobs/{job_id}/status")
+async def change_job_status(
+    job_id: UUID, status: JobStatus, db: AsyncSession = Depends(get_db)
+):
+    """Pause, reactivate or expire a job posting"""
+    job = await set_job_status(db, job_id, status)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return {"id": job.id, "status": job.status}
+
+
+@seed_router.patch("/jobs/{job_id}", response_model=JobPostingResponse)
+async def edit_job_posting(
+    job_id: UUID, changes: JobPostingUpdate, db: AsyncSession = Depends(get_db)
+):
+    """Edit a job posting; only recommendations it can affect are recomputed"""
+    job = await update_job_posting(db, job_id, changes.model_dump(exclude_unset=True))
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+
+@seed_router.patch("/companies/{company_id}", response_model=CompanyResponse)
+async def edit_company(
+    company_id: UUID, changes: CompanyUpdate, db: AsyncSession = Depends(get_db)
+):
+    """Edit a company; only recommendations its jobs can affect are recomputed"""
+    company = await update_company(
+        db, company_id, changes.model_dump(exclude_unset=True)
+    )
+    if not company:
+        raise HTTPException(status_code=404, detail="Company not found")
+    return {
+        column.name: getattr(company, column.name)
+        for column in Company.__table__.columns
+    }
+
+
+@seed_router.get("/cache-stats")
+async def get_cache_stats():
+    """Hit/miss/eviction counters of the in-process caches"""
+    return {"profile_cache": profile_cache.stats()}
+
+
+@seed_router.get("/scheduler")
+async def get_scheduler_stats():
+    """Queue depths, running jobs and periodic job status of the scheduler"""
+    return scheduler.stats()
+
+
+@seed_router.get("/webhook-queue")
+async def get_webhook_queue_stats(db: AsyncSession = Depends(get_db)):
+    """Backlog, lag and throughput of the webhook ingestion queue"""
+    return await webhook_queue.stats(db)
+
+
+@seed_router.post("/webhook-queue/dead/requeue")
+async def requeue_dead_webhooks(db: AsyncSession = Depends(get_db)):
+    """Retry every dead-lettered webhook submission"""
+    requeued = await requeue_dead_submissions(db)
+    webhook_queue.notify()
+    return {"requeued": requeued}
+
+
 router = APIRouter()
-matching_system = MatchingSystem()
 
 
-@router.get("/companies", response_model=List[CompanyResponse])
-async def get_all_companies(db: AsyncSession = Depends(get_db)):
-    """Get a list of all companies and their job postings"""
-    query = select(Company).options(selectinload(Company.jobs))
-    result = await db.execute(query)
-    companies = result.scalars().all()
+async def _with_jobs(
+    db: AsyncSession,
+    rows: List,
+    jobs: Literal["list", "count"],
+    jobs_limit: int,
+    include_profiles: bool,
+) -> List[Dict]:
+    """Turn company rows into dicts carrying their job list or job count"""
+    company_ids = [row.id for row in rows]
+    companies = [dict(row._mapping) for row in rows]
+
+    if jobs == "count":
+        counts = await get_active_job_counts(db, company_ids)
+        for company in companies:
+            company["job_count"] = counts.get(company["id"], 0)
+    else:
+        jobs_by_company = await get_latest_active_jobs(
+            db, company_ids, jobs_limit, include_profiles
+        )
+        for company in companies:
+            company["jobs"] = [
+                dict(job._mapping) for job in jobs_by_company.get(company["id"], [])
+            ]
+
     return companies
 
 
+async def _stream_companies(
+    after: Optional[UUID],
+    jobs: Literal["list", "count"],
+    jobs_limit: int,
+    include_profiles: bool,
+):
+    # One session holds the server-side cursor, the other looks up each
+    # batch's jobs while the cursor is open
+    session_factory = replica_router.session_factory()
+    async with session_factory() as db, session_factory() as jobs_db:
+        async for rows in stream_companies(db, after, include_profiles):
+            for company in await _with_jobs(
+                jobs_db, rows, jobs, jobs_limit, include_profiles
+            ):
+                # Same shape as the paged response, which FastAPI validates
+                yield CompanyResponse.model_validate(company).model_dump()
+
+
+@router.get("/companies", response_model=List[CompanyResponse])
+async def get_all_companies(
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=200),
+    jobs: Literal["list", "count"] = "list",
+    jobs_limit: int = Query(10, ge=1, le=100),
+    include_profiles: bool = False,
+    stream: Optional[Literal["ndjson"]] = None,
+    db: AsyncSession = Depends(get_read_db),
+):
+    """Get a page of companies with their newest active job postings
+
+    jobs="list" nests up to `jobs_limit` jobs per company; jobs="count" returns
+    only `job_count`. Profile and requirement JSON is left out unless
+    include_profiles=true. Pass the X-Next-Cursor response header back as
+    `cursor` to get the next page. With stream=ndjson every company after
+    `cursor` is streamed, one JSON object per line, and `limit` is ignored.
+    """
+    after = None
+    if cursor:
+        try:
+            after = UUID(decode_cursor(cursor, [str])[0])
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+    if stream == "ndjson":
+        return ndjson_response(
+            _stream_companies(after, jobs, jobs_limit, include_profiles)
+        )
+
+    rows = await get_companies_page(db, limit, after, include_profiles)
+    if len(rows) > limit:
+        rows = rows[:limit]
+        response.headers["X-Next-Cursor"] = encode_cursor([rows[-1].id])
+
+    companies = await _with_jobs(db, rows, jobs, jobs_limit, include_profiles)
+    return validated_response(company_list_adapter, companies, response.headers)
+
+
+@router.get("/jobs", response_model=List[JobPostingResponse])
+@query_budget(1)
+async def list_active_jobs(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=200),
+    db: AsyncSession = Depends(get_read_db),
+):
+    """Get active job postings"""
+    jobs = await get_active_jobs(db, skip, limit)
+    return validated_response(job_posting_list_adapter, jobs, from_attributes=True)
+
+
 @router.get(
     "/assessments/{assessment_type}/questions", response_model=List[QuestionResponse]
 )
-async def get_assessment_questions(assessment_type: AssessmentType):
-    """Get questions for specific assessment type"""
-    try:
-        questions = AssessmentDimensions.get_questions(assessment_type)
-        return [
-            QuestionResponse(
-                id=f"{assessment_type}_{idx}",
-                dimension=q["dimension"],
-                dimension_title=q["dimension_title"],
-                question_text=q["question"],
-                theory=q["theory"],
-            )
-            for idx, q in enumerate(questions)
-        ]
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
+async def get_assessment_questions(
+    assessment_type: AssessmentType,
+    accept_encoding: Optional[str] = Header(None),
+    if_none_match: Optional[str] = Header(None),
+):
+    """Get questions for specific assessment type
+
+    Served from bytes rendered at startup (gzipped when accepted), with
+    long-lived Cache-Control and an ETag for revalidation after deploys.
+    """
+    return question_catalog_response(assessment_type, accept_encoding, if_none_match)
 
 
 @router.post("/assessments/{assessment_type}/submit")
+@query_budget(6)
 async def submit_assessment(
+    request: Request,
     assessment_type: AssessmentType,
     answers: Dict[str, int],
     user_email: str,
+    defer: bool = False,
     db: AsyncSession = Depends(get_db),
 ):
-    """Submit assessment answers and get recommendations"""
-    # Get or create user
-    user = await get_or_create_user(db, user_email)
-
-    # Process answers and generate profile
-    profile = process_assessment_answers(assessment_type, answers)
+    """Submit assessment answers and get recommendations
 
-    # Update user profile
-    await update_user_assessment(db, user.id, assessment_type, profile)
+    With defer=true recommendations are computed in the background and the
+    response (202) carries a job to poll instead.
+    """
+    user, profiles = await _store_assessments(
+        db, user_email, {assessment_type: answers}
+    )
+    content = {
+        "profile": profiles[assessment_type],
+        "assessment_status": get_assessment_status(user),
+    }
+    if defer:
+        return _deferred_response(request, user, content)
 
     # Get recommendations based on completed assessments
-    recommendations = await get_user_recommendations(db, user.id)
+    content["recommendations"] = await get_user_recommendations(db, user.id)
+    return json_response(content)
 
-    return {
-        "profile": profile,
-        "recommendations": recommendations,
+
+@router.post("/assessments/submit")
+@query_budget(6)
+async def submit_assessments(
+    request: Request,
+    answers: Dict[AssessmentType, Dict[str, int]],
+    user_email: str,
+    defer: bool = False,
+    db: AsyncSession = Depends(get_db),
+):
+    """Submit answers for several assessments at once, e.g. at the end of onboarding
+
+    The body maps assessment type to its answers. All profiles are stored in
+    one transaction and recommendations are computed once, for the result
+    (or in the background with defer=true, as for a single assessment).
+    """
+    if not answers:
+        raise HTTPException(status_code=400, detail="No assessment answers given")
+
+    user, profiles = await _store_assessments(db, user_email, answers)
+    content = {
+        "profiles": {
+            assessment_type.value: profile
+            for assessment_type, profile in profiles.items()
+        },
         "assessment_status": get_assessment_status(user),
     }
+    if defer:
+        return _deferred_response(request, user, content)
+
+    content["recommendations"] = await get_user_recommendations(db, user.id)
+    return json_response(content)
+
+
+def _deferred_response(request: Request, user: User, content: Dict) -> Response:
+    """Schedule the user's recommendations and answer 202 with the job to poll"""
+    handle = recommendation_jobs.schedule(user.id, user.profile_version)
+    content["recommendations_job"] = {
+        "id": handle,
+        "status": "pending",
+        "poll_url": str(request.url_for("get_recommendation_job", handle=handle)),
+    }
+    response = json_response(content)
+    response.status_code = 202
+    response.headers["Location"] = content["recommendations_job"]["poll_url"]
+    return response
+
+
+async def _store_assessments(
+    db: AsyncSession,
+    user_email: str,
+    answers: Dict[AssessmentType, Dict[str, int]],
+) -> Tuple[User, Dict[AssessmentType, Dict]]:
+    """Score the answers and save the resulting profiles in one transaction"""
+    # Get or create user
+    user = await get_or_create_user(db, user_email)
+
+    # Process answers and generate profiles
+    profiles = {
+        assessment_type: process_assessment_answers(assessment_type, type_answers)
+        for assessment_type, type_answers in answers.items()
+    }
+
+    # Update user profiles
+    await update_user_assessments(db, user.id, profiles)
+    replica_router.mark_write(user_email)
+    return user, profiles
+
+
+def group_answers_by_assessment(
+    answers: Dict[str, int],
+) -> Dict[AssessmentType, Dict[str, int]]:
+    """Split answers keyed like "AUTONOMY_0" by the assessment of their dimension
+
+    Answers for unknown dimensions are dropped.
+    """
+    grouped = {}
+    for question_id, score in answers.items():
+        assessment_type = AssessmentDimensions.get_assessment_type(
+            question_id.split("_")[0]
+        )
+        if assessment_type is not None:
+            grouped.setdefault(assessment_type, {})[question_id] = score
+    return grouped
 
 
 @router.get("/users/{user_email}/assessment-status")
+@query_budget(1)
 async def get_user_assessment_status(
-    user_email: str, db: AsyncSession = Depends(get_db)
+    user_email: str,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """Get user's assessment completion status"""
-    user = await get_user_by_email(db, user_email)
+    user = await get_cached_user(db, user_email)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
+    etag = make_etag("assessment-status", user.id, user.profile_version)
+    not_modified = conditional_response(response, if_none_match, etag)
+    if not_modified:
+        return not_modified
+
     return get_assessment_status(user)
 
 
 @router.get("/users/{user_email}/profile", response_model=ProfileResponse)
-async def get_user_profile(user_email: str, db: AsyncSession = Depends(get_db)):
+@query_budget(1)
+async def get_user_profile(
+    user_email: str,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_read_db),
+):
     """Get user's complete profile with all assessment results"""
-    user = await get_user_by_email(db, user_email)
+    user = await get_cached_user(db, user_email)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
-    return ProfileResponse(
+    etag = make_etag("profile", user.id, user.profile_version)
+    not_modified = conditional_response(response, if_none_match, etag)
+    if not_modified:
+        return not_modified
+
+    profile = ProfileResponse(
         email=user.email,
         wellbeing_profile=user.wellbeing_profile,
         skills_profile=user.skills_profile,
         values_profile=user.values_profile,
         assessment_status=get_assessment_status(user),
     )
+    return model_response(profile_adapter, profile, response.headers)
 
 
 @router.get("/users/{user_email}/recommendations")
+@query_budget(4)
 async def get_user_recommendations_route(
-    user_email: str, db: AsyncSession = Depends(get_db)
+    user_email: str,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_read_db),
 ):
-    """Get job recommendations for user based on completed assessments"""
-    user = await get_user_by_email(db, user_email)
+    """Get job recommendations for user based on completed assessments
+
+    The ETag covers the user's profile version and the catalog version, so an
+    unchanged poll is answered with 304 before any job is scored.
+    """
+    user = await get_cached_user(db, user_email)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
@@ -171,8 +495,94 @@ async def get_user_recommendations_route(
             status_code=400, detail="Please complete at least one assessment first"
         )
 
+    catalog_version = await get_catalog_version(db)
+    etag = make_etag("recommendations", user.id, user.profile_version, catalog_version)
+    not_modified = conditional_response(response, if_none_match, etag)
+    if not_modified:
+        return not_modified
+
+    snapshot = await get_recommendation_snapshot(db, user.id)
+    if (
+        snapshot is not None
+        and snapshot.profile_version == user.profile_version
+        and snapshot.catalog_version == catalog_version
+    ):
+        recommendation_snapshot_lookups.inc(("hit",))
+        return json_response(snapshot.recommendations, response.headers)
+
+    recommendation_snapshot_lookups.inc(("miss",))
+    # Catalog propagation only advances snapshots of the previous version, so
+    # a missing or stale one is refreshed here or it stays stale for good
+    recommendation_jobs.schedule(user.id, user.profile_version, Priority.BATCH)
     recommendations = await get_user_recommendations(db, user.id)
-    return recommendations
+    return json_response(recommendations, response.headers)
+
+
+# Long polls re-check the snapshot table this often when the job runs in
+# another worker
+RECOMMENDATION_POLL_INTERVAL = 0.5
+
+
+async def _recommendation_job_state(user_id: UUID, profile_version: int) -> Dict:
+    """The job's state from the snapshot table, in a short-lived session"""
+    async with AsyncSessionLocal() as db:
+        snapshot = await get_recommendation_snapshot(db, user_id)
+        if snapshot is not None and snapshot.profile_version >= profile_version:
+            # A snapshot of a later profile answers earlier jobs too
+            return {
+                "status": "done",
+                "computed_at": snapshot.computed_at,
+                "recommendations": snapshot.recommendations,
+            }
+
+        failure = recommendation_jobs.failure(user_id, profile_version)
+        if failure is not None:
+            return {"status": "failed", "detail": failure}
+
+        if not recommendation_jobs.is_running(user_id, profile_version):
+            user = await db.get(User, user_id)
+            if user is None:
+                raise HTTPException(status_code=404, detail="User not found")
+            if user.profile_version < profile_version:
+                raise HTTPException(status_code=404, detail="Job not found")
+            # Started in another worker, or lost in a restart; snapshot writes
+            # never go backwards, so computing it again here is harmless
+            recommendation_jobs.schedule(user_id, profile_version)
+        return {"status": "pending"}
+
+
+@router.get("/recommendation-jobs/{handle}")
+async def get_recommendation_job(
+    handle: str,
+    wait: float = Query(0, ge=0, le=30, description="Seconds to long-poll"),
+):
+    """Poll a deferred recommendations job
+
+    Answers 202 while pending and 200 once done (or failed). With wait > 0
+    the request is held until the job finishes or wait seconds pass. Holds
+    no database connection while waiting.
+    """
+    try:
+        user_id, profile_version = decode_job_handle(handle)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid job handle")
+
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + wait
+    while True:
+        state = await _recommendation_job_state(user_id, profile_version)
+        remaining = deadline - loop.time()
+        if state["status"] != "pending" or remaining <= 0:
+            break
+        if recommendation_jobs.is_running(user_id, profile_version):
+            await recommendation_jobs.wait(user_id, profile_version, remaining)
+        else:
+            await asyncio.sleep(min(RECOMMENDATION_POLL_INTERVAL, remaining))
+
+    response = json_response({"id": handle, **state})
+    if state["status"] == "pending":
+        response.status_code = 202
+    return response
 
 
 # Helper functions
@@ -190,118 +600,15 @@ def has_any_assessment(user: "User") -> bool:
     return any([user.wellbeing_profile, user.skills_profile, user.values_profile])
 
 
-def get_completed_profiles(user: "User") -> Dict[str, Dict]:
-    """Get only completed assessment profiles"""
-    profiles = {}
-    if user.wellbeing_profile:
-        profiles["wellbeing_profile"] = user.wellbeing_profile
-    if user.skills_profile:
-        profiles["skills_profile"] = user.skills_profile
-    if user.values_profile:
-        profiles["values_profile"] = user.values_profile
-    return profiles
-
-
 async def get_user_recommendations(
     db: AsyncSession, user_id: UUID, limit: int = 10
 ) -> List[Dict]:
     """Get job recommendations based on completed assessments"""
-
-    # Get user
-    user = await db.get(User, user_id)
+    user = await get_cached_user_by_id(db, user_id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
-    # Get completed profiles and log them
-    completed_profiles = get_completed_profiles(user)
-
-    if not completed_profiles:
-        return []
-
-    # Get all active jobs with company information
-    query = select(JobPosting, Company).join(Company).limit(limit)
-    result = await db.execute(query)
-    jobs_with_companies = result.unique().all()
-
-    # Calculate matches based on completed assessments
-    job_matches = []
-    for job, company in jobs_with_companies:
-
-        # Prepare job requirements based on completed assessments
-        job_requirements = {}
-        if "skills_profile" in completed_profiles and job.skills_requirements:
-            try:
-                if isinstance(job.skills_requirements, str):
-                    skills_req = json.loads(job.skills_requirements)
-                else:
-                    skills_req = job.skills_requirements
-                job_requirements["skills_requirements"] = skills_req
-            except Exception as e:
-                logger.error(f"Error processing skills requirements: {e}")
-
-        if "wellbeing_profile" in completed_profiles and job.wellbeing_preferences:
-            try:
-                if isinstance(job.wellbeing_preferences, str):
-                    wellbeing_prefs = json.loads(job.wellbeing_preferences)
-                else:
-                    wellbeing_prefs = job.wellbeing_preferences
-                job_requirements["wellbeing_preferences"] = wellbeing_prefs
-            except Exception as e:
-                logger.error(f"Error processing wellbeing preferences: {e}")
-
-        if "values_profile" in completed_profiles and job.values_alignment:
-            try:
-                if isinstance(job.values_alignment, str):
-                    values_align = json.loads(job.values_alignment)
-                else:
-                    values_align = job.values_alignment
-                job_requirements["values_alignment"] = values_align
-            except Exception as e:
-                logger.error(f"Error processing values alignment: {e}")
-
-        # Prepare company profiles based on completed assessments
-        company_profiles = {}
-        if "wellbeing_profile" in completed_profiles and company.wellbeing_profile:
-            try:
-                if isinstance(company.wellbeing_profile, str):
-                    wellbeing_prof = json.loads(company.wellbeing_profile)
-                else:
-                    wellbeing_prof = company.wellbeing_profile
-                company_profiles["wellbeing_profile"] = wellbeing_prof
-            except Exception as e:
-                logger.error(f"Error processing company wellbeing profile: {e}")
-
-        if "values_profile" in completed_profiles and company.values_profile:
-            try:
-                if isinstance(company.values_profile, str):
-                    values_prof = json.loads(company.values_profile)
-                else:
-                    values_prof = company.values_profile
-                company_profiles["values_profile"] = values_prof
-            except Exception as e:
-                logger.error(f"Error processing company values profile: {e}")
-
-        # Calculate match score
-        match_score = matching_system.calculate_match(
-            completed_profiles, job_requirements, company_profiles
-        )
-
-        job_matches.append(
-            {
-                "job": {
-                    "id": job.id,
-                    "title": job.title,
-                    "company": company.name,
-                    "description": job.description,
-                },
-                "match_score": match_score,
-                "matched_dimensions": list(completed_profiles.keys()),
-            }
-        )
-
-    # Sort by match score and return top matches
-    job_matches.sort(key=lambda x: x["match_score"]["overall_match"], reverse=True)
-    return job_matches[:limit]
+    return await compute_recommendations(db, user, limit)
 
 
 def process_assessment_answers(
@@ -315,8 +622,6 @@ def process_assessment_answers(
     for dimension in dimensions:
         dimension_answers[dimension] = []
 
-    print(answers)
-
     for question_id, score in answers.items():
         # Extract dimension from question_id
         dimension = question_id.split("_")[0]
@@ -346,13 +651,15 @@ async def create_user(user_data: UserCreate, db: AsyncSession = Depends(get_db))
         return existing_user
 
     user = await get_or_create_user(db, user_data.email, user_data.name)
+    replica_router.mark_write(user_data.email)
     return user
 
 
 @router.get("/users/{user_email}", response_model=UserResponse)
-async def get_user(user_email: str, db: AsyncSession = Depends(get_db)):
+@query_budget(1)
+async def get_user(user_email: str, db: AsyncSession = Depends(get_read_db)):
     """Get user details"""
-    user = await get_user_by_email(db, user_email)
+    user = await get_cached_user(db, user_email)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     return user
@@ -360,11 +667,12 @@ async def get_user(user_email: str, db: AsyncSession = Depends(get_db)):
 
 # Matching Routes
 @router.get("/jobs/{job_id}/match/{user_email}")
+@query_budget(2)
 async def get_job_match(
-    job_id: UUID, user_email: str, db: AsyncSession = Depends(get_db)
+    job_id: UUID, user_email: str, db: AsyncSession = Depends(get_read_db)
 ):
     """Get detailed match information for a specific job"""
-    user = await get_user_by_email(db, user_email)
+    user = await get_cached_user(db, user_email)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
@@ -372,7 +680,8 @@ async def get_job_match(
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
 
-    company = await get_company_by_id(db, job.company_id)
+    # get_job_posting already loaded the company
+    company = job.company
 
     # Get completed profiles
     completed_profiles = get_completed_profiles(user)
@@ -382,18 +691,7 @@ async def get_job_match(
         )
 
     # Calculate match
-    match_score = matching_system.calculate_match(
-        completed_profiles,
-        {
-            "skills_requirements": job.skills_requirements,
-            "wellbeing_preferences": job.wellbeing_preferences,
-            "values_alignment": job.values_alignment,
-        },
-        {
-            "wellbeing_profile": company.wellbeing_profile,
-            "values_profile": company.values_profile,
-        },
-    )
+    match_score = _score_job(completed_profiles, job, company)
 
     return {
         "job": {
@@ -407,51 +705,116 @@ async def get_job_match(
     }
 
 
+@router.post("/match/batch", response_model=BatchMatchResponse)
+@query_budget(2)
+async def batch_match(
+    request: BatchMatchRequest, db: AsyncSession = Depends(get_read_db)
+):
+    """Score many (user, job) pairs in one request
+
+    Users and jobs are loaded with one IN query each, and each user's jobs are
+    scored as one batch. Results come back in request order; a pair that can't
+    be scored carries an `error` instead of scores.
+    """
+    pairs = request.pairs
+    users = await get_cached_users(db, [pair.user_email for pair in pairs])
+    jobs = await get_jobs_with_companies(db, [pair.job_id for pair in pairs])
+
+    # Distinct jobs per user (dict keys keep request order)
+    jobs_by_user: Dict[str, Dict[UUID, None]] = {}
+    for pair in pairs:
+        if pair.user_email in users and pair.job_id in jobs:
+            jobs_by_user.setdefault(pair.user_email, {})[pair.job_id] = None
+
+    # Each job is prepared for scoring once, whichever users it's paired with
+    matching_system = get_matching_system()
+    companies = {}
+    prepared = dict(
+        zip(
+            jobs.keys(),
+            matching_system.prepare_jobs(
+                [match_inputs(*job, companies) for job in jobs.values()]
+            ),
+        )
+    )
+
+    scores = {}
+    matched_dimensions = {}
+    for email, job_ids in jobs_by_user.items():
+        completed_profiles = get_completed_profiles(users[email])
+        if not completed_profiles:
+            continue
+        matched_dimensions[email] = list(completed_profiles.keys())
+        job_scores = matching_system.score_prepared(
+            completed_profiles, [prepared[job_id] for job_id in job_ids]
+        )
+        for job_id, match_score in zip(job_ids, job_scores):
+            scores[(email, job_id)] = match_score
+
+    results = []
+    for pair in pairs:
+        result = {"user_email": pair.user_email, "job_id": pair.job_id}
+        match_score = scores.get((pair.user_email, pair.job_id))
+        if pair.user_email not in users:
+            result["error"] = "User not found"
+        elif pair.job_id not in jobs:
+            result["error"] = "Job not found"
+        elif match_score is None:
+            result["error"] = "Please complete at least one assessment first"
+        else:
+            result["match_score"] = match_score
+            result["matched_dimensions"] = matched_dimensions[pair.user_email]
+        results.append(result)
+
+    return json_response({"results": results})
+
+
 # Job Application Routes
 @router.post("/jobs/{job_id}/apply")
+@query_budget(3)
 async def apply_to_job(
     job_id: UUID,
     user_email: str,
+    idempotency_key: Optional[str] = Header(None),
     db: AsyncSession = Depends(get_db),
 ):
-    user = await get_user_by_email(db, user_email)
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-
-    job = await get_job_posting(db, job_id)
-    if not job:
+    # User, job and company in one round trip
+    context = await get_application_context(db, user_email, job_id)
+    if not context:
+        if not await get_user_by_email(db, user_email):
+            raise HTTPException(status_code=404, detail="User not found")
         raise HTTPException(status_code=404, detail="Job not found")
 
-    # Check if already applied
-    existing_application = await get_application(db, user.id, job_id)
-    if existing_application:
-        raise HTTPException(status_code=400, detail="Already applied to this job")
+    user, job, company = context
+    if job.status != JobStatus.ACTIVE.value:
+        raise HTTPException(status_code=400, detail="Job is not accepting applications")
 
     # Calculate match score
     completed_profiles = get_completed_profiles(user)
-    company = await get_company_by_id(db, job.company_id)
+    match_score = _score_job(completed_profiles, job, company)
 
-    match_score = matching_system.calculate_match(
-        completed_profiles,
-        {
-            "skills_requirements": job.skills_requirements,
-            "wellbeing_preferences": job.wellbeing_preferences,
-            "values_alignment": job.values_alignment,
-        },
-        {
-            "wellbeing_profile": company.wellbeing_profile,
-            "values_profile": company.values_profile,
-        },
-    )
-
-    # Create application
-    application = await create_job_application(
+    # Create application; the unique (user_id, job_id) constraint decides races
+    application, created = await create_job_application(
         db,
         user_id=user.id,
         job_id=job_id,
         match_scores=match_score,
+        idempotency_key=idempotency_key,
     )
 
+    replica_router.mark_write(user_email)
+
+    if not created:
+        # A retry carrying the same Idempotency-Key replays the original result
+        if idempotency_key is None or application.idempotency_key != idempotency_key:
+            raise HTTPException(status_code=400, detail="Already applied to this job")
+        match_score = {
+            "skills_match": application.skills_match,
+            "wellbeing_match": application.wellbeing_match,
+            "values_match": application.values_match,
+            "overall_match": application.overall_match,
+        }
+
     return {
         "application_id": application.id,
         "match_score": match_score,
@@ -460,13 +823,14 @@ async def apply_to_job(
 
 
 @router.get("/users/{user_email}/applications")
+@query_budget(2)
 async def get_user_applications(user_email: str, db: AsyncSession = Depends(get_db)):
     """Get all applications for a user"""
     user = await get_user_by_email(db, user_email)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
-    applications = await get_user_applications(db, user.id)
+    applications = await get_applications_by_user(db, user.id)
 
     return [
         {
@@ -477,7 +841,12 @@ async def get_user_applications(user_email: str, db: AsyncSession = Depends(get_
                 "company": app.job.company.name,
             },
             "status": app.status,
-            "match_score": app.match_scores,
+            "match_score": {
+                "skills_match": app.skills_match,
+                "wellbeing_match": app.wellbeing_match,
+                "values_match": app.values_match,
+                "overall_match": app.overall_match,
+            },
             "created_at": app.created_at,
         }
         for app in applications
@@ -485,36 +854,133 @@ async def get_user_applications(user_email: str, db: AsyncSession = Depends(get_
 
 
 # Company View Routes (if needed)
+def _applicant_dict(row) -> Dict:
+    """Format a projected applicant row for the API"""
+    return {
+        "id": row.id,
+        "applicant": {"email": row.email, "name": row.name},
+        "skills_match": row.skills_match,
+        "wellbeing_match": row.wellbeing_match,
+        "values_match": row.values_match,
+        "overall_match": row.overall_match,
+        "status": row.status,
+        "created_at": row.created_at,
+    }
+
+
+def _applicants_page(rows: List, limit: int) -> Dict:
+    """Trim the look-ahead row and build the cursor for the next page"""
+    page = rows[:limit]
+    next_cursor = None
+    if len(rows) > limit:
+        next_cursor = encode_cursor([page[-1].overall_match, page[-1].id])
+    return {
+        "applications": [_applicant_dict(row) for row in page],
+        "next_cursor": next_cursor,
+    }
+
+
+async def _stream_company_applications(company_id: UUID):
+    # The stream outlives the request's dependencies, so it owns its session
+    async with AsyncSessionLocal() as db:
+        async for row in stream_applications_by_company(db, company_id):
+            yield {
+                "job": {"id": row.job_id, "title": row.job_title},
+                **_applicant_dict(row),
+            }
+
+
 @router.get("/companies/{company_id}/applications")
+@query_budget(1)
 async def get_company_applications(
-    company_id: UUID, db: AsyncSession = Depends(get_db)
+    company_id: UUID,
+    limit: int = Query(50, ge=1, le=500),
+    stream: Optional[Literal["ndjson"]] = None,
+    db: AsyncSession = Depends(get_db),
 ):
-    """Get all applications for a company's jobs"""
-    applications = await get_applications_by_company(db, company_id)
-
-    # Group by job and sort by match score
-    jobs_applications = {}
-    for app in applications:
-        if app.job.id not in jobs_applications:
-            jobs_applications[app.job.id] = {
-                "job": {"id": app.job.id, "title": app.job.title},
-                "applications": [],
-            }
+    """Get applications for a company's jobs, grouped by job and sorted by match
 
-        jobs_applications[app.job.id]["applications"].append(
-            {
-                "id": app.id,
-                "applicant": {"email": app.user.email, "name": app.user.name},
-                "skills_match": app.skills_match,
-                "wellbeing_match": app.wellbeing_match,
-                "values_match": app.values_match,
-                "overall_match": app.overall_match,
-                "status": app.status,
-                "created_at": app.created_at,
+    Returns the first `limit` applicants per job plus a `next_cursor` for
+    /companies/{company_id}/jobs/{job_id}/applications. With stream=ndjson
+    every applicant is streamed, one JSON object per line.
+    """
+    if stream == "ndjson":
+        return ndjson_response(_stream_company_applications(company_id))
+
+    rows = await get_applications_by_company(db, company_id, limit)
+
+    # Rows arrive grouped by job and ranked, so grouping is a single pass
+    jobs_rows = {}
+    for row in rows:
+        jobs_rows.setdefault((row.job_id, row.job_title), []).append(row)
+
+    return json_response(
+        {
+            str(job_id): {
+                "job": {"id": job_id, "title": title},
+                **_applicants_page(job_rows, limit),
             }
-        )
+            for (job_id, title), job_rows in jobs_rows.items()
+        }
+    )
+
+
+@router.get("/companies/{company_id}/jobs/{job_id}/applications")
+@query_budget(1)
+async def get_company_job_applications(
+    company_id: UUID,
+    job_id: UUID,
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=500),
+    db: AsyncSession = Depends(get_db),
+):
+    """Get one page of a job's applicants, sorted by match"""
+    after = None
+    if cursor:
+        try:
+            overall_match, application_id = decode_cursor(
+                cursor, [(int, float, type(None)), str]
+            )
+            after = (overall_match, UUID(application_id))
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
 
-    return jobs_applications
+    rows = await get_job_applicants_page(db, company_id, job_id, limit, after)
+    return json_response(_applicants_page(rows, limit))
+
+
+@router.patch("/applications/{application_id}/status")
+async def change_application_status(
+    application_id: UUID,
+    status: ApplicationStatus,
+    db: AsyncSession = Depends(get_db),
+):
+    """Change an application's status (e.g. pending -> interview)"""
+    application = await update_application_status(db, application_id, status.value)
+    if not application:
+        raise HTTPException(status_code=404, detail="Application not found")
+
+    return {
+        "id": application.id,
+        "job_id": application.job_id,
+        "status": application.status,
+    }
+
+
+@router.get("/jobs/{job_id}/application-stats")
+@query_budget(1)
+async def get_job_application_stats(job_id: UUID, db: AsyncSession = Depends(get_db)):
+    """Get application statistics for a job"""
+    return await get_application_stats(db, job_id)
+
+
+@router.get("/companies/{company_id}/application-stats")
+@query_budget(1)
+async def get_company_application_stats(
+    company_id: UUID, db: AsyncSession = Depends(get_db)
+):
+    """Get application statistics for every job of a company"""
+    return await get_application_stats_by_company(db, company_id)
 
 
 # app/api/routes.py
@@ -525,12 +991,108 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 
+def _score_job(completed_profiles: Dict, job: JobPosting, company: Company) -> Dict:
+    """Score one job posting (and its company) against a user's profiles"""
+    return get_matching_system().calculate_match(
+        completed_profiles, *match_inputs(job, company)
+    )
+
+
+def _score_jobs(
+    completed_profiles: Dict, jobs_with_companies: List[Tuple[JobPosting, Company]]
+) -> List[Dict]:
+    """Score (job, company) pairs against a user's profiles as one batch"""
+    companies = {}
+    return get_matching_system().score_jobs(
+        completed_profiles,
+        [match_inputs(job, company, companies) for job, company in jobs_with_companies],
+    )
+
+
+async def _scored_job_batches(completed_profiles: Dict, user_email: str):
+    """Score the active catalog one cursor batch at a time
+
+    Yields lists of (job, company, match_score), newest jobs first. Used by
+    the streaming endpoints, so only one batch is held in memory.
+    """
+    async with replica_router.session_factory(user_email)() as db:
+        async for batch in stream_active_jobs_with_companies(db):
+            scores = _score_jobs(completed_profiles, batch)
+            yield [
+                (job, company, match_score)
+                for (job, company), match_score in zip(batch, scores)
+            ]
+
+
+def _insight_match(job: JobPosting, company: Company, match_score: Dict) -> Dict:
+    return {
+        "match_score": match_score,
+        "job_type": job.title,
+        "company": company.name,
+        "job": {
+            "id": job.id,
+            "title": job.title,
+            "company": company.name,
+            "description": job.description,
+        },
+    }
+
+
+def _overall_match(match: Dict) -> float:
+    return match["match_score"]["overall_match"]
+
+
+def _insights_summary(
+    completed_profiles: Dict, best_matches: List[Dict], distribution: Dict, total: int
+) -> Dict:
+    return {
+        "best_matches": best_matches,
+        "completed_assessments": list(completed_profiles.keys()),
+        "strongest_dimensions": get_strongest_dimensions(completed_profiles),
+        "improvement_areas": get_improvement_areas(completed_profiles),
+        "total_matches": total,
+        "match_distribution": distribution,
+    }
+
+
+async def _stream_matching_insights(completed_profiles: Dict, user_email: str):
+    best_matches = []
+    band_counts = dict.fromkeys(MATCH_BANDS, 0)
+    total = 0
+
+    async for batch in _scored_job_batches(completed_profiles, user_email):
+        matches = [_insight_match(*scored) for scored in batch]
+        for match in matches:
+            band_counts[match_band(_overall_match(match))] += 1
+            yield {"type": "match", **match}
+
+        total += len(matches)
+        best_matches = heapq.nlargest(3, best_matches + matches, key=_overall_match)
+
+    yield {
+        "type": "summary",
+        **_insights_summary(
+            completed_profiles,
+            best_matches,
+            _as_percentages(band_counts, total),
+            total,
+        ),
+    }
+
+
 @router.get("/users/{user_email}/matching-insights")
+@query_budget(2)
 async def get_user_matching_insights(
-    user_email: str, db: AsyncSession = Depends(get_db)
+    user_email: str,
+    stream: Optional[Literal["ndjson"]] = None,
+    db: AsyncSession = Depends(get_read_db),
 ):
-    """Get detailed matching insights for a user"""
-    user = await get_user_by_email(db, user_email)
+    """Get detailed matching insights for a user
+
+    With stream=ndjson every scored job is streamed as a {"type": "match"} line
+    in catalog order, followed by one {"type": "summary"} line with the insights.
+    """
+    user = await get_cached_user(db, user_email)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
@@ -540,91 +1102,75 @@ async def get_user_matching_insights(
             status_code=400, detail="Please complete at least one assessment first"
         )
 
+    if stream == "ndjson":
+        return ndjson_response(
+            _stream_matching_insights(completed_profiles, user_email)
+        )
+
     # Get all jobs with companies in a single query
     query = (
-        select(JobPosting, Company).join(Company).order_by(JobPosting.created_at.desc())
+        select(JobPosting, Company)
+        .join(Company)
+        .where(JobPosting.status == JobStatus.ACTIVE.value)
+        .order_by(JobPosting.created_at.desc())
     )
 
     result = await db.execute(query)
     jobs_with_companies = result.unique().all()
 
     # Calculate matches
-    matches = []
-    for job, company in jobs_with_companies:
-        match_score = matching_system.calculate_match(
-            completed_profiles,
-            {
-                "skills_requirements": job.skills_requirements,
-                "wellbeing_preferences": job.wellbeing_preferences,
-                "values_alignment": job.values_alignment,
-            },
-            {
-                "wellbeing_profile": company.wellbeing_profile,
-                "values_profile": company.values_profile,
-            },
-        )
-        matches.append(
-            {
-                "match_score": match_score,
-                "job_type": job.title,
-                "company": company.name,
-                "job": {
-                    "id": job.id,
-                    "title": job.title,
-                    "company": company.name,
-                    "description": job.description,
-                },
-            }
-        )
+    scores = _score_jobs(completed_profiles, jobs_with_companies)
+    matches = [
+        _insight_match(job, company, match_score)
+        for (job, company), match_score in zip(jobs_with_companies, scores)
+    ]
 
     # Sort matches by overall match score
-    sorted_matches = sorted(
-        matches, key=lambda x: x["match_score"]["overall_match"], reverse=True
-    )
+    sorted_matches = sorted(matches, key=_overall_match, reverse=True)
 
     # Calculate insights
-    insights = {
-        "best_matches": sorted_matches[:3],
-        "completed_assessments": list(completed_profiles.keys()),
-        "strongest_dimensions": get_strongest_dimensions(completed_profiles),
-        "improvement_areas": get_improvement_areas(completed_profiles),
-        "total_matches": len(matches),
-        "match_distribution": calculate_match_distribution(matches),
-    }
+    return json_response(
+        _insights_summary(
+            completed_profiles,
+            sorted_matches[:3],
+            calculate_match_distribution(matches),
+            len(matches),
+        )
+    )
 
-    return insights
 
+MATCH_BANDS = ("excellent", "very_good", "good", "fair", "poor")
 
-def calculate_match_distribution(matches: List[Dict]) -> Dict:
-    """Calculate distribution of match scores in ranges"""
-    ranges = {
-        "excellent": 0,  # 90-100%
-        "very_good": 0,  # 80-89%
-        "good": 0,  # 70-79%
-        "fair": 0,  # 60-69%
-        "poor": 0,  # <60%
+
+def match_band(score: float) -> str:
+    """Name the distribution range an overall match score falls in"""
+    if score >= 0.9:
+        return "excellent"  # 90-100%
+    if score >= 0.8:
+        return "very_good"  # 80-89%
+    if score >= 0.7:
+        return "good"  # 70-79%
+    if score >= 0.6:
+        return "fair"  # 60-69%
+    return "poor"  # <60%
+
+
+def _as_percentages(band_counts: Dict, total: int) -> Dict:
+    if total == 0:
+        return band_counts
+    return {
+        band: round((count / total) * 100, 1) for band, count in band_counts.items()
     }
 
+
+def calculate_match_distribution(matches: List[Dict]) -> Dict:
+    """Calculate distribution of match scores in ranges"""
+    band_counts = dict.fromkeys(MATCH_BANDS, 0)
     for match in matches:
-        score = match["match_score"]["overall_match"]
-        if score >= 0.9:
-            ranges["excellent"] += 1
-        elif score >= 0.8:
-            ranges["very_good"] += 1
-        elif score >= 0.7:
-            ranges["good"] += 1
-        elif score >= 0.6:
-            ranges["fair"] += 1
-        else:
-            ranges["poor"] += 1
+        band_counts[match_band(_overall_match(match))] += 1
 
     # Convert to percentages
-    total = len(matches)
-    if total > 0:
-        for key in ranges:
-            ranges[key] = round((ranges[key] / total) * 100, 1)
-
-    return ranges
+    return _as_percentages(band_counts, len(matches))
 
 
 def get_strongest_dimensions(profiles: Dict) -> List[Dict]:
@@ -667,13 +1213,47 @@ def get_improvement_areas(profiles: Dict) -> List[Dict]:
     return sorted(improvement_areas, key=lambda x: x["score"])[:5]
 
 
+def _table_row(
+    job: JobPosting, company: Company, match_score: Dict
+) -> TableRowResponse:
+    # Format data for table using existing data and placeholders
+    return TableRowResponse(
+        company_name=company.name,
+        company_location=company.industry or "Location TBD",
+        company_logo_url="/api/placeholder/40/40",
+        job_title=job.title,
+        apply_link=str(job.id),
+        compatibility_score=match_score.get("overall_match", 0) * 100,
+        wellbeing_score=match_score.get("wellbeing_match", 0) * 100,
+        application_deadline="1.5.2025",
+    )
+
+
+async def _stream_job_table(completed_profiles: Dict, user_email: str):
+    total = 0
+    async for batch in _scored_job_batches(completed_profiles, user_email):
+        for scored in batch:
+            yield {"type": "row", **_table_row(*scored).model_dump()}
+        total += len(batch)
+    yield {"type": "summary", "total": total}
+
+
 @router.get("/users/{user_email}/job-table", response_model=TableDataResponse)
+@query_budget(2)
 async def get_job_table_data(
-    user_email: str, db: AsyncSession = Depends(get_db), limit: int = 10
+    user_email: str,
+    db: AsyncSession = Depends(get_read_db),
+    limit: int = 10,
+    stream: Optional[Literal["ndjson"]] = None,
 ):
-    """Get job recommendations in a table format"""
+    """Get job recommendations in a table format
+
+    With stream=ndjson every row is streamed as a {"type": "row"} line in
+    catalog order (unsorted, `limit` is ignored), followed by a
+    {"type": "summary", "total": n} line.
+    """
     # Get user and check if exists
-    user = await get_user_by_email(db, user_email)
+    user = await get_cached_user(db, user_email)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
@@ -684,48 +1264,34 @@ async def get_job_table_data(
             status_code=400, detail="Please complete at least one assessment first"
         )
 
+    if stream == "ndjson":
+        return ndjson_response(_stream_job_table(completed_profiles, user_email))
+
     # Get all jobs with companies in a single query
     query = (
-        select(JobPosting, Company).join(Company).order_by(JobPosting.created_at.desc())
+        select(JobPosting, Company)
+        .join(Company)
+        .where(JobPosting.status == JobStatus.ACTIVE.value)
+        .order_by(JobPosting.created_at.desc())
     )
 
     result = await db.execute(query)
     jobs_with_companies = result.unique().all()
 
     # Calculate matches and format for table
-    table_rows = []
-    for job, company in jobs_with_companies:
-        # Calculate match scores
-        match_score = matching_system.calculate_match(
-            completed_profiles,
-            {
-                "skills_requirements": job.skills_requirements,
-                "wellbeing_preferences": job.wellbeing_preferences,
-                "values_alignment": job.values_alignment,
-            },
-            {
-                "wellbeing_profile": company.wellbeing_profile,
-                "values_profile": company.values_profile,
-            },
-        )
-
-        # Format data for table using existing data and placeholders
-        table_row = TableRowResponse(
-            company_name=company.name,
-            company_location=company.industry or "Location TBD",
-            company_logo_url="/api/placeholder/40/40",
-            job_title=job.title,
-            apply_link=str(job.id),
-            compatibility_score=match_score.get("overall_match", 0) * 100,
-            wellbeing_score=match_score.get("wellbeing_match", 0) * 100,
-            application_deadline="1.5.2025",
-        )
-        table_rows.append(table_row)
+    scores = _score_jobs(completed_profiles, jobs_with_companies)
+    table_rows = [
+        _table_row(job, company, match_score)
+        for (job, company), match_score in zip(jobs_with_companies, scores)
+    ]
 
     # Sort by compatibility score
     table_rows.sort(key=lambda x: x.compatibility_score, reverse=True)
 
-    return TableDataResponse(jobs=table_rows[:limit], total=len(table_rows))
+    return model_response(
+        table_data_adapter,
+        TableDataResponse(jobs=table_rows[:limit], total=len(table_rows)),
+    )
 
 
 @router.get(
@@ -736,11 +1302,11 @@ async def get_dimension_comparison(
     user_email: str,
     job_id: UUID,
     dimension_type: str,  # 'wellbeing', 'skills', or 'values'
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """Get dimension-by-dimension comparison between user and job+company"""
     # Get user
-    user = await get_user_by_email(db, user_email)
+    user = await get_cached_user(db, user_email)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
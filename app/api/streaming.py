@@ -0,0 +1,19 @@
+# app/api/streaming.py
+from typing import AsyncIterator, Dict
+
+import orjson
+from fastapi.responses import StreamingResponse
+
+from app.api.responses import dumps
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+async def _encode_lines(rows: AsyncIterator[Dict]) -> AsyncIterator[bytes]:
+    async for row in rows:
+        yield dumps(row, orjson.OPT_APPEND_NEWLINE)
+
+
+def ndjson_response(rows: AsyncIterator[Dict]) -> StreamingResponse:
+    """Stream dict rows as newline-delimited JSON, one object per line"""
+    return StreamingResponse(_encode_lines(rows), media_type=NDJSON_MEDIA_TYPE)
@@ -1,39 +1,94 @@
 # app/api/webhooks.py
 from fastapi import APIRouter, HTTPException, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import Dict
+from typing import Dict, List, Tuple
+import logging
 from app.core.dimensions import AssessmentType
+from app.core.recommendations import recommendation_jobs
+from app.core.webhook_queue import PermanentSubmissionError, webhook_queue
 from app.db.database import get_db
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
 
 
-@router.post("/webhooks/assessment/{assessment_type}")
+def _parse_payload(payload: Dict) -> Tuple[str, Dict[str, int]]:
+    """Split a Framer payload into the email (Name field) and integer answers"""
+    # Extract email from Name field
+    email = payload.pop("Name", None)
+    if not email:
+        raise HTTPException(status_code=400, detail="Email is required in Name field")
+
+    # Convert string values to integers
+    try:
+        answers = {key: int(value) for key, value in payload.items()}
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid numeric value: {str(e)}")
+    return email, answers
+
+
+async def _enqueue(
+    db: AsyncSession, email: str, answers: Dict[AssessmentType, Dict[str, int]]
+) -> Dict:
+    submission_id, stored = await webhook_queue.enqueue(
+        db,
+        email,
+        {assessment_type.value: value for assessment_type, value in answers.items()},
+    )
+    return {"id": submission_id, "status": "queued" if stored else "duplicate"}
+
+
+@router.post("/webhooks/assessment/{assessment_type}", status_code=202)
 async def assessment_webhook(
     assessment_type: AssessmentType, payload: Dict, db: AsyncSession = Depends(get_db)
 ):
-    """Handle assessment form submissions from Framer"""
-    try:
-        # Extract email from Name field
-        email = payload.pop("Name", None)
-        if not email:
-            raise HTTPException(
-                status_code=400, detail="Email is required in Name field"
-            )
-
-        # Convert string values to integers
-        answers = {key: int(value) for key, value in payload.items()}
-        print("Received answers:", answers)
-        # Import and use the existing submit_assessment function
-        from app.api.routes import submit_assessment
+    """Handle assessment form submissions from Framer
 
-        # Use the existing function directly with the assessment_type from URL
-        return await submit_assessment(
-            assessment_type=assessment_type, answers=answers, user_email=email, db=db
-        )
+    The submission is stored and acknowledged; the webhook queue workers
+    score it and compute recommendations. Resending the same payload within
+    the dedup window is acknowledged without storing it again.
+    """
+    email, answers = _parse_payload(payload)
+    logger.debug("Received %d %s answers", len(answers), assessment_type.value)
+    return await _enqueue(db, email, {assessment_type: answers})
 
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=f"Invalid numeric value: {str(e)}")
-    except Exception as e:
-        print("Error:", e)
-        raise HTTPException(status_code=500, detail=str(e))
+
+@router.post("/webhooks/assessment", status_code=202)
+async def combined_assessment_webhook(
+    payload: Dict, db: AsyncSession = Depends(get_db)
+):
+    """Handle a Framer form that collects several assessments at once
+
+    Each answer's assessment is inferred from its question id's dimension
+    prefix (e.g. "AUTONOMY_0" is wellbeing). Queued like a single assessment.
+    """
+    from app.api.routes import group_answers_by_assessment
+
+    email, answers = _parse_payload(payload)
+    grouped = group_answers_by_assessment(answers)
+    if not grouped:
+        raise HTTPException(status_code=400, detail="No known assessment answers")
+
+    return await _enqueue(db, email, grouped)
+
+
+async def process_webhook_submission(db: AsyncSession, submissions: List) -> None:
+    """Webhook queue handler: store the profiles, defer the recommendations
+
+    A submitter's queued submissions are merged, later answers to an
+    assessment replacing earlier ones, and stored as one submit.
+    """
+    from app.api.routes import _store_assessments
+
+    answers = {}
+    for submission in submissions:
+        for assessment_type, value in submission.answers.items():
+            answers[AssessmentType(assessment_type)] = value
+    try:
+        user, _ = await _store_assessments(db, submissions[0].email, answers)
+    except HTTPException as e:
+        if e.status_code < 500:
+            raise PermanentSubmissionError(e.detail) from e
+        raise
+    # Nobody polls for these; the snapshot is read on the user's next visit
+    recommendation_jobs.schedule(user.id, user.profile_version)
@@ -1,11 +1,68 @@
 from pydantic_settings import BaseSettings
 from functools import lru_cache
+from typing import Dict, List
 
 
 class Settings(BaseSettings):
     PROJECT_NAME: str = "RECRUITING2.0"
     DATABASE_URL: str
 
+    # Read replicas (JSON list in env); empty means all reads go to the primary
+    DATABASE_REPLICA_URLS: List[str] = []
+    REPLICA_HEALTH_CHECK_INTERVAL: float = 10.0  # seconds
+    READ_YOUR_WRITES_WINDOW: float = 5.0  # seconds a writer reads from primary
+
+    # In-process user profile cache (entries are keyed by email and by id)
+    PROFILE_CACHE_SIZE: int = 10_000
+    PROFILE_CACHE_TTL: float = 30.0  # seconds
+
+    JOB_EXPIRY_SWEEP_INTERVAL: float = 3600.0  # seconds
+
+    # How long each process trusts its copy of the catalog version (ETags)
+    CATALOG_VERSION_TTL: float = 1.0  # seconds
+
+    # Logging: JSON ("json") or plain ("text") records, written by a
+    # background thread to stderr and LOG_DIR/app.log, rotated by size
+    LOG_LEVEL: str = "INFO"
+    LOG_LEVELS: Dict[str, str] = {}  # per logger (JSON in env), e.g. app.db: DEBUG
+    LOG_FORMAT: str = "json"
+    LOG_DIR: str = "logs"
+    LOG_MAX_BYTES: int = 10_000_000
+    LOG_BACKUP_COUNT: int = 5
+    LOG_QUEUE_SIZE: int = 10_000  # records beyond this are dropped, not awaited
+
+    # Query instrumentation: statements slower than this are logged (without
+    # parameter values); one repeated this often in a request is flagged N+1
+    SLOW_QUERY_THRESHOLD: float = 0.5  # seconds
+    N_PLUS_ONE_THRESHOLD: int = 5
+
+    # Request profiler (off unless enabled; nothing is installed otherwise).
+    # Requests with an X-Profile header signed with PROFILER_SECRET, and a
+    # PROFILER_SAMPLE_RATE fraction of all requests, are run under cProfile
+    PROFILER_ENABLED: bool = False
+    PROFILER_SECRET: str = ""  # also the X-Profiler-Token of /admin/profiles
+    PROFILER_SAMPLE_RATE: float = 0.0
+    PROFILER_DIR: str = "profiles"
+    PROFILER_MAX_PROFILES: int = 50  # oldest profiles are deleted beyond this
+
+    # Match scoring policy: "dense" scores every dimension the user has against
+    # job and company, "sparse" only the dimensions they define
+    MATCH_SCORING: str = "dense"
+
+    # Background scheduler queue for deferred recommendation jobs
+    RECOMMENDATION_WORKERS: int = 4
+    RECOMMENDATION_QUEUE_SIZE: int = 1000  # deferred submits beyond this wait
+
+    # Webhook ingestion queue: workers drain webhook_submissions in batches
+    WEBHOOK_WORKERS: int = 2
+    WEBHOOK_BATCH_SIZE: int = 50
+    WEBHOOK_POLL_INTERVAL: float = 1.0  # seconds between polls when idle
+    WEBHOOK_LEASE: float = 60.0  # seconds a claimed batch may take
+    WEBHOOK_MAX_ATTEMPTS: int = 5  # then the submission is dead-lettered
+    WEBHOOK_RETRY_BACKOFF: float = 2.0  # seconds, doubled on every attempt
+    WEBHOOK_DEDUP_WINDOW: float = 300.0  # seconds identical payloads are no-ops
+    WEBHOOK_COALESCE_DELAY: float = 2.0  # seconds a submission waits for others
+
     class Config:
         env_file = ".env"
 
@@ -0,0 +1,149 @@
+# app/core/cache.py
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Hashable, Optional
+from uuid import UUID
+import time
+
+from app.config import get_settings
+from app.core.metrics import registry
+
+
+class TTLCache:
+    """Bounded LRU cache whose entries expire ttl seconds after being set"""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Get a live value (refreshing its LRU position) or None"""
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        value, expires_at = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            self.expirations += 1
+            self.misses += 1
+            return None
+
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        self._data[key] = (value, time.monotonic() + self.ttl)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def pop(self, key: Hashable) -> None:
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def stats(self) -> Dict[str, float]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+
+@dataclass(frozen=True)
+class UserProfile:
+    """Read-only snapshot of a User row that can be shared across requests"""
+
+    id: UUID
+    email: str
+    name: Optional[str]
+    created_at: Optional[datetime]
+    wellbeing_profile: Optional[Dict]
+    skills_profile: Optional[Dict]
+    values_profile: Optional[Dict]
+    profile_version: int
+
+    @classmethod
+    def from_user(cls, user) -> "UserProfile":
+        return cls(
+            id=user.id,
+            email=user.email,
+            name=user.name,
+            created_at=user.created_at,
+            wellbeing_profile=user.wellbeing_profile,
+            skills_profile=user.skills_profile,
+            values_profile=user.values_profile,
+            profile_version=user.profile_version or 0,
+        )
+
+
+class ProfileCache:
+    """User profile snapshots, reachable by email and by id"""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self._cache = TTLCache(maxsize, ttl)
+
+    def by_email(self, email: str) -> Optional[UserProfile]:
+        return self._cache.get(("email", email))
+
+    def by_id(self, user_id: UUID) -> Optional[UserProfile]:
+        return self._cache.get(("id", user_id))
+
+    def put(self, profile: UserProfile) -> UserProfile:
+        self._cache.set(("email", profile.email), profile)
+        self._cache.set(("id", profile.id), profile)
+        return profile
+
+    def invalidate(self, email: Optional[str] = None, user_id: Optional[UUID] = None):
+        if email is not None:
+            self._cache.pop(("email", email))
+        if user_id is not None:
+            self._cache.pop(("id", user_id))
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def stats(self) -> Dict[str, float]:
+        return self._cache.stats()
+
+
+settings = get_settings()
+profile_cache = ProfileCache(settings.PROFILE_CACHE_SIZE, settings.PROFILE_CACHE_TTL)
+# Single entry: the catalog version read from catalog_state
+catalog_version_cache = TTLCache(1, settings.CATALOG_VERSION_TTL)
+
+
+def _cache_events():
+    for name, cache in (
+        ("profile", profile_cache),
+        ("catalog_version", catalog_version_cache),
+    ):
+        stats = cache.stats()
+        for event in ("hits", "misses", "evictions", "expirations"):
+            yield (name, event), stats[event]
+
+
+registry.callback(
+    "cache_events_total",
+    "In-process cache hits, misses, evictions and expirations",
+    ("cache", "event"),
+    "counter",
+    _cache_events,
+)
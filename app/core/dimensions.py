@@ -1,6 +1,6 @@
 # app/core/dimensions.py
 from enum import Enum
-from typing import Dict, List
+from typing import Dict, List, Optional
 from pydantic import BaseModel
 from typing import List
 
@@ -224,6 +224,14 @@ class AssessmentDimensions:
             return cls.VALUES_DIMENSIONS
         raise ValueError(f"Unknown assessment type: {assessment_type}")
 
+    @classmethod
+    def get_assessment_type(cls, dimension: str) -> Optional[AssessmentType]:
+        """Get the assessment a dimension belongs to (dimension names are unique)"""
+        for assessment_type in AssessmentType:
+            if dimension in cls.get_dimensions(assessment_type):
+                return assessment_type
+        return None
+
     @classmethod
     def get_questions(cls, assessment_type: AssessmentType) -> List[Dict]:
         """Get all questions for an assessment type with dimension context"""
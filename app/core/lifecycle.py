@@ -0,0 +1,70 @@
+# app/core/lifecycle.py
+from datetime import date, datetime
+from typing import List, Optional
+from uuid import UUID
+import logging
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.crud import bump_catalog_version
+from app.db.database import AsyncSessionLocal
+from app.db.models import JobPosting, JobStatus
+
+logger = logging.getLogger(__name__)
+
+
+def parse_deadline(deadline: Optional[str]) -> Optional[date]:
+    """Parse an application_deadline string ("2024-04-30"); None if unusable"""
+    if not deadline:
+        return None
+    try:
+        return datetime.strptime(deadline.strip(), "%Y-%m-%d").date()
+    except ValueError:
+        return None
+
+
+async def expire_overdue_jobs(
+    db: AsyncSession, today: Optional[date] = None
+) -> List[UUID]:
+    """
+    Mark active and paused jobs whose deadline has passed as expired
+    Returns ids of the jobs that were expired
+    """
+    today = today or date.today()
+
+    # The live slice is small, so parsing its deadlines in Python is cheap
+    result = await db.execute(
+        select(JobPosting.id, JobPosting.application_deadline).where(
+            JobPosting.status != JobStatus.EXPIRED.value,
+            JobPosting.application_deadline.is_not(None),
+        )
+    )
+    overdue = []
+    for job_id, deadline in result.all():
+        parsed = parse_deadline(deadline)
+        if parsed is None:
+            logger.warning("Job %s has unparseable deadline %r", job_id, deadline)
+        elif parsed < today:
+            overdue.append(job_id)
+
+    if overdue:
+        await db.execute(
+            update(JobPosting)
+            .where(JobPosting.id.in_(overdue))
+            .values(status=JobStatus.EXPIRED.value)
+        )
+        # Invalidates catalog ETags and, once committed, has the snapshots
+        # listing these jobs recomputed
+        await bump_catalog_version(db, overdue)
+        await db.commit()
+
+    return overdue
+
+
+async def sweep_expired_jobs() -> None:
+    """Expire overdue jobs in a session of its own; run periodically"""
+    async with AsyncSessionLocal() as db:
+        expired = await expire_overdue_jobs(db)
+    if expired:
+        logger.info("Expired %d job postings", len(expired))
@@ -1,16 +1,177 @@
-import logging
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
+from typing import Optional
+import atexit
+import json
+import logging
+import queue
+import sys
+import traceback
+
+from app.config import get_settings
+from app.core.metrics import registry
+
+# Id of the request being served, set by RequestIdMiddleware
+current_request_id: ContextVar[Optional[str]] = ContextVar(
+    "current_request_id", default=None
+)
+
+# Attributes every LogRecord has; anything else was passed as extra={...}
+_RECORD_ATTRIBUTES = set(vars(logging.makeLogRecord({}))) | {
+    "message",
+    "asctime",
+    "request_id",
+    "color_message",  # uvicorn's ANSI-colored copy of the message
+}
+
+# Loggers that install their own (blocking) handlers; routed to ours instead.
+# SQLAlchemy adds one to the engine logger for echo=True
+_THIRD_PARTY_LOGGERS = (
+    "uvicorn",
+    "uvicorn.error",
+    "uvicorn.access",
+    "sqlalchemy.engine.Engine",
+)
+
+# Incremented from whichever thread logs, hence threadsafe
+log_records_dropped = registry.counter(
+    "log_records_dropped_total",
+    "Log records dropped because the logging queue was full, by level",
+    ("level",),
+    threadsafe=True,
+)
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per record: time, level, logger, message, request id,
+    exception and any extra fields"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        request_id = getattr(record, "request_id", None)
+        if request_id:
+            entry["request_id"] = request_id
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRIBUTES:
+                entry[key] = value
+        return json.dumps(entry, default=str)
+
+
+class TextFormatter(logging.Formatter):
+    """The previous human-readable format, with the request id"""
+
+    def __init__(self):
+        super().__init__("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+
+    def format(self, record: logging.LogRecord) -> str:
+        text = super().format(record)
+        request_id = getattr(record, "request_id", None)
+        return f"{text} [{request_id}]" if request_id else text
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """Puts records on a bounded queue for the listener thread to write
+
+    Runs in the thread that logs (usually the event loop's), so it only
+    captures what can't wait: the request id, the merged message and the
+    traceback text. A record that finds the queue full is dropped and counted
+    rather than waited for.
+    """
 
-def setup_logging():
-    """Configure logging for the application"""
-    log_dir = Path("logs")
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = logging.makeLogRecord(vars(record))
+        record.request_id = current_request_id.get()
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = "".join(traceback.format_exception(*record.exc_info))
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            log_records_dropped.inc((record.levelname,))
+
+
+class _Listener(QueueListener):
+    def enqueue_sentinel(self) -> None:
+        # Blocks until the writer catches up, so records queued before
+        # shutdown are still written
+        self.queue.put(self._sentinel)
+
+
+_listener: Optional[QueueListener] = None
+
+
+def setup_logging() -> None:
+    """Configure logging for the application
+
+    Loggers hand records to a queue; one listener thread formats them and
+    writes them to the console and a size-rotated file, so nothing logged
+    on the event loop waits for I/O. Calling it again reconfigures. The
+    listener runs until the process exits, so the server's own shutdown
+    messages are still written.
+    """
+    global _listener
+    settings = get_settings()
+    shutdown_logging()
+
+    log_dir = Path(settings.LOG_DIR)
     log_dir.mkdir(exist_ok=True)
-    
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(log_dir / "app.log"),
-            logging.StreamHandler()
-        ]
-    )
\ No newline at end of file
+    formatter = JsonFormatter() if settings.LOG_FORMAT == "json" else TextFormatter()
+    handlers = [
+        RotatingFileHandler(
+            log_dir / "app.log",
+            maxBytes=settings.LOG_MAX_BYTES,
+            backupCount=settings.LOG_BACKUP_COUNT,
+            encoding="utf-8",
+        ),
+        logging.StreamHandler(sys.stderr),
+    ]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    log_queue = queue.Queue(maxsize=settings.LOG_QUEUE_SIZE)
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+        handler.close()
+    root.addHandler(NonBlockingQueueHandler(log_queue))
+    root.setLevel(settings.LOG_LEVEL.upper())
+
+    for name in _THIRD_PARTY_LOGGERS:
+        third_party = logging.getLogger(name)
+        third_party.handlers.clear()
+        third_party.propagate = True
+    for name, level in settings.LOG_LEVELS.items():
+        logging.getLogger(name).setLevel(level.upper())
+
+    _listener = _Listener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+
+
+def shutdown_logging() -> None:
+    """Write out the queued records and stop the listener thread"""
+    global _listener
+    if _listener is None:
+        return
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.close()
+    _listener = None
+
+
+atexit.register(shutdown_logging)
@@ -1,142 +1,248 @@
 # app/core/matching.py
-from typing import Dict, Any
-import logging
-
-logger = logging.getLogger(__name__)
+from functools import lru_cache
+from typing import Dict, Any, List, Tuple
+import time
+
+from app.config import get_settings
+from app.core.metrics import (
+    matching_batch_duration,
+    matching_company_terms,
+    matching_jobs_scored,
+)
+
+# (user profile, job requirements, company profile) keys per match type, in
+# the order a result is filled
+MATCH_SOURCES = {
+    "wellbeing": ("wellbeing_profile", "wellbeing_preferences", "wellbeing_profile"),
+    "skills": ("skills_profile", "skills_requirements", "skills_profile"),
+    "values": ("values_profile", "values_alignment", "values_profile"),
+}
+MATCH_WEIGHTS = {"skills": 0.4, "wellbeing": 0.3, "values": 0.3}
+JOB_WEIGHT = 0.6
+COMPANY_WEIGHT = 0.4
+SCORING_POLICIES = ("dense", "sparse")
+
+# match type -> dimension -> ((normalized target, weight), ...)
+SparseIndex = Dict[str, Dict[str, Tuple[Tuple[float, float], ...]]]
+
+
+def _side_match(diff: float) -> float:
+    # Under = full penalty, over = half penalty
+    return 1.0 + diff if diff < 0 else 1.0 - (diff * 0.5)
 
 
 class MatchingSystem:
-    def calculate_match(
-        self, user_profiles: Dict, job_requirements: Dict, company_profiles: Dict
-    ) -> Dict[str, float]:
-        """Calculate overall match score based on available profiles"""
-        logger.info(f"Starting match calculation with user_profiles: {user_profiles}")
-        matches = {}
-        weights = {"skills": 0.4, "wellbeing": 0.3, "values": 0.3}
-
-        # Calculate individual dimension matches if profiles exist
-        if "wellbeing_profile" in user_profiles:
-            matches["wellbeing_match"] = self._calculate_dimension_match(
-                user_profiles["wellbeing_profile"],
-                job_requirements.get("wellbeing_preferences", {}),
-                company_profiles.get("wellbeing_profile", {}),
-                "wellbeing",
-            )
-            logger.info(f"Wellbeing match score: {matches.get('wellbeing_match')}")
-
-        if "skills_profile" in user_profiles:
-            matches["skills_match"] = self._calculate_dimension_match(
-                user_profiles["skills_profile"],
-                job_requirements.get("skills_requirements", {}),
-                company_profiles.get("skills_profile", {}),
-                "skills",
-            )
-            logger.info(f"Skills match score: {matches.get('skills_match')}")
-
-        if "values_profile" in user_profiles:
-            matches["values_match"] = self._calculate_dimension_match(
-                user_profiles["values_profile"],
-                job_requirements.get("values_alignment", {}),
-                company_profiles.get("values_profile", {}),
-                "values",
-            )
-            logger.info(f"Values match score: {matches.get('values_match')}")
-
-        # Calculate overall match score
+    """Scores users against jobs under a scoring policy
+
+    "dense" is the original scoring: every dimension the user has is scored
+    against both the job and the company, a side that doesn't define it
+    counting as a target of 0. "sparse" scores only the dimensions the job or
+    the company actually define, against the sides that define them.
+    """
+
+    def __init__(self, scoring: str = "dense"):
+        if scoring not in SCORING_POLICIES:
+            raise ValueError(f"Unknown scoring policy: {scoring}")
+        self.scoring = scoring
+
+    def prepare_jobs(self, jobs: List[Tuple[Dict, Dict]]) -> List[Any]:
+        """Turn (job_requirements, company_profiles) pairs into what the policy
+        scores, so callers scoring many users against the same jobs do it once
+        """
+        if self.scoring == "sparse":
+            return [self._sparse_index(*job) for job in jobs]
+        return list(jobs)
+
+    def score_jobs(
+        self, user_profiles: Dict, jobs: List[Tuple[Dict, Dict]]
+    ) -> List[Dict[str, float]]:
+        """Score one user's profiles against many (job_requirements, company_profiles)
+
+        Returns one result per job, in order, equal to calculate_match's. The
+        user's scores are normalized once and nothing is logged per job. Jobs
+        of one company should share its company_profiles dict: the company's
+        part of the score is then computed once for all of them.
+        """
+        return self.score_prepared(user_profiles, self.prepare_jobs(jobs))
+
+    def score_prepared(
+        self, user_profiles: Dict, prepared: List[Any]
+    ) -> List[Dict[str, float]]:
+        """score_jobs on jobs already passed through prepare_jobs"""
+        started_at = time.perf_counter()
+        results = self._score_prepared(user_profiles, prepared)
+        matching_batch_duration.observe(
+            (self.scoring,), time.perf_counter() - started_at
+        )
+        matching_jobs_scored.inc((self.scoring,), len(prepared))
+        return results
+
+    def _score_prepared(
+        self, user_profiles: Dict, prepared: List[Any]
+    ) -> List[Dict[str, float]]:
+        user_scores = {
+            match_type: {
+                dimension: data.get("score", 0) / 10.0
+                for dimension, data in user_profiles[user_key].items()
+            }
+            for match_type, (user_key, _, _) in MATCH_SOURCES.items()
+            if user_key in user_profiles
+        }
+
+        if self.scoring == "sparse":
+            return [self._sparse_match(user_scores, index) for index in prepared]
+
+        # The company side of a match depends only on the user and the
+        # company, so it is computed once per company profiles dict and reused
+        # for that company's other jobs
+        company_terms = {}
+        results = []
+        for job_requirements, company_profiles in prepared:
+            terms = company_terms.get(id(company_profiles))
+            if terms is None:
+                terms = company_terms[id(company_profiles)] = self._company_terms(
+                    user_scores, company_profiles
+                )
+            matches = {}
+            for match_type, scores in user_scores.items():
+                job_key = MATCH_SOURCES[match_type][1]
+                matches[f"{match_type}_match"] = self._dimension_match(
+                    scores, job_requirements.get(job_key) or {}, terms[match_type]
+                )
+            results.append(self._with_overall(matches))
+
+        matching_company_terms.inc(("miss",), len(company_terms))
+        matching_company_terms.inc(("hit",), len(prepared) - len(company_terms))
+        return results
+
+    @staticmethod
+    def _with_overall(matches: Dict[str, float]) -> Dict[str, float]:
+        """Add the weighted overall_match of the match types present"""
         total_weight = 0
         weighted_sum = 0
-
-        for match_type, weight in weights.items():
+        for match_type, weight in MATCH_WEIGHTS.items():
             match_key = f"{match_type}_match"
             if match_key in matches:
                 weighted_sum += matches[match_key] * weight
                 total_weight += weight
-
         matches["overall_match"] = (
             weighted_sum / total_weight if total_weight > 0 else 0.0
         )
-        logger.info(f"Final matches: {matches}")
-
         return matches
 
-    def _calculate_dimension_match(
-        self,
-        user_profile: Dict,
+    @staticmethod
+    def _sparse_index(job_requirements: Dict, company_profiles: Dict) -> SparseIndex:
+        """Per match type, the dimensions the job or company define, each with
+        its (normalized target, weight) per defining side
+
+        A dimension both sides define is weighted 60/40 as in dense scoring;
+        one only a single side defines is scored against that side alone.
+        """
+        index = {}
+        for match_type, (_, job_key, company_key) in MATCH_SOURCES.items():
+            sides = (
+                (job_requirements.get(job_key) or {}, JOB_WEIGHT),
+                (company_profiles.get(company_key) or {}, COMPANY_WEIGHT),
+            )
+            dimensions = {}
+            for dimension in sorted(sides[0][0].keys() | sides[1][0].keys()):
+                targets = [
+                    (side[dimension].get("score", 0) / 10.0, weight)
+                    for side, weight in sides
+                    if dimension in side
+                ]
+                total = sum(weight for _, weight in targets)
+                dimensions[dimension] = tuple(
+                    (target, weight / total) for target, weight in targets
+                )
+            if dimensions:
+                index[match_type] = dimensions
+        return index
+
+    def _sparse_match(
+        self, user_scores: Dict[str, Dict[str, float]], index: SparseIndex
+    ) -> Dict[str, float]:
+        """Score normalized user scores against a sparse index
+
+        A match type is only reported when the user and the job share at
+        least one of its dimensions; there is nothing to score it on
+        otherwise, and it doesn't weigh into overall_match.
+        """
+        matches = {}
+        for match_type, scores in user_scores.items():
+            dimension_scores = []
+            for dimension, targets in index.get(match_type, {}).items():
+                if dimension not in scores:
+                    continue
+                user_score = scores[dimension]
+                dimension_match = sum(
+                    _side_match(user_score - target) * weight
+                    for target, weight in targets
+                )
+                dimension_scores.append(max(0.0, min(1.0, dimension_match)))
+            if dimension_scores:
+                matches[f"{match_type}_match"] = sum(dimension_scores) / len(
+                    dimension_scores
+                )
+        return self._with_overall(matches)
+
+    @staticmethod
+    def _company_terms(
+        user_scores: Dict[str, Dict[str, float]], company_profiles: Dict
+    ) -> Dict[str, Dict[str, float]]:
+        """Per match type and user dimension, the company's weighted side match"""
+        terms = {}
+        for match_type, scores in user_scores.items():
+            company_profile = company_profiles.get(MATCH_SOURCES[match_type][2]) or {}
+            terms[match_type] = {
+                dimension: _side_match(
+                    user_score
+                    - company_profile.get(dimension, {}).get("score", 0) / 10.0
+                )
+                * COMPANY_WEIGHT
+                for dimension, user_score in scores.items()
+            }
+        return terms
+
+    @staticmethod
+    def _dimension_match(
+        user_scores: Dict[str, float],
         job_requirements: Dict,
-        company_profile: Dict,
-        dimension_type: str,
+        company_terms: Dict[str, float],
     ) -> float:
-        """Calculate match score for any dimension type"""
-        logger.info(
-            f"Starting {dimension_type} calculation with user profile: {user_profile}"
-        )
-
-        dimensions = list(
-            set(user_profile.keys())
-            | set(job_requirements.keys())
-            | set(company_profile.keys())
-        )
-
+        """Average over the user's dimensions of the clamped job (60%) and
+        company (40%, precomputed in company_terms) side matches, a side that
+        doesn't define a dimension counting as a target of 0"""
         dimension_scores = []
-
-        for dimension in dimensions:
-            if dimension not in user_profile:
-                continue
-
-            # Get scores (all are just simple scores now, no min/preferred)
-            user_score = user_profile[dimension].get("score", 0)
-            job_score = job_requirements.get(dimension, {}).get("score", 0)
-            company_score = company_profile.get(dimension, {}).get("score", 0)
-
-            # Normalize scores to 0-1 range
-            user_score = user_score / 10.0
-            job_score = job_score / 10.0
-            company_score = company_score / 10.0
-
-            logger.info(
-                f"""
-            Dimension {dimension}:
-            User score: {user_score}
-            Job score: {job_score}
-            Company score: {company_score}
-            """
-            )
-
-            # Calculate differences (with asymmetric penalties)
-            job_diff = user_score - job_score
-            company_diff = user_score - company_score
-
-            # Calculate match scores with asymmetric penalties
-            # Under = full penalty, Over = half penalty
-            if job_diff < 0:
-                job_match = 1.0 + job_diff  # Full penalty for being under
-            else:
-                job_match = 1.0 - (job_diff * 0.5)  # Half penalty for being over
-
-            if company_diff < 0:
-                company_match = 1.0 + company_diff
-            else:
-                company_match = 1.0 - (company_diff * 0.5)
-
-            # Combine job (60%) and company (40%) matches
-            dimension_match = (job_match * 0.6) + (company_match * 0.4)
-            dimension_match = max(0.0, min(1.0, dimension_match))
-
-            dimension_scores.append(dimension_match)
-
-            logger.info(
-                f"""
-            Dimension {dimension} matches:
-            Job match: {job_match}
-            Company match: {company_match}
-            Final dimension match: {dimension_match}
-            """
-            )
+        for dimension, user_score in user_scores.items():
+            job_score = job_requirements.get(dimension, {}).get("score", 0) / 10.0
+            dimension_match = (
+                _side_match(user_score - job_score) * JOB_WEIGHT
+            ) + company_terms[dimension]
+            dimension_scores.append(max(0.0, min(1.0, dimension_match)))
 
         if not dimension_scores:
             return 0.0
+        return sum(dimension_scores) / len(dimension_scores)
+
+    def calculate_match(
+        self, user_profiles: Dict, job_requirements: Dict, company_profiles: Dict
+    ) -> Dict[str, float]:
+        """Calculate overall match score based on available profiles
+
+        One job through score_jobs, so single and batch scoring share one
+        implementation of each policy.
+        """
+        (matches,) = self.score_jobs(
+            user_profiles, [(job_requirements, company_profiles)]
+        )
+        return matches
+
 
-        final_score = sum(dimension_scores) / len(dimension_scores)
-        logger.info(f"Final {dimension_type} match score: {final_score}")
+@lru_cache()
+def get_matching_system() -> MatchingSystem:
+    """The instance shared by the routes and background tasks (it is stateless)
 
-        return final_score
+    Built on first use, so importing this module doesn't need the settings.
+    """
+    return MatchingSystem(get_settings().MATCH_SCORING)
@@ -0,0 +1,293 @@
+# app/core/metrics.py
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+import math
+import threading
+
+# Label sets a metric keeps before folding new ones into one overflow series
+MAX_SERIES = 500
+OVERFLOW_LABEL = "__overflow__"
+
+# Seconds; spans a cached 304 to a full catalog scan
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if isinstance(value, int):
+        return str(value)
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+    return "{" + pairs + "}"
+
+
+class _Metric:
+    type = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._series: Dict[LabelValues, object] = {}
+
+    def _key(self, labels: LabelValues) -> LabelValues:
+        # Label values come from bounded sets (route templates, status codes);
+        # the cap only guards against a bug turning one into a free-form value
+        if labels in self._series or len(self._series) < MAX_SERIES:
+            return labels
+        return (OVERFLOW_LABEL,) * len(self.labelnames)
+
+    def render(self) -> List[str]:
+        lines = [
+            f"# HELP {self.name} {_escape(self.documentation)}",
+            f"# TYPE {self.name} {self.type}",
+        ]
+        for labels, value in sorted(self._series.items()):
+            lines.extend(self._render_series(labels, value))
+        return lines
+
+    def _render_series(self, labels: LabelValues, value) -> List[str]:
+        return [
+            f"{self.name}{_format_labels(self.labelnames, labels)} "
+            f"{_format_value(value)}"
+        ]
+
+
+class Counter(_Metric):
+    """Monotonic count per label set"""
+
+    type = "counter"
+
+    def inc(self, labels: LabelValues = (), amount: float = 1) -> None:
+        key = self._key(labels)
+        self._series[key] = self._series.get(key, 0) + amount
+
+
+class LockedCounter(Counter):
+    """Counter that other threads (e.g. logging from worker threads) increment
+
+    The lock also covers rendering, so the scrape never sees a series being
+    added.
+    """
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._lock = threading.Lock()
+
+    def inc(self, labels: LabelValues = (), amount: float = 1) -> None:
+        with self._lock:
+            super().inc(labels, amount)
+
+    def render(self) -> List[str]:
+        with self._lock:
+            return super().render()
+
+
+class Gauge(_Metric):
+    """Value per label set that can go up and down"""
+
+    type = "gauge"
+
+    def set(self, labels: LabelValues, value: float) -> None:
+        self._series[self._key(labels)] = value
+
+    def inc(self, labels: LabelValues = (), amount: float = 1) -> None:
+        key = self._key(labels)
+        self._series[key] = self._series.get(key, 0) + amount
+
+    def dec(self, labels: LabelValues = (), amount: float = 1) -> None:
+        self.inc(labels, -amount)
+
+
+class Histogram(_Metric):
+    """Bucketed observations per label set
+
+    Each series is [per-bucket counts..., sum]; observing is a bisect and two
+    additions. Buckets are cumulated only when rendered.
+    """
+
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, labels: LabelValues, value: float) -> None:
+        key = self._key(labels)
+        series = self._series.get(key)
+        if series is None:
+            series = self._series[key] = [0] * (len(self.buckets) + 2)
+        series[bisect_left(self.buckets, value)] += 1
+        series[-1] += value
+
+    def _render_series(self, labels: LabelValues, series) -> List[str]:
+        names = self.labelnames + ("le",)
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self.buckets + (math.inf,), series):
+            cumulative += count
+            lines.append(
+                f"{self.name}_bucket"
+                f"{_format_labels(names, labels + (_format_value(bound),))} "
+                f"{cumulative}"
+            )
+        label_text = _format_labels(self.labelnames, labels)
+        lines.append(f"{self.name}_sum{label_text} {_format_value(series[-1])}")
+        lines.append(f"{self.name}_count{label_text} {cumulative}")
+        return lines
+
+
+class CallbackMetric(_Metric):
+    """Metric whose series are read from a callback at scrape time
+
+    For values something else already keeps (cache counters, pool state), so
+    nothing is recorded on the hot path.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str],
+        type: str,
+        collect: Callable[[], Iterable[Tuple[LabelValues, float]]],
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.type = type
+        self.collect = collect
+
+    def render(self) -> List[str]:
+        self._series = dict(self.collect())
+        return super().render()
+
+
+class MetricsRegistry:
+    """The metrics rendered at /metrics
+
+    Metrics are recorded from the event loop thread, so recording takes no
+    locks; a counter incremented from other threads too must be registered
+    with threadsafe=True.
+    """
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+
+    def register(self, metric: _Metric) -> _Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric already registered: {metric.name}")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(
+        self, name: str, documentation: str, labelnames=(), threadsafe: bool = False
+    ) -> Counter:
+        counter_class = LockedCounter if threadsafe else Counter
+        return self.register(counter_class(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames=()) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self, name: str, documentation: str, labelnames=(), buckets=LATENCY_BUCKETS
+    ) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def callback(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str],
+        type: str,
+        collect: Callable[[], Iterable[Tuple[LabelValues, float]]],
+    ) -> CallbackMetric:
+        return self.register(
+            CallbackMetric(name, documentation, labelnames, type, collect)
+        )
+
+    def get(self, name: str) -> Optional[_Metric]:
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+# HTTP
+http_request_duration = registry.histogram(
+    "http_request_duration_seconds",
+    "Request latency by route template, method and status",
+    ("method", "route", "status"),
+)
+http_requests_in_progress = registry.gauge(
+    "http_requests_in_progress", "Requests being served"
+)
+
+# Database
+db_queries_per_request = registry.histogram(
+    "db_queries_per_request",
+    "Statements executed per request, by route template",
+    ("route",),
+    buckets=QUERY_COUNT_BUCKETS,
+)
+db_query_seconds_per_request = registry.histogram(
+    "db_query_seconds_per_request",
+    "Total statement time per request, by route template",
+    ("route",),
+)
+db_query_duration = registry.histogram(
+    "db_query_duration_seconds", "Duration of single statements"
+)
+db_repeated_statements = registry.counter(
+    "db_repeated_statements_total",
+    "Statements a request executed N_PLUS_ONE_THRESHOLD or more times (N+1)",
+    ("route",),
+)
+db_query_budget_exceeded = registry.counter(
+    "db_query_budget_exceeded_total",
+    "Requests that executed more statements than their route's budget",
+    ("route",),
+)
+
+# Matching
+matching_jobs_scored = registry.counter(
+    "matching_jobs_scored_total", "Jobs scored, by scoring policy", ("policy",)
+)
+matching_batch_duration = registry.histogram(
+    "matching_batch_duration_seconds",
+    "Time to score one user against a batch of jobs, by scoring policy",
+    ("policy",),
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0),
+)
+matching_company_terms = registry.counter(
+    "matching_company_terms_total",
+    "Per-user company components: computed (miss) or reused for another job (hit)",
+    ("result",),
+)
+recommendation_snapshot_lookups = registry.counter(
+    "recommendation_snapshot_lookups_total",
+    "Recommendation reads served from a current snapshot (hit) or computed (miss)",
+    ("result",),
+)
@@ -0,0 +1,102 @@
+# app/core/profiler.py
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional
+import cProfile
+import hashlib
+import hmac
+import itertools
+import json
+import logging
+import re
+import time
+
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# Request header asking for a profile: "<expires>.<signature>", see sign_request
+PROFILE_HEADER = "x-profile"
+# Header carrying PROFILER_SECRET on the profile listing and download endpoints
+ADMIN_TOKEN_HEADER = "X-Profiler-Token"
+
+PROFILE_SUFFIX = ".pstats"
+_PROFILE_NAME = re.compile(r"^[\w-]+\.pstats$")
+
+
+def _signature(secret: str, expires: int, path: str) -> str:
+    message = f"{expires}:{path}".encode()
+    return hmac.new(secret.encode(), message, hashlib.sha256).hexdigest()
+
+
+def sign_request(secret: str, path: str, ttl: float = 300) -> str:
+    """X-Profile header value that profiles requests to path for ttl seconds"""
+    expires = int(time.time() + ttl)
+    return f"{expires}.{_signature(secret, expires, path)}"
+
+
+def verify_request(secret: str, path: str, header: str) -> bool:
+    """Whether header is an unexpired signature for path under secret"""
+    expires, _, signature = header.partition(".")
+    try:
+        expires = int(expires)
+    except ValueError:
+        return False
+    if expires < time.time():
+        return False
+    return hmac.compare_digest(signature, _signature(secret, expires, path))
+
+
+class ProfileStore:
+    """The newest max_profiles request profiles, as pstats files in a directory
+
+    Each profile has a JSON sidecar with the request it was taken for. Files
+    are written and pruned from a worker thread by the profiling middleware.
+    """
+
+    def __init__(self, directory: str, max_profiles: int):
+        self.directory = Path(directory)
+        self.max_profiles = max_profiles
+        self._seq = itertools.count()
+
+    def save(self, profile: cProfile.Profile, meta: Dict) -> str:
+        """Write profile and its metadata; drop the oldest beyond max_profiles"""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        name = f"{int(time.time() * 1000)}-{next(self._seq):04d}"
+        profile.dump_stats(self.directory / f"{name}{PROFILE_SUFFIX}")
+        (self.directory / f"{name}.json").write_text(json.dumps(meta))
+
+        for stale in self._names()[: -self.max_profiles]:
+            for suffix in (PROFILE_SUFFIX, ".json"):
+                (self.directory / f"{stale}{suffix}").unlink(missing_ok=True)
+        return f"{name}{PROFILE_SUFFIX}"
+
+    def _names(self) -> List[str]:
+        """Stored profile names without suffix, oldest first"""
+        if not self.directory.is_dir():
+            return []
+        return sorted(path.stem for path in self.directory.glob(f"*{PROFILE_SUFFIX}"))
+
+    def list(self) -> List[Dict]:
+        """Stored profiles with their metadata, newest first"""
+        profiles = []
+        for name in reversed(self._names()):
+            try:
+                meta = json.loads((self.directory / f"{name}.json").read_text())
+            except (OSError, ValueError):
+                meta = {}
+            profiles.append({"name": f"{name}{PROFILE_SUFFIX}", **meta})
+        return profiles
+
+    def path(self, name: str) -> Optional[Path]:
+        """Path of a stored profile, or None for unknown or malformed names"""
+        if not _PROFILE_NAME.match(name):
+            return None
+        path = self.directory / name
+        return path if path.is_file() else None
+
+
+@lru_cache()
+def get_profile_store() -> ProfileStore:
+    settings = get_settings()
+    return ProfileStore(settings.PROFILER_DIR, settings.PROFILER_MAX_PROFILES)
@@ -0,0 +1,345 @@
+# app/core/recommendations.py
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+import asyncio
+import heapq
+import json
+import logging
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import TTLCache
+from app.core.matching import get_matching_system
+from app.core.scheduler import Priority, SchedulerBusy, scheduler
+from app.db.crud import (
+    advance_snapshots,
+    get_catalog_version,
+    get_snapshots_listing,
+    on_catalog_change,
+    save_recommendation_snapshot,
+    stream_current_snapshots,
+)
+from app.db.database import AsyncSessionLocal
+from app.db.models import Company, JobPosting, JobStatus, User
+from app.db.pagination import decode_cursor, encode_cursor
+
+logger = logging.getLogger(__name__)
+
+# Length of a user's recommendation list (and of their snapshot)
+RECOMMENDATION_LIMIT = 10
+
+
+def get_completed_profiles(user: "User") -> Dict[str, Dict]:
+    """Get only completed assessment profiles"""
+    profiles = {}
+    if user.wellbeing_profile:
+        profiles["wellbeing_profile"] = user.wellbeing_profile
+    if user.skills_profile:
+        profiles["skills_profile"] = user.skills_profile
+    if user.values_profile:
+        profiles["values_profile"] = user.values_profile
+    return profiles
+
+
+def _load_json(value, what: str) -> Optional[Dict]:
+    """Profiles written by old imports are JSON strings rather than objects"""
+    if not isinstance(value, str):
+        return value
+    try:
+        return json.loads(value)
+    except ValueError as e:
+        logger.error(f"Error processing {what}: {e}")
+        return None
+
+
+def match_inputs(
+    job, company, companies: Optional[Dict[UUID, Dict]] = None
+) -> Tuple[Dict, Dict]:
+    """The (job_requirements, company_profiles) the matching system scores
+
+    job has the job posting's requirement columns and company_id, company
+    the company's profile columns; both can be one joined row. Jobs passed the
+    same `companies` dict share one company_profiles per company, which the
+    matching system scores once per user.
+    """
+    company_profiles = None if companies is None else companies.get(job.company_id)
+    if company_profiles is None:
+        company_profiles = {
+            "wellbeing_profile": _load_json(
+                company.wellbeing_profile, "company wellbeing profile"
+            ),
+            "values_profile": _load_json(
+                company.values_profile, "company values profile"
+            ),
+        }
+        if companies is not None:
+            companies[job.company_id] = company_profiles
+    return (
+        {
+            "skills_requirements": _load_json(
+                job.skills_requirements, "skills requirements"
+            ),
+            "wellbeing_preferences": _load_json(
+                job.wellbeing_preferences, "wellbeing preferences"
+            ),
+            "values_alignment": _load_json(job.values_alignment, "values alignment"),
+        },
+        company_profiles,
+    )
+
+
+def _scored_jobs_query():
+    return select(
+        JobPosting.id,
+        JobPosting.title,
+        JobPosting.description,
+        JobPosting.skills_requirements,
+        JobPosting.wellbeing_preferences,
+        JobPosting.values_alignment,
+        JobPosting.company_id,
+        Company.name,
+        Company.wellbeing_profile,
+        Company.values_profile,
+    ).join(Company, JobPosting.company_id == Company.id)
+
+
+async def compute_recommendations(
+    db: AsyncSession, user: "User", limit: int = RECOMMENDATION_LIMIT
+) -> List[Dict]:
+    """Score every active job against the user's completed assessments
+
+    Returns the top `limit` matches, best first. Job ids are strings so the
+    result can be stored in a snapshot as is.
+    """
+    completed_profiles = get_completed_profiles(user)
+    if not completed_profiles:
+        return []
+
+    result = await db.execute(
+        _scored_jobs_query()
+        .where(JobPosting.status == JobStatus.ACTIVE.value)
+        .order_by(JobPosting.created_at.desc(), JobPosting.id)
+    )
+    rows = result.all()
+
+    companies = {}
+    match_scores = get_matching_system().score_jobs(
+        completed_profiles, [match_inputs(row, row, companies) for row in rows]
+    )
+
+    # nlargest is stable, so ties keep the newest-first order
+    best = heapq.nlargest(
+        limit,
+        zip(rows, match_scores),
+        key=lambda scored: scored[1]["overall_match"],
+    )
+    matched_dimensions = list(completed_profiles.keys())
+    return [
+        {
+            "job": {
+                "id": str(row.id),
+                "title": row.title,
+                "company": row.name,
+                "description": row.description,
+            },
+            "match_score": match_score,
+            "matched_dimensions": matched_dimensions,
+        }
+        for row, match_score in best
+    ]
+
+
+def encode_job_handle(user_id: UUID, profile_version: int) -> str:
+    """Opaque handle for the recommendations of one version of a profile"""
+    return encode_cursor([user_id, profile_version])
+
+
+def decode_job_handle(handle: str) -> Tuple[UUID, int]:
+    """
+    Decode a handle produced by encode_job_handle
+    Raises ValueError if the handle is malformed
+    """
+    user_id, profile_version = decode_cursor(handle, [str, int])
+    return UUID(user_id), profile_version
+
+
+class RecommendationJobs:
+    """Computes recommendations on the scheduler and stores them as snapshots
+
+    Jobs run in this process only; the snapshot table is what other workers
+    (and this one after a restart) read. Jobs are keyed by (user id, profile
+    version), so scheduling the same version twice runs it once.
+    """
+
+    def __init__(self, failure_ttl: float = 600.0):
+        self._tasks: Dict[Tuple[UUID, int], asyncio.Future] = {}
+        self._failures = TTLCache(10_000, failure_ttl)
+
+    def schedule(
+        self,
+        user_id: UUID,
+        profile_version: int,
+        priority: Priority = Priority.INTERACTIVE,
+    ) -> str:
+        """Queue the job unless already queued; returns the job handle
+
+        When the queue is full the job is not queued; polling the handle
+        queues it again.
+        """
+        key = (user_id, profile_version)
+        if key not in self._tasks:
+            self._failures.pop(key)
+            try:
+                future = scheduler.submit_nowait(
+                    "recommendations",
+                    self._run,
+                    user_id,
+                    profile_version,
+                    priority=priority,
+                    name=f"recommendations:{user_id}",
+                )
+            except SchedulerBusy:
+                logger.warning(f"Recommendation queue full, deferring user {user_id}")
+            else:
+                self._tasks[key] = future
+                future.add_done_callback(lambda _: self._tasks.pop(key, None))
+        return encode_job_handle(user_id, profile_version)
+
+    async def refresh(self, user_id: UUID, profile_version: int) -> None:
+        """Queue a background recomputation, waiting for room in the queue"""
+        key = (user_id, profile_version)
+        if key in self._tasks:
+            return
+        future = await scheduler.submit(
+            "recommendations",
+            self._run,
+            user_id,
+            profile_version,
+            priority=Priority.BATCH,
+            name=f"recommendations:{user_id}",
+        )
+        self._tasks.setdefault(key, future)
+        future.add_done_callback(lambda _: self._tasks.pop(key, None))
+
+    def is_running(self, user_id: UUID, profile_version: int) -> bool:
+        return (user_id, profile_version) in self._tasks
+
+    def failure(self, user_id: UUID, profile_version: int) -> Optional[str]:
+        """Why the job failed, if it did recently"""
+        return self._failures.get((user_id, profile_version))
+
+    async def wait(self, user_id: UUID, profile_version: int, timeout: float) -> None:
+        """Wait up to timeout seconds for a running job; no-op if none is"""
+        future = self._tasks.get((user_id, profile_version))
+        if future is not None:
+            # wait() doesn't cancel the job when the poller gives up
+            await asyncio.wait({future}, timeout=timeout)
+
+    async def _run(self, user_id: UUID, profile_version: int) -> None:
+        try:
+            async with AsyncSessionLocal() as db:
+                user = await db.get(User, user_id)
+                if user is None:
+                    raise LookupError("User not found")
+                if user.profile_version > profile_version:
+                    # A newer submit scheduled its own job
+                    return
+
+                # Read before scoring: a catalog change mid-way leaves the
+                # snapshot stale rather than wrongly fresh
+                catalog_version = await get_catalog_version(db)
+                recommendations = await compute_recommendations(db, user)
+                await save_recommendation_snapshot(
+                    db,
+                    user_id,
+                    user.profile_version,
+                    catalog_version,
+                    recommendations,
+                    (
+                        recommendations[-1]["match_score"]["overall_match"]
+                        if len(recommendations) == RECOMMENDATION_LIMIT
+                        else None
+                    ),
+                )
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.exception(f"Recommendation job failed for user {user_id}")
+            self._failures.set((user_id, profile_version), str(e))
+
+
+recommendation_jobs = RecommendationJobs()
+
+
+async def propagate_catalog_change(job_ids: List[UUID], version: int) -> int:
+    """Bring snapshots of the previous catalog version up to version
+
+    Only snapshots the changed jobs can affect are recomputed: those listing
+    one of them, and those one of them (if still active) now scores at least
+    as well as the snapshot's last entry. The rest are carried over as they
+    are. Costs one score per changed job and current snapshot, and a full
+    recomputation per affected user. Returns the number of affected users.
+    """
+    previous = version - 1
+    async with AsyncSessionLocal() as db:
+        affected = await get_snapshots_listing(db, job_ids, previous)
+
+        result = await db.execute(
+            _scored_jobs_query().where(
+                JobPosting.id.in_(job_ids),
+                JobPosting.status == JobStatus.ACTIVE.value,
+            )
+        )
+        matching_system = get_matching_system()
+        changed = matching_system.prepare_jobs(
+            [match_inputs(row, row, {}) for row in result.all()]
+        )
+        if changed:
+            async for snapshot in stream_current_snapshots(db, previous):
+                if snapshot.user_id in affected:
+                    continue
+                completed_profiles = get_completed_profiles(snapshot)
+                if not completed_profiles:
+                    continue
+                best = max(
+                    score["overall_match"]
+                    for score in matching_system.score_prepared(
+                        completed_profiles, changed
+                    )
+                )
+                if snapshot.score_bound is None or best >= snapshot.score_bound:
+                    affected[snapshot.user_id] = snapshot.profile_version
+
+        carried = await advance_snapshots(db, previous, version, list(affected))
+
+    logger.info(
+        "Catalog version %d: recomputing %d snapshots, %d carried over",
+        version,
+        len(affected),
+        carried,
+    )
+    for user_id, profile_version in affected.items():
+        await recommendation_jobs.refresh(user_id, profile_version)
+    return len(affected)
+
+
+def _schedule_propagation(job_ids: Optional[List[UUID]], version: int) -> None:
+    """Catalog change listener: propagate on the scheduler's catalog queue"""
+    if job_ids is None:
+        # Unknown changes; every snapshot stays stale and the recommendations
+        # route refreshes each one when its user next reads it
+        return
+    try:
+        scheduler.submit_nowait(
+            "catalog",
+            propagate_catalog_change,
+            job_ids,
+            version,
+            name=f"propagate:{version}",
+        )
+    except SchedulerBusy:
+        logger.warning("Catalog queue full; snapshots of version %d go stale", version)
+
+
+on_catalog_change(_schedule_propagation)
@@ -0,0 +1,299 @@
+# app/core/scheduler.py
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+import asyncio
+import itertools
+import logging
+import time
+
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+class Priority(IntEnum):
+    """Lower runs first within a queue"""
+
+    INTERACTIVE = 0  # A user is waiting for the result
+    BATCH = 10  # Sweeps, rebuilds and other background work
+
+
+class SchedulerBusy(Exception):
+    """Raised by submit_nowait when the queue is full"""
+
+
+@dataclass(order=True)
+class _Job:
+    priority: int
+    seq: int
+    name: str = field(compare=False)
+    fn: Callable[..., Awaitable] = field(compare=False)
+    args: tuple = field(compare=False)
+    future: asyncio.Future = field(compare=False)
+    submitted_at: float = field(compare=False)
+    started_at: float = field(default=0.0, compare=False)
+
+
+class _Queue:
+    def __init__(self, name: str, concurrency: int, maxsize: int):
+        self.name = name
+        self.concurrency = concurrency
+        self.jobs: asyncio.PriorityQueue = asyncio.PriorityQueue(maxsize)
+        self.running: Dict[int, _Job] = {}
+        self.workers: List[asyncio.Task] = []
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+        self.run_seconds = 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        finished = self.completed + self.failed
+        now = time.monotonic()
+        return {
+            "concurrency": self.concurrency,
+            "maxsize": self.jobs.maxsize,
+            "queued": self.jobs.qsize(),
+            "running": [
+                {"name": job.name, "seconds": round(now - job.started_at, 3)}
+                for job in self.running.values()
+            ],
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "rejected": self.rejected,
+            "avg_wait_seconds": (
+                round(self.wait_seconds / finished, 4) if finished else 0.0
+            ),
+            "max_wait_seconds": round(self.max_wait_seconds, 4),
+            "avg_run_seconds": (
+                round(self.run_seconds / finished, 4) if finished else 0.0
+            ),
+        }
+
+
+@dataclass
+class _Periodic:
+    name: str
+    interval: float
+    queue: str
+    fn: Callable[[], Awaitable]
+    priority: Priority
+    task: Optional[asyncio.Task] = None
+    last: Optional[asyncio.Future] = None
+    runs: int = 0
+    skipped: int = 0
+    last_started: Optional[float] = None
+    last_error: Optional[str] = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "interval": self.interval,
+            "queue": self.queue,
+            "runs": self.runs,
+            "skipped": self.skipped,
+            "seconds_since_run": (
+                round(time.monotonic() - self.last_started, 3)
+                if self.last_started is not None
+                else None
+            ),
+            "last_error": self.last_error,
+        }
+
+
+def _retrieve(future: asyncio.Future) -> None:
+    # Failures are logged by the worker; don't warn that nobody awaited them
+    if not future.cancelled():
+        future.exception()
+
+
+class Scheduler:
+    """Runs background coroutines on named queues in this process
+
+    Each queue has a fixed number of workers (its concurrency) and a bounded
+    size: submit() waits for room, submit_nowait() raises SchedulerBusy.
+    Within a queue, interactive jobs run before batch jobs. Periodic jobs
+    are submitted every interval, skipping a tick while the previous run is
+    still queued or running.
+    """
+
+    def __init__(self):
+        self._queues: Dict[str, _Queue] = {}
+        self._periodic: Dict[str, _Periodic] = {}
+        self._seq = itertools.count()
+        self.started = False
+
+    def add_queue(self, name: str, concurrency: int, maxsize: int) -> None:
+        self._queues[name] = _Queue(name, concurrency, maxsize)
+
+    def every(
+        self,
+        name: str,
+        interval: float,
+        queue: str,
+        fn: Callable[[], Awaitable],
+        priority: Priority = Priority.BATCH,
+    ) -> None:
+        """Run fn on queue now and then every interval seconds while started"""
+        previous = self._periodic.get(name)
+        if previous and previous.task:
+            previous.task.cancel()
+        periodic = self._periodic[name] = _Periodic(name, interval, queue, fn, priority)
+        if self.started:
+            periodic.task = asyncio.create_task(self._tick(periodic))
+
+    def _job(self, queue: str, fn, args, priority: Priority, name) -> _Job:
+        future = asyncio.get_running_loop().create_future()
+        future.add_done_callback(_retrieve)
+        return _Job(
+            priority,
+            next(self._seq),
+            name or getattr(fn, "__qualname__", repr(fn)),
+            fn,
+            args,
+            future,
+            time.monotonic(),
+        )
+
+    async def submit(
+        self,
+        queue: str,
+        fn: Callable[..., Awaitable],
+        *args,
+        priority: Priority = Priority.BATCH,
+        name: Optional[str] = None,
+    ) -> asyncio.Future:
+        """Queue fn(*args), waiting for room; returns a future of its result"""
+        target = self._queues[queue]
+        job = self._job(queue, fn, args, priority, name)
+        await target.jobs.put(job)
+        target.submitted += 1
+        return job.future
+
+    def submit_nowait(
+        self,
+        queue: str,
+        fn: Callable[..., Awaitable],
+        *args,
+        priority: Priority = Priority.BATCH,
+        name: Optional[str] = None,
+    ) -> asyncio.Future:
+        """Queue fn(*args) or raise SchedulerBusy; returns a future of its result"""
+        target = self._queues[queue]
+        job = self._job(queue, fn, args, priority, name)
+        try:
+            target.jobs.put_nowait(job)
+        except asyncio.QueueFull:
+            target.rejected += 1
+            job.future.cancel()
+            raise SchedulerBusy(f"Queue {queue} is full")
+        target.submitted += 1
+        return job.future
+
+    async def _work(self, queue: _Queue) -> None:
+        while True:
+            job = await queue.jobs.get()
+            try:
+                if job.future.cancelled():
+                    continue
+                started = job.started_at = time.monotonic()
+                waited = started - job.submitted_at
+                queue.wait_seconds += waited
+                queue.max_wait_seconds = max(queue.max_wait_seconds, waited)
+                queue.running[job.seq] = job
+                try:
+                    result = await job.fn(*job.args)
+                except asyncio.CancelledError:
+                    job.future.cancel()
+                    raise
+                except Exception as e:
+                    logger.exception("Scheduled job %s failed", job.name)
+                    queue.failed += 1
+                    if not job.future.done():
+                        job.future.set_exception(e)
+                else:
+                    queue.completed += 1
+                    if not job.future.done():
+                        job.future.set_result(result)
+                finally:
+                    queue.running.pop(job.seq, None)
+                    queue.run_seconds += time.monotonic() - started
+            finally:
+                queue.jobs.task_done()
+
+    async def _tick(self, periodic: _Periodic) -> None:
+        while True:
+            if periodic.last is not None and not periodic.last.done():
+                periodic.skipped += 1
+            else:
+                try:
+                    periodic.last = self.submit_nowait(
+                        periodic.queue,
+                        periodic.fn,
+                        priority=periodic.priority,
+                        name=periodic.name,
+                    )
+                    periodic.last.add_done_callback(
+                        lambda future: self._record_run(periodic, future)
+                    )
+                    periodic.last_started = time.monotonic()
+                except SchedulerBusy:
+                    periodic.skipped += 1
+            await asyncio.sleep(periodic.interval)
+
+    @staticmethod
+    def _record_run(periodic: _Periodic, future: asyncio.Future) -> None:
+        if future.cancelled():
+            return
+        periodic.runs += 1
+        error = future.exception()
+        periodic.last_error = repr(error) if error else None
+
+    def start(self) -> None:
+        if self.started:
+            return
+        for queue in self._queues.values():
+            queue.workers = [
+                asyncio.create_task(self._work(queue)) for _ in range(queue.concurrency)
+            ]
+        for periodic in self._periodic.values():
+            periodic.task = asyncio.create_task(self._tick(periodic))
+        self.started = True
+
+    async def shutdown(self) -> None:
+        """Stop periodic jobs and workers; queued jobs are cancelled"""
+        tasks = [p.task for p in self._periodic.values() if p.task]
+        for queue in self._queues.values():
+            tasks.extend(queue.workers)
+            queue.workers = []
+            while not queue.jobs.empty():
+                queue.jobs.get_nowait().future.cancel()
+                queue.jobs.task_done()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self.started = False
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "queues": {name: queue.stats() for name, queue in self._queues.items()},
+            "periodic": {
+                name: periodic.stats() for name, periodic in self._periodic.items()
+            },
+        }
+
+
+settings = get_settings()
+scheduler = Scheduler()
+# Short housekeeping jobs: replica health checks, expiry sweeps
+scheduler.add_queue("maintenance", concurrency=1, maxsize=100)
+# Catalog change propagation; serial, so versions are carried over in order
+scheduler.add_queue("catalog", concurrency=1, maxsize=1000)
+scheduler.add_queue(
+    "recommendations",
+    concurrency=settings.RECOMMENDATION_WORKERS,
+    maxsize=settings.RECOMMENDATION_QUEUE_SIZE,
+)
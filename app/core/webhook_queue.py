@@ -0,0 +1,235 @@
+# app/core/webhook_queue.py
+from collections import deque
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from uuid import UUID
+import asyncio
+import logging
+import time
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import get_settings
+from app.db.crud import (
+    claim_webhook_submissions,
+    complete_webhook_submissions,
+    enqueue_webhook_submission,
+    fail_webhook_submission,
+    get_webhook_queue_depth,
+)
+from app.db.database import AsyncSessionLocal
+from app.db.models import SubmissionStatus
+
+logger = logging.getLogger(__name__)
+
+# Processes one submitter's claimed rows, oldest first, as a single step;
+# commits its own work
+SubmissionHandler = Callable[[AsyncSession, List[Any]], Awaitable[None]]
+
+# Throughput is reported over this many trailing seconds
+THROUGHPUT_WINDOW = 60.0
+
+
+class PermanentSubmissionError(Exception):
+    """Raised by a handler for a submission that can never succeed"""
+
+
+class WebhookQueue:
+    """Drains webhook_submissions with a pool of in-process workers
+
+    Webhooks only insert a row; workers claim due rows in batches, hand the
+    rows of each submitter to the handler together and record the outcome.
+    New rows are due after coalesce_delay seconds, so a burst from one
+    submitter is processed once. A failed submission is retried
+    with exponential backoff and dead-lettered after max_attempts. Delivery
+    is at least once: a worker that dies mid-batch leaves its claim to
+    expire after the lease, and the batch is processed again.
+    """
+
+    def __init__(
+        self,
+        batch_size: int,
+        poll_interval: float,
+        lease: float,
+        max_attempts: int,
+        retry_backoff: float,
+        dedup_window: float,
+        coalesce_delay: float,
+    ):
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.lease = lease
+        self.max_attempts = max_attempts
+        self.retry_backoff = retry_backoff
+        self.dedup_window = dedup_window
+        self.coalesce_delay = coalesce_delay
+        self._wakeup = asyncio.Event()
+        self._workers: List[asyncio.Task] = []
+        # (monotonic time, submissions processed) per batch
+        self._recent: deque = deque()
+        self.enqueued = 0
+        self.duplicates = 0
+        self.processed = 0
+        self.coalesced = 0
+        self.retried = 0
+        self.dead_lettered = 0
+        self.batches = 0
+        self.last_batch_seconds = 0.0
+
+    async def enqueue(
+        self, db: AsyncSession, email: str, answers: Dict[str, Dict[str, int]]
+    ) -> Tuple[UUID, bool]:
+        """
+        Store a submission, or find its duplicate within the dedup window
+        Returns (submission id, whether it was stored now)
+        """
+        submission_id, stored = await enqueue_webhook_submission(
+            db, email, answers, self.dedup_window, self.coalesce_delay
+        )
+        if stored:
+            self.enqueued += 1
+            # Wake a worker when the submission falls due
+            asyncio.get_running_loop().call_later(self.coalesce_delay, self.notify)
+        else:
+            self.duplicates += 1
+        return submission_id, stored
+
+    def notify(self) -> None:
+        """Wake idle workers, e.g. after dead letters were requeued"""
+        self._wakeup.set()
+
+    def start(self, handler: SubmissionHandler, workers: int) -> None:
+        for _ in range(workers):
+            self._workers.append(asyncio.create_task(self._work(handler)))
+
+    async def shutdown(self) -> None:
+        """Stop the workers; claimed rows are retried once their lease expires"""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers.clear()
+
+    async def _work(self, handler: SubmissionHandler) -> None:
+        while True:
+            self._wakeup.clear()
+            try:
+                claimed = await self.process_batch(handler)
+            except Exception:
+                logger.exception("Webhook queue batch failed")
+                claimed = 0
+            if claimed < self.batch_size:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+
+    def _retry_in(self, attempts: int) -> Optional[float]:
+        if attempts >= self.max_attempts:
+            return None
+        return self.retry_backoff * 2 ** (attempts - 1)
+
+    async def process_batch(self, handler: SubmissionHandler) -> int:
+        """Claim and process one batch; returns how many rows were claimed"""
+        async with AsyncSessionLocal() as db:
+            batch = await claim_webhook_submissions(db, self.batch_size, self.lease)
+            if not batch:
+                return 0
+
+            started = time.monotonic()
+            by_email: Dict[str, List[Any]] = {}
+            for submission in batch:
+                by_email.setdefault(submission.email, []).append(submission)
+
+            done = []
+            for submissions in by_email.values():
+                try:
+                    await handler(db, submissions)
+                    done.extend(submission.id for submission in submissions)
+                except Exception as e:
+                    await db.rollback()
+                    for submission in submissions:
+                        await self._fail(db, submission, e)
+            await complete_webhook_submissions(db, done)
+
+        now = time.monotonic()
+        self.batches += 1
+        self.processed += len(done)
+        self.coalesced += len(batch) - len(by_email)
+        self.last_batch_seconds = now - started
+        self._recent.append((now, len(done)))
+        return len(batch)
+
+    async def _fail(self, db: AsyncSession, submission: Any, error: Exception):
+        retry_in = (
+            None
+            if isinstance(error, PermanentSubmissionError)
+            else self._retry_in(submission.attempts)
+        )
+        if retry_in is None:
+            logger.error(
+                "Dead-lettering webhook submission %s after %d attempts: %s",
+                submission.id,
+                submission.attempts,
+                error,
+            )
+            self.dead_lettered += 1
+        else:
+            logger.warning(
+                "Webhook submission %s failed (attempt %d), retrying in %.1fs: %s",
+                submission.id,
+                submission.attempts,
+                retry_in,
+                error,
+            )
+            self.retried += 1
+        await fail_webhook_submission(
+            db, submission.id, str(error) or type(error).__name__, retry_in
+        )
+
+    def _throughput(self) -> float:
+        """Submissions processed per second over the trailing window"""
+        cutoff = time.monotonic() - THROUGHPUT_WINDOW
+        while self._recent and self._recent[0][0] < cutoff:
+            self._recent.popleft()
+        return sum(count for _, count in self._recent) / THROUGHPUT_WINDOW
+
+    async def stats(self, db: AsyncSession) -> Dict[str, Any]:
+        """Backlog and lag from the table, throughput counters from this process"""
+        depth = await get_webhook_queue_depth(db)
+        pending = depth.get(SubmissionStatus.PENDING.value, {})
+        oldest = pending.get("oldest")
+        return {
+            "pending": pending.get("count", 0),
+            "processing": depth.get(SubmissionStatus.PROCESSING.value, {}).get(
+                "count", 0
+            ),
+            "dead": depth.get(SubmissionStatus.DEAD.value, {}).get("count", 0),
+            # Age of the oldest submission still waiting
+            "lag_seconds": (
+                round((datetime.utcnow() - oldest).total_seconds(), 3)
+                if oldest
+                else 0.0
+            ),
+            "workers": len(self._workers),
+            "enqueued": self.enqueued,
+            "duplicates": self.duplicates,
+            "processed": self.processed,
+            "coalesced": self.coalesced,
+            "retried": self.retried,
+            "dead_lettered": self.dead_lettered,
+            "batches": self.batches,
+            "last_batch_seconds": round(self.last_batch_seconds, 4),
+            "throughput_per_second": round(self._throughput(), 3),
+        }
+
+
+settings = get_settings()
+webhook_queue = WebhookQueue(
+    batch_size=settings.WEBHOOK_BATCH_SIZE,
+    poll_interval=settings.WEBHOOK_POLL_INTERVAL,
+    lease=settings.WEBHOOK_LEASE,
+    max_attempts=settings.WEBHOOK_MAX_ATTEMPTS,
+    retry_backoff=settings.WEBHOOK_RETRY_BACKOFF,
+    dedup_window=settings.WEBHOOK_DEDUP_WINDOW,
+    coalesce_delay=settings.WEBHOOK_COALESCE_DELAY,
+)
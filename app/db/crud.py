@@ -1,12 +1,47 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update
-from sqlalchemy.orm import joinedload
-from typing import Optional, List, Dict
+from sqlalchemy import (
+    select,
+    update,
+    delete,
+    func,
+    case,
+    and_,
+    or_,
+    event,
+    exists,
+    inspect,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session, aliased, joinedload
+from typing import Optional, List, Dict, Tuple, AsyncIterator, Any, Callable
 from uuid import UUID
-from datetime import datetime
+from datetime import datetime, timedelta
+import hashlib
+import json
+import logging
 
-from app.db.models import User, Company, JobPosting, JobApplication
+from app.db.models import (
+    User,
+    Company,
+    JobPosting,
+    JobApplication,
+    ApplicationStatus,
+    JobApplicationStats,
+    JobStatus,
+    CatalogState,
+    RecommendationSnapshot,
+    RecommendationSnapshotJob,
+    SubmissionStatus,
+    WebhookSubmission,
+)
 from app.core.dimensions import AssessmentType
+from app.core.cache import UserProfile, catalog_version_cache, profile_cache
+
+logger = logging.getLogger(__name__)
+
+# Applications matching at least this well count as high matches
+HIGH_MATCH_THRESHOLD = 0.8
 
 
 async def get_user_by_email(db: AsyncSession, email: str) -> Optional[User]:
@@ -18,6 +53,67 @@ async def get_user_by_email(db: AsyncSession, email: str) -> Optional[User]:
     return result.scalar_one_or_none()
 
 
+async def get_cached_user(db: AsyncSession, email: str) -> Optional[UserProfile]:
+    """
+    Get a user's profile snapshot by email, served from the profile cache
+    Returns None if user doesn't exist
+    """
+    profile = profile_cache.by_email(email)
+    if profile is None:
+        user = await get_user_by_email(db, email)
+        if user:
+            profile = profile_cache.put(UserProfile.from_user(user))
+    return profile
+
+
+async def get_cached_user_by_id(
+    db: AsyncSession, user_id: UUID
+) -> Optional[UserProfile]:
+    """
+    Get a user's profile snapshot by id, served from the profile cache
+    Returns None if user doesn't exist
+    """
+    profile = profile_cache.by_id(user_id)
+    if profile is None:
+        user = await db.get(User, user_id)
+        if user:
+            profile = profile_cache.put(UserProfile.from_user(user))
+    return profile
+
+
+async def get_cached_users(
+    db: AsyncSession, emails: List[str]
+) -> Dict[str, UserProfile]:
+    """
+    Get profile snapshots for many emails; cache misses share one IN query
+    Returns dict of email -> profile (unknown emails are absent)
+    """
+    profiles = {}
+    missing = []
+    for email in set(emails):
+        profile = profile_cache.by_email(email)
+        if profile is None:
+            missing.append(email)
+        else:
+            profiles[email] = profile
+
+    if missing:
+        result = await db.execute(select(User).where(User.email.in_(missing)))
+        for user in result.scalars():
+            profiles[user.email] = profile_cache.put(UserProfile.from_user(user))
+    return profiles
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _invalidate_cached_profile(mapper, connection, user: User) -> None:
+    """Drop cached snapshots whenever a user row changes through the ORM"""
+    profile_cache.invalidate(email=user.email, user_id=user.id)
+    # A changed email leaves the snapshot cached under the old one too
+    for previous_email in inspect(user).attrs.email.history.deleted:
+        profile_cache.invalidate(email=previous_email)
+
+
 async def create_user(db: AsyncSession, email: str, name: Optional[str] = None) -> User:
     """
     Create new user
@@ -53,20 +149,34 @@ async def update_user_assessment(
     Update user's assessment profile
     Returns updated user
     """
-    user = await db.get(User, user_id)
+    return await update_user_assessments(db, user_id, {assessment_type: profile_data})
+
+
+async def update_user_assessments(
+    db: AsyncSession, user_id: UUID, profiles: Dict[AssessmentType, Dict]
+) -> User:
+    """
+    Update several assessment profiles of a user in one transaction
+    Returns updated user
+    """
+    # Lock the row so concurrent submissions get distinct profile versions
+    user = await db.get(User, user_id, with_for_update=True, populate_existing=True)
     if not user:
         raise ValueError(f"User {user_id} not found")
 
     # Update appropriate profile based on assessment type
-    if assessment_type == AssessmentType.WELLBEING:
-        user.wellbeing_profile = profile_data
-    elif assessment_type == AssessmentType.SKILLS:
-        user.skills_profile = profile_data
-    elif assessment_type == AssessmentType.VALUES:
-        user.values_profile = profile_data
+    for assessment_type, profile_data in profiles.items():
+        if assessment_type == AssessmentType.WELLBEING:
+            user.wellbeing_profile = profile_data
+        elif assessment_type == AssessmentType.SKILLS:
+            user.skills_profile = profile_data
+        elif assessment_type == AssessmentType.VALUES:
+            user.values_profile = profile_data
+    user.profile_version = (user.profile_version or 0) + 1
 
     await db.commit()
-    await db.refresh(user)
+    # Write-through: the committed values are current, no refresh needed
+    profile_cache.put(UserProfile.from_user(user))
     return user
 
 
@@ -96,30 +206,146 @@ async def get_active_jobs(
     result = await db.execute(
         select(JobPosting)
         .options(joinedload(JobPosting.company))
+        .where(JobPosting.status == JobStatus.ACTIVE.value)
+        .order_by(JobPosting.created_at.desc(), JobPosting.id)
         .offset(skip)
         .limit(limit)
     )
     return result.scalars().all()
 
 
+def _insert(db: AsyncSession):
+    """
+    Get the dialect-specific insert construct (supports ON CONFLICT)
+    Falls back to the PostgreSQL construct for anything but SQLite
+    """
+    if db.bind is not None and db.bind.dialect.name == "sqlite":
+        return sqlite_insert
+    return pg_insert
+
+
+async def get_application_context(
+    db: AsyncSession, email: str, job_id: UUID
+) -> Optional[Tuple[User, JobPosting, Company]]:
+    """
+    Get user, job posting and the job's company in a single query
+    Returns None if the user or the job doesn't exist
+    """
+    result = await db.execute(
+        select(User, JobPosting, Company)
+        .select_from(JobPosting)
+        .join(Company, JobPosting.company_id == Company.id)
+        .join(User, User.email == email)
+        .where(JobPosting.id == job_id)
+    )
+    row = result.first()
+    return tuple(row) if row else None
+
+
 async def create_job_application(
-    db: AsyncSession, user_id: UUID, job_id: UUID, match_scores: Dict
-) -> JobApplication:
+    db: AsyncSession,
+    user_id: UUID,
+    job_id: UUID,
+    match_scores: Dict,
+    idempotency_key: Optional[str] = None,
+) -> Tuple[JobApplication, bool]:
     """
-    Create new job application
-    Returns created application
+    Create new job application with a single INSERT ... ON CONFLICT DO NOTHING
+    Returns (application, created); on conflict the existing application is
+    returned with created=False
     """
-    application = JobApplication(
-        user_id=user_id,
-        job_id=job_id,
-        skills_match=match_scores.get("skills_match", 0),
-        wellbeing_match=match_scores.get("wellbeing_match", 0),
-        values_match=match_scores.get("values_match", 0),
-        overall_match=match_scores.get("overall_match", 0),
+    stmt = (
+        _insert(db)(JobApplication)
+        .values(
+            user_id=user_id,
+            job_id=job_id,
+            status=ApplicationStatus.PENDING.value,
+            idempotency_key=idempotency_key,
+            skills_match=match_scores.get("skills_match", 0),
+            wellbeing_match=match_scores.get("wellbeing_match", 0),
+            values_match=match_scores.get("values_match", 0),
+            overall_match=match_scores.get("overall_match", 0),
+        )
+        .on_conflict_do_nothing(index_elements=["user_id", "job_id"])
+        .returning(JobApplication)
+    )
+    application = (await db.scalars(stmt)).one_or_none()
+    created = application is not None
+
+    if created:
+        await _bump_application_stats(
+            db, job_id, application.status, application.overall_match, 1
+        )
+    else:
+        application = await get_application(db, user_id, job_id)
+
+    await db.commit()
+    return application, created
+
+
+async def _bump_application_stats(
+    db: AsyncSession,
+    job_id: UUID,
+    status: str,
+    overall_match: Optional[float],
+    delta: int,
+) -> None:
+    """
+    Add (delta=1) or remove (delta=-1) one application in the stats rollup
+    Runs inside the caller's transaction; the caller commits
+    """
+    scored = overall_match is not None
+    high = scored and overall_match >= HIGH_MATCH_THRESHOLD
+    values = {
+        "application_count": delta,
+        "scored_count": delta if scored else 0,
+        "match_sum": delta * (overall_match or 0.0),
+        "high_match_count": delta if high else 0,
+    }
+
+    company_id = (
+        select(JobPosting.company_id).where(JobPosting.id == job_id).scalar_subquery()
+    )
+    stmt = _insert(db)(JobApplicationStats).values(
+        job_id=job_id, status=status, company_id=company_id, **values
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["job_id", "status"],
+        set_={
+            column: getattr(JobApplicationStats, column)
+            + getattr(stmt.excluded, column)
+            for column in values
+        },
+    )
+    await db.execute(stmt)
+
+
+async def update_application_status(
+    db: AsyncSession, application_id: UUID, status: str
+) -> Optional[JobApplication]:
+    """
+    Change an application's status and move it between stats rollup rows
+    Returns None if application doesn't exist
+    """
+    result = await db.execute(
+        select(JobApplication)
+        .where(JobApplication.id == application_id)
+        .with_for_update()
     )
-    db.add(application)
+    application = result.scalar_one_or_none()
+    if not application:
+        return None
+
+    if application.status != status:
+        await _bump_application_stats(
+            db, application.job_id, application.status, application.overall_match, -1
+        )
+        await _bump_application_stats(
+            db, application.job_id, status, application.overall_match, 1
+        )
+        application.status = status
+
     await db.commit()
-    await db.refresh(application)
     return application
 
 
@@ -135,6 +361,161 @@ async def get_company_by_id(db: AsyncSession, company_id: UUID) -> Optional[Comp
     return result.scalar_one_or_none()
 
 
+# Catalog listing columns; the JSON profile/requirement blobs are only
+# selected when a caller asks for them
+COMPANY_COLUMNS = (
+    Company.id,
+    Company.name,
+    Company.description,
+    Company.industry,
+    Company.location,
+    Company.logo_url,
+)
+COMPANY_PROFILE_COLUMNS = (Company.wellbeing_profile, Company.values_profile)
+JOB_COLUMNS = (
+    JobPosting.id,
+    JobPosting.company_id,
+    JobPosting.title,
+    JobPosting.description,
+    JobPosting.created_at,
+    JobPosting.salary_range,
+    JobPosting.remote_policy,
+    JobPosting.application_deadline,
+)
+JOB_REQUIREMENT_COLUMNS = (
+    JobPosting.skills_requirements,
+    JobPosting.wellbeing_preferences,
+    JobPosting.values_alignment,
+)
+
+
+async def get_companies_page(
+    db: AsyncSession,
+    limit: int = 50,
+    after: Optional[UUID] = None,
+    include_profiles: bool = False,
+) -> List[Any]:
+    """
+    Get one keyset page of companies ordered by id
+    Returns up to limit + 1 rows (the extra row signals a next page)
+    """
+    columns = COMPANY_COLUMNS + (COMPANY_PROFILE_COLUMNS if include_profiles else ())
+    query = select(*columns).order_by(Company.id).limit(limit + 1)
+    if after is not None:
+        query = query.where(Company.id > after)
+
+    result = await db.execute(query)
+    return result.all()
+
+
+async def get_active_job_counts(
+    db: AsyncSession, company_ids: List[UUID]
+) -> Dict[UUID, int]:
+    """
+    Count active job postings per company
+    Returns dict of company_id -> count (companies without jobs are absent)
+    """
+    result = await db.execute(
+        select(JobPosting.company_id, func.count(JobPosting.id))
+        .where(
+            JobPosting.company_id.in_(company_ids),
+            JobPosting.status == JobStatus.ACTIVE.value,
+        )
+        .group_by(JobPosting.company_id)
+    )
+    return dict(result.all())
+
+
+async def get_latest_active_jobs(
+    db: AsyncSession,
+    company_ids: List[UUID],
+    per_company: int = 10,
+    include_requirements: bool = False,
+) -> Dict[UUID, List[Any]]:
+    """
+    Get each company's newest active job postings, at most per_company each
+    Returns dict of company_id -> job rows, newest first
+    """
+    columns = JOB_COLUMNS + (JOB_REQUIREMENT_COLUMNS if include_requirements else ())
+    ranked = (
+        select(
+            *columns,
+            func.row_number()
+            .over(
+                partition_by=JobPosting.company_id,
+                order_by=(JobPosting.created_at.desc(), JobPosting.id),
+            )
+            .label("rank"),
+        )
+        .where(
+            JobPosting.company_id.in_(company_ids),
+            JobPosting.status == JobStatus.ACTIVE.value,
+        )
+        .subquery()
+    )
+    result = await db.execute(
+        select(*[ranked.c[column.key] for column in columns])
+        .where(ranked.c.rank <= per_company)
+        .order_by(ranked.c.company_id, ranked.c.rank)
+    )
+
+    jobs = {}
+    for row in result.all():
+        jobs.setdefault(row.company_id, []).append(row)
+    return jobs
+
+
+async def stream_companies(
+    db: AsyncSession,
+    after: Optional[UUID] = None,
+    include_profiles: bool = False,
+    batch_size: int = 200,
+) -> AsyncIterator[List[Any]]:
+    """
+    Stream companies ordered by id through a server-side cursor
+    Yields lists of at most batch_size company rows
+    """
+    columns = COMPANY_COLUMNS + (COMPANY_PROFILE_COLUMNS if include_profiles else ())
+    query = select(*columns).order_by(Company.id)
+    if after is not None:
+        query = query.where(Company.id > after)
+
+    result = await db.stream(query.execution_options(yield_per=batch_size))
+    async for batch in result.partitions():
+        yield batch
+
+
+async def stream_active_jobs_with_companies(
+    db: AsyncSession, batch_size: int = 200
+) -> AsyncIterator[List[Tuple[JobPosting, Company]]]:
+    """
+    Stream active job postings with their company, newest first
+    Yields lists of at most batch_size (job, company) pairs
+    """
+    result = await db.stream(
+        select(JobPosting, Company)
+        .join(Company)
+        .where(JobPosting.status == JobStatus.ACTIVE.value)
+        .order_by(JobPosting.created_at.desc(), JobPosting.id)
+        .execution_options(yield_per=batch_size)
+    )
+    async for batch in result.partitions():
+        yield [tuple(row) for row in batch]
+
+
+async def get_jobs_with_companies(
+    db: AsyncSession, job_ids: List[UUID]
+) -> Dict[UUID, Tuple[JobPosting, Company]]:
+    """
+    Get many job postings with their companies in one IN query
+    Returns dict of job_id -> (job, company) (unknown ids are absent)
+    """
+    result = await db.execute(
+        select(JobPosting, Company).join(Company).where(JobPosting.id.in_(set(job_ids)))
+    )
+    return {job.id: (job, company) for job, company in result.all()}
+
+
 async def get_job_posting(db: AsyncSession, job_id: UUID) -> Optional[JobPosting]:
     """
     Get job posting by ID with company data
@@ -148,30 +529,338 @@ async def get_job_posting(db: AsyncSession, job_id: UUID) -> Optional[JobPosting
     return result.scalar_one_or_none()
 
 
-async def get_application_stats(db: AsyncSession, job_id: UUID) -> Dict:
+async def set_job_status(
+    db: AsyncSession, job_id: UUID, status: JobStatus
+) -> Optional[JobPosting]:
+    """
+    Pause, reactivate or expire a job posting
+    Returns None if job doesn't exist
+    """
+    job = await db.get(JobPosting, job_id)
+    if not job:
+        return None
+
+    job.status = status.value
+    await bump_catalog_version(db, [job_id])
+    await db.commit()
+    return job
+
+
+async def update_job_posting(
+    db: AsyncSession, job_id: UUID, fields: Dict[str, Any]
+) -> Optional[JobPosting]:
+    """
+    Update a job posting's fields (title, requirements, ...)
+    Returns None if job doesn't exist
+    """
+    job = await db.get(JobPosting, job_id)
+    if not job:
+        return None
+
+    for name, value in fields.items():
+        setattr(job, name, value)
+    await bump_catalog_version(db, [job_id])
+    await db.commit()
+    return job
+
+
+async def update_company(
+    db: AsyncSession, company_id: UUID, fields: Dict[str, Any]
+) -> Optional[Company]:
+    """
+    Update a company's fields (name, profiles, ...); changes all its active jobs
+    Returns None if company doesn't exist
+    """
+    company = await db.get(Company, company_id)
+    if not company:
+        return None
+
+    for name, value in fields.items():
+        setattr(company, name, value)
+    job_ids = await db.scalars(
+        select(JobPosting.id).where(
+            JobPosting.company_id == company_id,
+            JobPosting.status == JobStatus.ACTIVE.value,
+        )
+    )
+    await bump_catalog_version(db, list(job_ids))
+    await db.commit()
+    return company
+
+
+# catalog_state holds a single row
+CATALOG_STATE_ID = 1
+
+
+async def get_catalog_version(db: AsyncSession) -> int:
+    """
+    Get the catalog version, served from a short-lived in-process cache
+    Returns 0 if the catalog has never been versioned
+    """
+    version = catalog_version_cache.get(CATALOG_STATE_ID)
+    if version is None:
+        version = await db.scalar(
+            select(CatalogState.version).where(CatalogState.id == CATALOG_STATE_ID)
+        )
+        version = version or 0
+        catalog_version_cache.set(CATALOG_STATE_ID, version)
+    return version
+
+
+# Called with (changed job ids, new catalog version) once a catalog change
+# commits. Job ids are None when unknown (e.g. seeding): treat all as changed
+_catalog_listeners: List[Callable[[Optional[List[UUID]], int], None]] = []
+
+
+def on_catalog_change(listener: Callable[[Optional[List[UUID]], int], None]) -> None:
+    """Register a callback run after every committed catalog version bump"""
+    _catalog_listeners.append(listener)
+
+
+async def bump_catalog_version(
+    db: AsyncSession, job_ids: Optional[List[UUID]] = None
+) -> int:
+    """
+    Record that job postings or companies changed, invalidating catalog ETags
+    Runs inside the caller's transaction; the caller commits. Other processes
+    see the new version within CATALOG_VERSION_TTL seconds
+    Returns the new version
+    """
+    now = datetime.utcnow()
+    version = await db.scalar(
+        _insert(db)(CatalogState)
+        .values(id=CATALOG_STATE_ID, version=1, updated_at=now)
+        .on_conflict_do_update(
+            index_elements=["id"],
+            set_={"version": CatalogState.version + 1, "updated_at": now},
+        )
+        .returning(CatalogState.version)
+    )
+    catalog_version_cache.clear()
+    db.info.setdefault("catalog_changes", []).append((job_ids, version))
+    return version
+
+
+@event.listens_for(Session, "after_commit")
+def _notify_catalog_change(session: Session) -> None:
+    for job_ids, version in session.info.pop("catalog_changes", []):
+        for listener in _catalog_listeners:
+            try:
+                listener(job_ids, version)
+            except Exception:
+                logger.exception("Catalog change listener failed")
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_catalog_change(session: Session) -> None:
+    session.info.pop("catalog_changes", None)
+
+
+async def get_recommendation_snapshot(
+    db: AsyncSession, user_id: UUID
+) -> Optional[RecommendationSnapshot]:
+    """
+    Get the user's last computed recommendations
+    Returns None if none have been computed yet
+    """
+    return await db.get(RecommendationSnapshot, user_id)
+
+
+async def save_recommendation_snapshot(
+    db: AsyncSession,
+    user_id: UUID,
+    profile_version: int,
+    catalog_version: int,
+    recommendations: List[Dict],
+    score_bound: Optional[float],
+) -> None:
+    """
+    Store computed recommendations and the jobs they list, unless a newer
+    snapshot is already stored
+    Recommendations must be JSON-safe (ids as strings)
+    """
+    now = datetime.utcnow()
+    stmt = _insert(db)(RecommendationSnapshot).values(
+        user_id=user_id,
+        profile_version=profile_version,
+        catalog_version=catalog_version,
+        recommendations=recommendations,
+        score_bound=score_bound,
+        computed_at=now,
+    )
+    saved = await db.scalar(
+        stmt.on_conflict_do_update(
+            index_elements=["user_id"],
+            set_={
+                "profile_version": stmt.excluded.profile_version,
+                "catalog_version": stmt.excluded.catalog_version,
+                "recommendations": stmt.excluded.recommendations,
+                "score_bound": stmt.excluded.score_bound,
+                "computed_at": stmt.excluded.computed_at,
+            },
+            # A slow task must not overwrite what a later one computed
+            where=(RecommendationSnapshot.profile_version <= profile_version)
+            & (RecommendationSnapshot.catalog_version <= catalog_version),
+        ).returning(RecommendationSnapshot.user_id)
+    )
+    if saved is not None:
+        await db.execute(
+            delete(RecommendationSnapshotJob).where(
+                RecommendationSnapshotJob.user_id == user_id
+            )
+        )
+        if recommendations:
+            await db.execute(
+                _insert(db)(RecommendationSnapshotJob),
+                [
+                    {"job_id": UUID(match["job"]["id"]), "user_id": user_id}
+                    for match in recommendations
+                ],
+            )
+    await db.commit()
+
+
+async def get_snapshots_listing(
+    db: AsyncSession, job_ids: List[UUID], catalog_version: int
+) -> Dict[UUID, int]:
+    """
+    Get the snapshots of the given catalog version that list any of the jobs
+    Returns dict of user_id -> the snapshot's profile_version
+    """
+    result = await db.execute(
+        select(RecommendationSnapshot.user_id, RecommendationSnapshot.profile_version)
+        .join(
+            RecommendationSnapshotJob,
+            RecommendationSnapshotJob.user_id == RecommendationSnapshot.user_id,
+        )
+        .where(
+            RecommendationSnapshotJob.job_id.in_(job_ids),
+            RecommendationSnapshot.catalog_version == catalog_version,
+        )
+        .distinct()
+    )
+    return dict(result.all())
+
+
+async def stream_current_snapshots(
+    db: AsyncSession, catalog_version: int, batch_size: int = 500
+) -> AsyncIterator[Any]:
+    """
+    Stream the snapshots of a catalog version that are current for their
+    user's profile, with the user's assessment profiles
+    Yields (user_id, profile_version, score_bound, wellbeing_profile,
+    skills_profile, values_profile) rows
+    """
+    result = await db.stream(
+        select(
+            RecommendationSnapshot.user_id,
+            RecommendationSnapshot.profile_version,
+            RecommendationSnapshot.score_bound,
+            User.wellbeing_profile,
+            User.skills_profile,
+            User.values_profile,
+        )
+        .join(User, User.id == RecommendationSnapshot.user_id)
+        .where(
+            RecommendationSnapshot.catalog_version == catalog_version,
+            RecommendationSnapshot.profile_version == User.profile_version,
+        )
+        .execution_options(yield_per=batch_size)
+    )
+    async for row in result:
+        yield row
+
+
+# Catalog version of snapshots a catalog change made stale
+STALE_CATALOG_VERSION = -1
+
+
+async def advance_snapshots(
+    db: AsyncSession, previous: int, version: int, stale: List[UUID]
+) -> int:
     """
-    Get application statistics for a job posting
-    Returns dict with stats
+    Carry snapshots of catalog version previous over to version, except the
+    stale ones, which are marked so they're never served
+    Returns the number carried over
     """
+    for start in range(0, len(stale), 1000):
+        await db.execute(
+            update(RecommendationSnapshot)
+            .where(
+                RecommendationSnapshot.user_id.in_(stale[start : start + 1000]),
+                RecommendationSnapshot.catalog_version == previous,
+            )
+            .values(catalog_version=STALE_CATALOG_VERSION)
+        )
     result = await db.execute(
-        select(JobApplication).where(JobApplication.job_id == job_id)
+        update(RecommendationSnapshot)
+        .where(RecommendationSnapshot.catalog_version == previous)
+        .values(catalog_version=version)
     )
-    applications = result.scalars().all()
+    await db.commit()
+    return result.rowcount
 
-    total = len(applications)
-    if total == 0:
-        return {"total_applications": 0, "average_match": 0, "high_match_count": 0}
 
-    matches = [app.overall_match for app in applications]
-    high_matches = sum(1 for m in matches if m >= 0.8)
+async def get_application_stats(db: AsyncSession, job_id: UUID) -> Dict:
+    """
+    Get application statistics for a job posting, aggregated in SQL
+    Returns dict with stats; unscored applications don't affect the average
+    """
+    result = await db.execute(
+        select(
+            func.count(JobApplication.id),
+            func.avg(JobApplication.overall_match),
+            func.sum(
+                case((JobApplication.overall_match >= HIGH_MATCH_THRESHOLD, 1), else_=0)
+            ),
+        ).where(JobApplication.job_id == job_id)
+    )
+    total, average, high_matches = result.one()
 
     return {
         "total_applications": total,
-        "average_match": sum(matches) / total,
-        "high_match_count": high_matches,
+        "average_match": average or 0,
+        "high_match_count": high_matches or 0,
     }
 
 
+async def get_application_stats_by_company(
+    db: AsyncSession, company_id: UUID
+) -> Dict[UUID, Dict]:
+    """
+    Get application statistics for all of a company's jobs from the rollup
+    Returns dict of job_id -> stats (including per-status counts)
+    """
+    result = await db.execute(
+        select(JobApplicationStats).where(JobApplicationStats.company_id == company_id)
+    )
+
+    stats = {}
+    for row in result.scalars():
+        job_stats = stats.setdefault(
+            row.job_id,
+            {
+                "total_applications": 0,
+                "scored_applications": 0,
+                "match_sum": 0.0,
+                "high_match_count": 0,
+                "status_counts": {},
+            },
+        )
+        job_stats["total_applications"] += row.application_count
+        job_stats["scored_applications"] += row.scored_count
+        job_stats["match_sum"] += row.match_sum
+        job_stats["high_match_count"] += row.high_match_count
+        job_stats["status_counts"][row.status] = row.application_count
+
+    for job_stats in stats.values():
+        match_sum = job_stats.pop("match_sum")
+        scored = job_stats.pop("scored_applications")
+        job_stats["average_match"] = match_sum / scored if scored else 0
+
+    return stats
+
+
 async def get_application(
     db: AsyncSession, user_id: UUID, job_id: UUID
 ) -> Optional[JobApplication]:
@@ -183,15 +872,336 @@ async def get_application(
     )
     return result.scalar_one_or_none()
 
+
+# Columns needed to list a company's applicants; avoids loading full entities
+APPLICANT_COLUMNS = (
+    JobApplication.id,
+    JobApplication.job_id,
+    JobPosting.title.label("job_title"),
+    User.email,
+    User.name,
+    JobApplication.skills_match,
+    JobApplication.wellbeing_match,
+    JobApplication.values_match,
+    JobApplication.overall_match,
+    JobApplication.status,
+    JobApplication.created_at,
+)
+
+# Best matches first; id breaks ties so the order is total (keyset-safe)
+APPLICANT_ORDER = (JobApplication.overall_match.desc().nulls_last(), JobApplication.id)
+
+
+def _company_applicants_query(company_id: UUID):
+    return (
+        select(*APPLICANT_COLUMNS)
+        .select_from(JobApplication)
+        .join(JobPosting, JobPosting.id == JobApplication.job_id)
+        .join(User, User.id == JobApplication.user_id)
+        .where(JobPosting.company_id == company_id)
+    )
+
+
+def _after_applicant(overall_match: Optional[float], application_id: UUID):
+    """Keyset predicate for rows after (overall_match, id) in APPLICANT_ORDER"""
+    if overall_match is None:
+        return and_(
+            JobApplication.overall_match.is_(None), JobApplication.id > application_id
+        )
+    return or_(
+        JobApplication.overall_match < overall_match,
+        and_(
+            JobApplication.overall_match == overall_match,
+            JobApplication.id > application_id,
+        ),
+        JobApplication.overall_match.is_(None),
+    )
+
+
 async def get_applications_by_company(
-    db: AsyncSession, company_id: UUID
-) -> List[JobApplication]:
-    """Get all applications for a company's jobs"""
+    db: AsyncSession, company_id: UUID, limit: int = 50
+) -> List[Any]:
+    """
+    Get the first page of applicants for each of a company's jobs
+    Rows are ranked per job in SQL; returns up to limit + 1 rows per job
+    (the extra row tells the caller whether another page exists), ordered
+    by job and match
+    """
+    ranked = (
+        _company_applicants_query(company_id)
+        .add_columns(
+            func.row_number()
+            .over(partition_by=JobApplication.job_id, order_by=APPLICANT_ORDER)
+            .label("rank")
+        )
+        .subquery()
+    )
     result = await db.execute(
-        select(JobApplication)
-        .join(JobPosting)
-        .options(joinedload(JobApplication.user), joinedload(JobApplication.job))
-        .where(JobPosting.company_id == company_id)
-        .order_by(JobApplication.created_at.desc())
+        select(ranked)
+        .where(ranked.c.rank <= limit + 1)
+        .order_by(ranked.c.job_title, ranked.c.job_id, ranked.c.rank)
     )
-    return result.scalars().all()
+    return result.all()
+
+
+async def get_job_applicants_page(
+    db: AsyncSession,
+    company_id: UUID,
+    job_id: UUID,
+    limit: int = 50,
+    after: Optional[Tuple[Optional[float], UUID]] = None,
+) -> List[Any]:
+    """
+    Get one keyset page of applicants for a company's job
+    Returns up to limit + 1 rows after the given (overall_match, id) key
+    """
+    query = _company_applicants_query(company_id).where(JobApplication.job_id == job_id)
+    if after is not None:
+        query = query.where(_after_applicant(*after))
+
+    result = await db.execute(query.order_by(*APPLICANT_ORDER).limit(limit + 1))
+    return result.all()
+
+
+async def stream_applications_by_company(
+    db: AsyncSession, company_id: UUID, batch_size: int = 500
+) -> AsyncIterator[Dict]:
+    """
+    Stream all applicants of a company's jobs through a server-side cursor
+    Yields row mappings ordered by job and match, batch_size rows at a time
+    """
+    result = await db.stream(
+        _company_applicants_query(company_id)
+        .order_by(JobPosting.title, JobApplication.job_id, *APPLICANT_ORDER)
+        .execution_options(yield_per=batch_size)
+    )
+    async for row in result.mappings():
+        yield row
+
+
+def webhook_content_hash(email: str, answers: Dict[str, Dict[str, int]]) -> str:
+    """Digest of a submission's content, independent of key order"""
+    content = json.dumps([email, answers], sort_keys=True, separators=(",", ":"))
+    return hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
+
+
+# A resubmission only matches a latest submission that has or will take
+# effect; after a dead-lettered one it is stored and retried
+_DEDUP_STATUSES = (
+    SubmissionStatus.PENDING.value,
+    SubmissionStatus.PROCESSING.value,
+    SubmissionStatus.DONE.value,
+)
+
+
+async def _latest_webhook_submission(db: AsyncSession, email: str) -> Optional[Any]:
+    """The submitter's latest submission: the one no other follows"""
+    following = aliased(WebhookSubmission)
+    result = await db.execute(
+        select(
+            WebhookSubmission.id,
+            WebhookSubmission.content_hash,
+            WebhookSubmission.status,
+            WebhookSubmission.created_at,
+        ).where(
+            WebhookSubmission.email == email,
+            ~exists().where(
+                following.email == email,
+                following.previous_id == WebhookSubmission.id,
+            ),
+        )
+    )
+    return result.first()
+
+
+async def enqueue_webhook_submission(
+    db: AsyncSession,
+    email: str,
+    answers: Dict[str, Dict[str, int]],
+    dedup_window: float = 0,
+    delay: float = 0,
+) -> Tuple[UUID, bool]:
+    """
+    Durably store a webhook submission for the workers to process, due after
+    delay seconds. If the submitter's latest submission is identical, was
+    stored within the last dedup_window seconds and isn't dead, it is reused
+    instead
+    Returns (submission id, whether it was stored now)
+    """
+    now = datetime.utcnow()
+    content_hash = webhook_content_hash(email, answers)
+    while True:
+        latest = await _latest_webhook_submission(db, email)
+        if (
+            dedup_window > 0
+            and latest is not None
+            and latest.content_hash == content_hash
+            and latest.status in _DEDUP_STATUSES
+            and latest.created_at >= now - timedelta(seconds=dedup_window)
+        ):
+            return latest.id, False
+
+        stmt = (
+            _insert(db)(WebhookSubmission)
+            .values(
+                email=email,
+                answers=answers,
+                content_hash=content_hash,
+                previous_id=latest.id if latest is not None else None,
+                status=SubmissionStatus.PENDING.value,
+                attempts=0,
+                next_attempt_at=now + timedelta(seconds=delay),
+                created_at=now,
+            )
+            .on_conflict_do_nothing()
+            .returning(WebhookSubmission.id)
+        )
+        submission_id = await db.scalar(stmt)
+        await db.commit()
+        if submission_id is not None:
+            return submission_id, True
+        # A concurrent submit appended after the same row first; compare
+        # against that one instead. Every retry follows a stored submission
+
+
+async def claim_webhook_submissions(
+    db: AsyncSession, limit: int, lease: float
+) -> List[Any]:
+    """
+    Claim up to limit due submissions, plus their submitters' other pending
+    ones, for lease seconds
+    Returns (id, email, answers, attempts, created_at) rows, oldest first. A
+    claim whose worker died becomes due again when its lease runs out
+    """
+    now = datetime.utcnow()
+    due = (
+        select(WebhookSubmission.id)
+        .where(
+            # Spelled out so the planner matches ix_webhook_submissions_open
+            WebhookSubmission.status != SubmissionStatus.DONE.value,
+            WebhookSubmission.status.in_(
+                [SubmissionStatus.PENDING.value, SubmissionStatus.PROCESSING.value]
+            ),
+            WebhookSubmission.next_attempt_at <= now,
+        )
+        .order_by(WebhookSubmission.next_attempt_at)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+    claim = (
+        update(WebhookSubmission)
+        .values(
+            status=SubmissionStatus.PROCESSING.value,
+            attempts=WebhookSubmission.attempts + 1,
+            next_attempt_at=now + timedelta(seconds=lease),
+        )
+        .returning(
+            WebhookSubmission.id,
+            WebhookSubmission.email,
+            WebhookSubmission.answers,
+            WebhookSubmission.attempts,
+            WebhookSubmission.created_at,
+        )
+        .execution_options(synchronize_session=False)
+    )
+    result = await db.execute(claim.where(WebhookSubmission.id.in_(due)))
+    rows = result.all()
+
+    # Coalescing: claim the same submitters' other waiting submissions too,
+    # due or not, so one processing step sees all of them in order
+    emails = {row.email for row in rows}
+    if emails:
+        waiting = (
+            select(WebhookSubmission.id)
+            .where(
+                WebhookSubmission.status == SubmissionStatus.PENDING.value,
+                WebhookSubmission.email.in_(emails),
+            )
+            .with_for_update(skip_locked=True)
+        )
+        result = await db.execute(claim.where(WebhookSubmission.id.in_(waiting)))
+        rows.extend(result.all())
+
+    await db.commit()
+    return sorted(rows, key=lambda row: row.created_at)
+
+
+async def complete_webhook_submissions(db: AsyncSession, ids: List[UUID]) -> None:
+    """Mark claimed submissions as processed"""
+    if not ids:
+        return
+    await db.execute(
+        update(WebhookSubmission)
+        .where(WebhookSubmission.id.in_(ids))
+        .values(
+            status=SubmissionStatus.DONE.value,
+            processed_at=datetime.utcnow(),
+            last_error=None,
+        )
+        .execution_options(synchronize_session=False)
+    )
+    await db.commit()
+
+
+async def fail_webhook_submission(
+    db: AsyncSession, submission_id: UUID, error: str, retry_in: Optional[float]
+) -> None:
+    """
+    Record a failed attempt: retry after retry_in seconds, or dead-letter the
+    submission if retry_in is None
+    """
+    now = datetime.utcnow()
+    if retry_in is None:
+        values = {"status": SubmissionStatus.DEAD.value, "processed_at": now}
+    else:
+        values = {
+            "status": SubmissionStatus.PENDING.value,
+            "next_attempt_at": now + timedelta(seconds=retry_in),
+        }
+    await db.execute(
+        update(WebhookSubmission)
+        .where(WebhookSubmission.id == submission_id)
+        .values(last_error=error[:1000], **values)
+        .execution_options(synchronize_session=False)
+    )
+    await db.commit()
+
+
+async def get_webhook_queue_depth(db: AsyncSession) -> Dict[str, Dict]:
+    """
+    Get the number and oldest arrival of unfinished submissions per status
+    Returns dict of status -> {"count", "oldest"}; done rows aren't counted
+    """
+    result = await db.execute(
+        select(
+            WebhookSubmission.status,
+            func.count(),
+            func.min(WebhookSubmission.created_at),
+        )
+        .where(WebhookSubmission.status != SubmissionStatus.DONE.value)
+        .group_by(WebhookSubmission.status)
+    )
+    return {
+        status: {"count": count, "oldest": oldest}
+        for status, count, oldest in result.all()
+    }
+
+
+async def requeue_dead_submissions(db: AsyncSession) -> int:
+    """
+    Give dead-lettered submissions a fresh set of attempts
+    Returns the number requeued
+    """
+    result = await db.execute(
+        update(WebhookSubmission)
+        .where(WebhookSubmission.status == SubmissionStatus.DEAD.value)
+        .values(
+            status=SubmissionStatus.PENDING.value,
+            attempts=0,
+            next_attempt_at=datetime.utcnow(),
+            processed_at=None,
+        )
+        .execution_options(synchronize_session=False)
+    )
+    await db.commit()
+    return result.rowcount
@@ -1,21 +1,119 @@
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker
+from fastapi import Request
+from typing import Dict, List, Optional
+import itertools
+import logging
+import time
 from app.config import get_settings
+from app.db.instrumentation import instrument_engine
 
 settings = get_settings()
+logger = logging.getLogger(__name__)
 
 # Create engine
 engine = create_async_engine(
     settings.DATABASE_URL, echo=True  # Set to False in production
 )
 
+instrument_engine("primary", engine)
+
 # Create session
 AsyncSessionLocal = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
 
+class ReplicaRouter:
+    """
+    Hands out session factories for read-only work: round-robin over the
+    healthy replicas, falling back to the primary when none are healthy or
+    when the user wrote recently (read-your-writes)
+    """
+
+    def __init__(self, urls: List[str], read_your_writes_window: float):
+        self.engines = [create_async_engine(url, echo=engine.echo) for url in urls]
+        for idx, replica in enumerate(self.engines):
+            instrument_engine(f"replica{idx}", replica)
+        self.session_factories = [
+            sessionmaker(replica, class_=AsyncSession, expire_on_commit=False)
+            for replica in self.engines
+        ]
+        self.healthy = [True] * len(self.engines)
+        self.read_your_writes_window = read_your_writes_window
+        self._turn = itertools.count()
+        self._recent_writes: Dict[str, float] = {}
+
+    def mark_write(self, user_key: str) -> None:
+        """Route user_key's reads to the primary for the read-your-writes window"""
+        if not self.engines:
+            return
+        now = time.monotonic()
+        if len(self._recent_writes) > 10_000:
+            cutoff = now - self.read_your_writes_window
+            self._recent_writes = {
+                key: at for key, at in self._recent_writes.items() if at > cutoff
+            }
+        self._recent_writes[user_key] = now
+
+    def _wrote_recently(self, user_key: Optional[str]) -> bool:
+        written_at = self._recent_writes.get(user_key) if user_key else None
+        return (
+            written_at is not None
+            and time.monotonic() - written_at < self.read_your_writes_window
+        )
+
+    def session_factory(self, user_key: Optional[str] = None) -> sessionmaker:
+        """Pick the session factory for a read on behalf of user_key"""
+        if self._wrote_recently(user_key):
+            return AsyncSessionLocal
+
+        healthy = [idx for idx, ok in enumerate(self.healthy) if ok]
+        if not healthy:
+            return AsyncSessionLocal
+        return self.session_factories[healthy[next(self._turn) % len(healthy)]]
+
+    async def check_health(self) -> None:
+        """Probe every replica with SELECT 1 and update its health flag"""
+        for idx, replica in enumerate(self.engines):
+            try:
+                async with replica.connect() as conn:
+                    await conn.execute(text("SELECT 1"))
+                healthy = True
+            except Exception:
+                healthy = False
+            if healthy != self.healthy[idx]:
+                logger.warning(
+                    "Replica %s is now %s",
+                    replica.url.render_as_string(hide_password=True),
+                    "healthy" if healthy else "unhealthy",
+                )
+            self.healthy[idx] = healthy
+
+    async def dispose(self) -> None:
+        for replica in self.engines:
+            await replica.dispose()
+
+
+replica_router = ReplicaRouter(
+    settings.DATABASE_REPLICA_URLS, settings.READ_YOUR_WRITES_WINDOW
+)
+
+
 async def get_db():
     async with AsyncSessionLocal() as session:
         try:
             yield session
         finally:
             await session.close()
+
+
+async def get_read_db(request: Request):
+    """Session for read-only endpoints, served by a replica when configured"""
+    user_key = request.path_params.get("user_email") or request.query_params.get(
+        "user_email"
+    )
+    async with replica_router.session_factory(user_key)() as session:
+        try:
+            yield session
+        finally:
+            await session.close()
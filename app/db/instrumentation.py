@@ -0,0 +1,203 @@
+# app/db/instrumentation.py
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+import logging
+import time
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.config import get_settings
+from app.core.metrics import (
+    db_query_budget_exceeded,
+    db_query_duration,
+    db_repeated_statements,
+    registry,
+)
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+# Longest statement text put in a log line
+STATEMENT_LOG_LENGTH = 500
+
+
+@dataclass
+class QueryStats:
+    """Statements executed on behalf of one request (or one tracked block)
+
+    Statements are counted per text: SQLAlchemy renders one statement shape
+    to the same text whatever its parameters, so a text executed many times
+    in one request is a loop issuing a query per item (N+1).
+    """
+
+    count: int = 0
+    seconds: float = 0.0
+    statements: Dict[str, int] = field(default_factory=dict)
+    # The enclosing tracked block, which counts these statements too
+    parent: Optional["QueryStats"] = None
+
+    def record(self, statement: str, seconds: float) -> None:
+        stats = self
+        while stats is not None:
+            stats.count += 1
+            stats.seconds += seconds
+            stats.statements[statement] = stats.statements.get(statement, 0) + 1
+            stats = stats.parent
+
+    def repeated(self, threshold: int) -> List[Tuple[str, int]]:
+        """Statements executed at least threshold times, most repeated first"""
+        return sorted(
+            (
+                (statement, count)
+                for statement, count in self.statements.items()
+                if count >= threshold
+            ),
+            key=lambda repeat: repeat[1],
+            reverse=True,
+        )
+
+
+current_query_stats: ContextVar[Optional[QueryStats]] = ContextVar(
+    "current_query_stats", default=None
+)
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """Count the statements executed in the block (and the tasks it starts)
+
+    The metrics middleware tracks every request this way; tests can wrap a
+    request to assert on its statements. Blocks nest: an enclosing block also
+    counts what an inner one does.
+    """
+    stats = QueryStats(parent=current_query_stats.get())
+    token = current_query_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        current_query_stats.reset(token)
+
+
+def query_budget(statements: int) -> Callable:
+    """Declare the most statements an endpoint may execute per request
+
+    Put it under the route decorator. Requests over budget are logged and
+    counted in db_query_budget_exceeded_total.
+    """
+
+    def decorate(endpoint: Callable) -> Callable:
+        endpoint.query_budget = statements
+        return endpoint
+
+    return decorate
+
+
+def get_query_budget(endpoint: Any) -> Optional[int]:
+    return getattr(endpoint, "query_budget", None)
+
+
+def check_request_queries(stats: QueryStats, route: str, endpoint: Any) -> None:
+    """Flag a finished request's repeated statements and budget overrun"""
+    for statement, count in stats.repeated(settings.N_PLUS_ONE_THRESHOLD):
+        db_repeated_statements.inc((route,))
+        logger.warning(
+            "Possible N+1 in %s: statement executed %d times: %s",
+            route,
+            count,
+            _shorten(statement),
+        )
+
+    budget = get_query_budget(endpoint)
+    if budget is not None and stats.count > budget:
+        db_query_budget_exceeded.inc((route,))
+        logger.warning(
+            "%s executed %d statements, over its budget of %d",
+            route,
+            stats.count,
+            budget,
+        )
+
+
+def _shorten(statement: str) -> str:
+    statement = " ".join(statement.split())
+    if len(statement) > STATEMENT_LOG_LENGTH:
+        return statement[:STATEMENT_LOG_LENGTH] + "..."
+    return statement
+
+
+def _redact(parameters: Any) -> Any:
+    """Parameters with every value replaced by its type name"""
+    if isinstance(parameters, dict):
+        return {key: type(value).__name__ for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [type(value).__name__ for value in parameters]
+    return type(parameters).__name__
+
+
+def redact_parameters(parameters: Any, executemany: bool) -> str:
+    """Loggable description of a statement's parameters, values left out"""
+    if executemany:
+        rows = list(parameters or ())
+        first = _redact(rows[0]) if rows else None
+        return f"{len(rows)} rows of {first}"
+    return str(_redact(parameters))
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, many):
+    conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, many):
+    elapsed = time.perf_counter() - conn.info["query_started_at"].pop()
+    db_query_duration.observe((), elapsed)
+    stats = current_query_stats.get()
+    if stats is not None:
+        stats.record(statement, elapsed)
+    if elapsed >= settings.SLOW_QUERY_THRESHOLD:
+        logger.warning(
+            "Slow query (%.3fs): %s parameters: %s",
+            elapsed,
+            _shorten(statement),
+            redact_parameters(parameters, many),
+        )
+
+
+def _handle_error(exception_context):
+    # after_cursor_execute doesn't run for a failed statement
+    conn = exception_context.connection
+    if conn is not None and conn.info.get("query_started_at"):
+        conn.info["query_started_at"].pop()
+
+
+# (name, engine) of every instrumented engine, for the pool gauges
+_engines: List[Tuple[str, AsyncEngine]] = []
+
+
+def instrument_engine(name: str, engine: AsyncEngine) -> None:
+    """Time every statement the engine executes and report its pool state"""
+    event.listen(engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine.sync_engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine.sync_engine, "handle_error", _handle_error)
+    _engines.append((name, engine))
+
+
+def _pool_state() -> Iterable[Tuple[Tuple[str, str], float]]:
+    for name, engine in _engines:
+        pool = engine.pool
+        # Only queue pools have a size; SQLite's static pools report nothing
+        for state in ("size", "checkedin", "checkedout", "overflow"):
+            value = getattr(pool, state, None)
+            if callable(value):
+                yield (name, state), value()
+
+
+registry.callback(
+    "db_pool_connections",
+    "Connection pool state by engine: size, checkedin, checkedout, overflow",
+    ("engine", "state"),
+    "gauge",
+    _pool_state,
+)
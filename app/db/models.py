@@ -1,8 +1,19 @@
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy import Column, String, DateTime, ForeignKey, JSON, Float
+from sqlalchemy import (
+    Column,
+    String,
+    DateTime,
+    ForeignKey,
+    JSON,
+    Float,
+    Integer,
+    Index,
+    UniqueConstraint,
+)
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from datetime import datetime
+from enum import Enum
 import uuid
 
 Base = declarative_base()
@@ -20,6 +31,8 @@ class User(Base):
     wellbeing_profile = Column(JSON, nullable=True)
     skills_profile = Column(JSON, nullable=True)
     values_profile = Column(JSON, nullable=True)
+    # Bumped on every assessment write; part of the profile ETags
+    profile_version = Column(Integer, nullable=False, default=0, server_default="0")
 
     # Relationship
     applications = relationship("JobApplication", back_populates="user")
@@ -51,6 +64,22 @@ class Company(Base):
         )
 
 
+class JobStatus(str, Enum):
+    ACTIVE = "active"  # Listed, scored and open for applications
+    PAUSED = "paused"  # Hidden from the catalog, can be reactivated
+    EXPIRED = "expired"  # Past its application deadline
+
+
+class ApplicationStatus(str, Enum):
+    PENDING = "pending"  # Submitted, not yet looked at
+    REVIEWING = "reviewing"
+    INTERVIEW = "interview"
+    OFFER = "offer"
+    HIRED = "hired"
+    REJECTED = "rejected"
+    WITHDRAWN = "withdrawn"  # By the applicant
+
+
 class JobPosting(Base):
     __tablename__ = "job_postings"
 
@@ -64,6 +93,9 @@ class JobPosting(Base):
     salary_range = Column(String)  # e.g., "$120k - $180k"
     remote_policy = Column(String)  # "Full Remote", "Hybrid", or "In-Office"
     application_deadline = Column(String)  # e.g., "2024-04-30"
+    status = Column(
+        String, nullable=False, default=JobStatus.ACTIVE.value, server_default="active"
+    )
 
     # Job requirements profiles
     skills_requirements = Column(JSON, nullable=True)
@@ -80,12 +112,18 @@ class JobPosting(Base):
 
 class JobApplication(Base):
     __tablename__ = "job_applications"
+    __table_args__ = (
+        # One application per user and job, enforced even under concurrent applies
+        UniqueConstraint("user_id", "job_id", name="uq_job_applications_user_job"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"))
     job_id = Column(UUID(as_uuid=True), ForeignKey("job_postings.id"))
     created_at = Column(DateTime, default=datetime.utcnow)
-    status = Column(String, default="pending")
+    status = Column(String, default=ApplicationStatus.PENDING.value)
+    # Idempotency-Key header of the request that created the application
+    idempotency_key = Column(String, nullable=True)
 
     # Match scores
     skills_match = Column(Float, nullable=True)
@@ -99,3 +137,182 @@ class JobApplication(Base):
 
     def __repr__(self):
         return f"<JobPosting(id={self.id}, user_id={self.user_id}, job_id='{self.job_id}', created_at={self.created_at}, status='{self.status}', skills_match={self.skills_match}, wellbeing_match={self.wellbeing_match}, values_match={self.values_match}, overall_match={self.overall_match})>"
+
+
+class JobApplicationStats(Base):
+    """Rollup of application counts and match sums per job and status"""
+
+    __tablename__ = "job_application_stats"
+
+    job_id = Column(UUID(as_uuid=True), ForeignKey("job_postings.id"), primary_key=True)
+    status = Column(String, primary_key=True)
+    # Copied from the job so a company's stats are one index lookup, no join
+    company_id = Column(UUID(as_uuid=True), ForeignKey("companies.id"))
+
+    application_count = Column(Integer, nullable=False, default=0)
+    scored_count = Column(Integer, nullable=False, default=0)  # overall_match set
+    match_sum = Column(Float, nullable=False, default=0.0)
+    high_match_count = Column(Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<JobApplicationStats(job_id={self.job_id}, status='{self.status}', application_count={self.application_count}, scored_count={self.scored_count}, match_sum={self.match_sum}, high_match_count={self.high_match_count})>"
+
+
+class CatalogState(Base):
+    """Single-row version counter, bumped whenever the job catalog changes"""
+
+    __tablename__ = "catalog_state"
+
+    id = Column(Integer, primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, nullable=True)
+
+    def __repr__(self):
+        return f"<CatalogState(version={self.version}, updated_at={self.updated_at})>"
+
+
+class RecommendationSnapshot(Base):
+    """A user's last computed recommendations and the versions they came from"""
+
+    __tablename__ = "recommendation_snapshots"
+
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), primary_key=True)
+    profile_version = Column(Integer, nullable=False)
+    catalog_version = Column(Integer, nullable=False)
+    recommendations = Column(JSON, nullable=False)
+    # Lowest overall_match on the full list, None if the list isn't full: a
+    # changed job scoring below it can't enter
+    score_bound = Column(Float, nullable=True)
+    computed_at = Column(DateTime, nullable=False)
+
+    def __repr__(self):
+        return f"<RecommendationSnapshot(user_id={self.user_id}, profile_version={self.profile_version}, catalog_version={self.catalog_version}, computed_at={self.computed_at})>"
+
+
+class RecommendationSnapshotJob(Base):
+    """Reverse index: which snapshots list a job"""
+
+    __tablename__ = "recommendation_snapshot_jobs"
+
+    job_id = Column(UUID(as_uuid=True), ForeignKey("job_postings.id"), primary_key=True)
+    user_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("recommendation_snapshots.user_id"),
+        primary_key=True,
+        index=True,
+    )
+
+    def __repr__(self):
+        return (
+            f"<RecommendationSnapshotJob(job_id={self.job_id}, user_id={self.user_id})>"
+        )
+
+
+class SubmissionStatus(str, Enum):
+    PENDING = "pending"  # Waiting for a worker (or for its retry time)
+    PROCESSING = "processing"  # Claimed by a worker until next_attempt_at
+    DONE = "done"
+    DEAD = "dead"  # Gave up after the last attempt; kept for inspection
+
+
+class WebhookSubmission(Base):
+    """A received assessment webhook, stored before it is processed"""
+
+    __tablename__ = "webhook_submissions"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    email = Column(String, nullable=False)
+    # Assessment type -> answers, already validated
+    answers = Column(JSON, nullable=False)
+    # Digest of (email, answers); a resubmission within the dedup window
+    # matches the submitter's latest submission
+    content_hash = Column(String, nullable=True)
+    # The submitter's latest submission when this one was stored; unique per
+    # email, so concurrent submits can't both append after the same row
+    previous_id = Column(UUID(as_uuid=True), nullable=True)
+    status = Column(String, nullable=False, default=SubmissionStatus.PENDING.value)
+    attempts = Column(Integer, nullable=False, default=0)
+    # When a pending row may be claimed, or a claimed row's lease runs out
+    next_attempt_at = Column(DateTime, nullable=False)
+    last_error = Column(String, nullable=True)
+    created_at = Column(DateTime, nullable=False)
+    processed_at = Column(DateTime, nullable=True)
+
+    def __repr__(self):
+        return f"<WebhookSubmission(id={self.id}, email='{self.email}', status='{self.status}', attempts={self.attempts}, next_attempt_at={self.next_attempt_at}, created_at={self.created_at})>"
+
+
+# Secondary indexes, designed from the query shapes in app/db/crud.py and
+# app/api/routes.py. (user_id, job_id) lookups use uq_job_applications_user_job.
+
+# get_user_applications: WHERE user_id = ? ORDER BY created_at DESC
+Index(
+    "ix_job_applications_user_created",
+    JobApplication.user_id,
+    JobApplication.created_at.desc(),
+)
+
+# Applicant listings ranked per job (keyset on overall_match, id) and per-job
+# stats; the INCLUDE columns make the listing an index-only scan. Postgres
+# only: SQLite can't index NULLS LAST
+Index(
+    "ix_job_applications_job_match",
+    JobApplication.job_id,
+    JobApplication.overall_match.desc().nulls_last(),
+    JobApplication.id,
+    postgresql_include=[
+        "user_id",
+        "status",
+        "skills_match",
+        "wellbeing_match",
+        "values_match",
+        "created_at",
+    ],
+).ddl_if(dialect="postgresql")
+
+# A company's jobs (applicant listings, stats rollup, company job lists)
+Index(
+    "ix_job_postings_company_created",
+    JobPosting.company_id,
+    JobPosting.created_at.desc(),
+)
+
+# Catalog queries: only the live slice, ORDER BY created_at DESC
+Index(
+    "ix_job_postings_active_created",
+    JobPosting.created_at.desc(),
+    JobPosting.id,
+    postgresql_where=JobPosting.status == JobStatus.ACTIVE.value,
+    sqlite_where=JobPosting.status == JobStatus.ACTIVE.value,
+)
+
+# get_application_stats_by_company: WHERE company_id = ?
+Index("ix_job_application_stats_company", JobApplicationStats.company_id)
+
+# Webhook workers claim due rows by status and time; queue stats count by
+# status. Done rows, the bulk of the table, aren't indexed
+Index(
+    "ix_webhook_submissions_open",
+    WebhookSubmission.status,
+    WebhookSubmission.next_attempt_at,
+    postgresql_where=WebhookSubmission.status != SubmissionStatus.DONE.value,
+    sqlite_where=WebhookSubmission.status != SubmissionStatus.DONE.value,
+)
+
+# Enqueue: a submitter's submissions form a chain; two rows following the
+# same one (or two first rows) conflict. Also finds a submitter's latest row
+Index(
+    "uq_webhook_submissions_email_previous",
+    WebhookSubmission.email,
+    WebhookSubmission.previous_id,
+    unique=True,
+    postgresql_nulls_not_distinct=True,
+)
+
+# Coalescing: a submitter's other waiting submissions join a claimed batch
+Index(
+    "ix_webhook_submissions_open_email",
+    WebhookSubmission.email,
+    postgresql_where=WebhookSubmission.status != SubmissionStatus.DONE.value,
+    sqlite_where=WebhookSubmission.status != SubmissionStatus.DONE.value,
+)
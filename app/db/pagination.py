@@ -0,0 +1,37 @@
+# app/db/pagination.py
+import base64
+import json
+from typing import List, Sequence, Tuple, Type, Union
+
+# What each decoded cursor value must be: a JSON type or a tuple of them
+CursorField = Union[Type, Tuple[Type, ...]]
+
+
+def encode_cursor(values: Sequence) -> str:
+    """
+    Encode the sort key of the last row on a page into an opaque cursor
+    Values must be JSON-serializable after str() (UUIDs, datetimes, numbers)
+    """
+    raw = json.dumps(list(values), default=str, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, fields: Sequence[CursorField]) -> List:
+    """
+    Decode a cursor produced by encode_cursor, whose values must have the
+    given types (str for UUIDs and datetimes)
+    Raises ValueError if the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+    if (
+        not isinstance(values, list)
+        or len(values) != len(fields)
+        or not all(isinstance(value, field) for value, field in zip(values, fields))
+    ):
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return values
@@ -1,6 +1,7 @@
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.db.models import User, Company, JobPosting
+from app.db.crud import bump_catalog_version
 from app.core.dimensions import AssessmentDimensions, AssessmentType
 import json
 import uuid
@@ -469,4 +470,5 @@ async def seed_data(db: AsyncSession):
         job_post = JobPosting(**job_post_data)
         db.add(job_post)
 
+    await bump_catalog_version(db)
     await db.commit()
@@ -1,10 +1,20 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
-from app.api import webhooks
+from app.api import metrics, profiles, webhooks
+from app.api.webhooks import process_webhook_submission
 from app.api.routes import router, seed_router
+from app.api.question_catalog import load_question_catalogs
 from app.config import get_settings
 from app.core.logging import setup_logging
+from app.core.profiler import get_profile_store
+from app.db.database import replica_router
+from app.core.lifecycle import sweep_expired_jobs
+from app.core.scheduler import Priority, scheduler
+from app.core.webhook_queue import webhook_queue
+from app.middleware.metrics import MetricsMiddleware
+from app.middleware.profiling import ProfilingMiddleware
+from app.middleware.request_id import REQUEST_ID_HEADER, RequestIdMiddleware
 from app.middleware.error_handling import (
     error_handler,
     validation_exception_handler,
@@ -21,10 +31,28 @@ settings = get_settings()
 async def lifespan(app: FastAPI):
     # Startup
     setup_logging()
-    # Add any other startup logic (like initializing resources)
+    load_question_catalogs()
+    if replica_router.engines:
+        scheduler.every(
+            "replica-health",
+            settings.REPLICA_HEALTH_CHECK_INTERVAL,
+            "maintenance",
+            replica_router.check_health,
+            priority=Priority.INTERACTIVE,
+        )
+    scheduler.every(
+        "job-expiry",
+        settings.JOB_EXPIRY_SWEEP_INTERVAL,
+        "maintenance",
+        sweep_expired_jobs,
+    )
+    scheduler.start()
+    webhook_queue.start(process_webhook_submission, settings.WEBHOOK_WORKERS)
     yield
     # Shutdown
-    # Add any cleanup logic here
+    await webhook_queue.shutdown()
+    await scheduler.shutdown()
+    await replica_router.dispose()
 
 
 app = FastAPI(
@@ -41,6 +69,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "ETag", REQUEST_ID_HEADER],
 )
 
 # Exception handlers
@@ -48,10 +77,27 @@ app.middleware("http")(error_handler)
 app.add_exception_handler(RequestValidationError, validation_exception_handler)
 app.add_exception_handler(SQLAlchemyError, database_exception_handler)
 
+# Outermost, so it also times the error handler's 500s
+app.add_middleware(MetricsMiddleware)
+
+if settings.PROFILER_ENABLED:
+    app.add_middleware(
+        ProfilingMiddleware,
+        store=get_profile_store(),
+        secret=settings.PROFILER_SECRET,
+        sample_rate=settings.PROFILER_SAMPLE_RATE,
+    )
+
+# Outermost of all, so every log record of a request carries its id
+app.add_middleware(RequestIdMiddleware)
+
 # Routes
 app.include_router(router, prefix="/api/v1")
 app.include_router(seed_router, prefix="/admin")
 app.include_router(webhooks.router, prefix="/api/v1")
+app.include_router(metrics.router)
+if settings.PROFILER_ENABLED:
+    app.include_router(profiles.router, prefix="/admin")
 
 
 if __name__ == "__main__":
@@ -1,4 +1,5 @@
 from fastapi import Request, status
+from fastapi.encoders import jsonable_encoder
 from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
 from sqlalchemy.exc import SQLAlchemyError
@@ -19,7 +20,8 @@ async def error_handler(request: Request, call_next):
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     return JSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-        content={"detail": exc.errors()}
+        # Errors from validators carry the raised exception in their ctx
+        content={"detail": jsonable_encoder(exc.errors())}
     )
 
 async def database_exception_handler(request: Request, exc: SQLAlchemyError):
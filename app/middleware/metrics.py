@@ -0,0 +1,79 @@
+# app/middleware/metrics.py
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.metrics import (
+    db_queries_per_request,
+    db_query_seconds_per_request,
+    http_request_duration,
+    http_requests_in_progress,
+)
+from app.db.instrumentation import check_request_queries, track_queries
+
+# Route label for requests no route matched (404s on arbitrary paths)
+UNMATCHED_ROUTE = "unmatched"
+
+
+def _route_template(scope: Scope) -> str:
+    """The matched route's path template, including its router's prefix"""
+    route = scope.get("route")
+    template = getattr(route, "path", None)
+    if not template:
+        return UNMATCHED_ROUTE
+    # Depending on the FastAPI version the route's path may or may not carry
+    # the include_router prefix; recover it from the requested path
+    try:
+        rendered = getattr(route, "path_format", template).format(
+            **scope.get("path_params", {})
+        )
+    except (KeyError, IndexError, ValueError):
+        return template
+    path = scope["path"]
+    if rendered and path.endswith(rendered):
+        return path[: len(path) - len(rendered)] + template
+    return template
+
+
+class MetricsMiddleware:
+    """Records latency and statements per request, labeled by route template,
+    and checks each request's statements for N+1 patterns and budget overruns
+
+    A plain ASGI middleware: the per-request cost is a few dict updates, and
+    streamed responses are timed until their last chunk is sent.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        http_requests_in_progress.inc()
+        started_at = time.perf_counter()
+        try:
+            with track_queries() as stats:
+                await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - started_at
+            http_requests_in_progress.dec()
+
+            template = _route_template(scope)
+            http_request_duration.observe(
+                (scope["method"], template, str(status)), elapsed
+            )
+            db_queries_per_request.observe((template,), stats.count)
+            db_query_seconds_per_request.observe((template,), stats.seconds)
+            check_request_queries(
+                stats, template, getattr(scope.get("route"), "endpoint", None)
+            )
@@ -0,0 +1,88 @@
+# app/middleware/profiling.py
+from datetime import datetime
+import asyncio
+import cProfile
+import logging
+import random
+import time
+
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.profiler import PROFILE_HEADER, ProfileStore, verify_request
+
+logger = logging.getLogger(__name__)
+
+
+class ProfilingMiddleware:
+    """Runs cProfile around requests carrying a signed X-Profile header, and
+    around a sample_rate fraction of all others
+
+    Only installed when PROFILER_ENABLED is set. One request is profiled at a
+    time (the profiler is per thread); requests arriving meanwhile run
+    unprofiled. Other requests' coroutines interleaving on the event loop show
+    up in the profile too, so compare a slow request's profile with a normal
+    one's rather than reading it in isolation.
+    """
+
+    def __init__(
+        self, app: ASGIApp, store: ProfileStore, secret: str, sample_rate: float
+    ):
+        self.app = app
+        self.store = store
+        self.secret = secret
+        self.sample_rate = sample_rate
+        self._busy = False
+
+    def _wanted(self, scope: Scope) -> str:
+        """What makes the request profiled: "signed", "sampled" or "" (nothing)"""
+        header = Headers(scope=scope).get(PROFILE_HEADER)
+        if (
+            header
+            and self.secret
+            and verify_request(self.secret, scope["path"], header)
+        ):
+            return "signed"
+        if self.sample_rate and random.random() < self.sample_rate:
+            return "sampled"
+        return ""
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or self._busy:
+            await self.app(scope, receive, send)
+            return
+        trigger = self._wanted(scope)
+        if not trigger:
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        self._busy = True
+        profile = cProfile.Profile()
+        started_at = time.perf_counter()
+        profile.enable()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            profile.disable()
+            self._busy = False
+            meta = {
+                "method": scope["method"],
+                "path": scope["path"],
+                "status": status,
+                "trigger": trigger,
+                "seconds": round(time.perf_counter() - started_at, 6),
+                "created_at": datetime.utcnow().isoformat(),
+            }
+            try:
+                # Writing the pstats file is blocking I/O
+                await asyncio.to_thread(self.store.save, profile, meta)
+            except OSError:
+                logger.exception("Could not store request profile")
@@ -0,0 +1,43 @@
+# app/middleware/request_id.py
+import re
+import uuid
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.logging import current_request_id
+
+REQUEST_ID_HEADER = "X-Request-ID"
+# Ids taken from the caller; anything else is replaced by a fresh one
+_VALID_REQUEST_ID = re.compile(r"^[\w.:-]{1,128}$")
+
+
+class RequestIdMiddleware:
+    """Tags every log record of a request with a correlation id
+
+    The id is the caller's X-Request-ID (e.g. from a proxy) when it looks
+    like one, a new one otherwise, and is echoed in the response header.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = Headers(scope=scope).get(REQUEST_ID_HEADER)
+        if not request_id or not _VALID_REQUEST_ID.match(request_id):
+            request_id = uuid.uuid4().hex
+
+        async def send_with_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)[REQUEST_ID_HEADER] = request_id
+            await send(message)
+
+        token = current_request_id.set(request_id)
+        try:
+            await self.app(scope, receive, send_with_id)
+        finally:
+            current_request_id.reset(token)
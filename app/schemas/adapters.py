@@ -0,0 +1,14 @@
+from typing import List
+
+from pydantic import TypeAdapter
+
+from app.schemas.assessment import ProfileResponse
+from app.schemas.company import CompanyResponse, JobPostingResponse
+from app.schemas.table import TableDataResponse
+
+# Built once at import; building a TypeAdapter compiles its validator and
+# serializer, which is too slow to repeat per request
+company_list_adapter = TypeAdapter(List[CompanyResponse])
+job_posting_list_adapter = TypeAdapter(List[JobPostingResponse])
+profile_adapter = TypeAdapter(ProfileResponse)
+table_data_adapter = TypeAdapter(TableDataResponse)
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, field_validator
 from typing import List, Optional, Dict
 from datetime import datetime
 from uuid import UUID
@@ -33,6 +33,48 @@ class CompanyResponse(BaseModel):
     logo_url: Optional[str] = None  # Added logo URL
     wellbeing_profile: Optional[Dict] = None
     values_profile: Optional[Dict] = None
-    jobs: List[JobPostingResponse]
+    jobs: Optional[List[JobPostingResponse]] = None  # Omitted when jobs="count"
+    job_count: Optional[int] = None  # Set when jobs="count"
 
     model_config = ConfigDict(from_attributes=True, json_encoders={UUID: str})
+
+
+class JobPostingUpdate(BaseModel):
+    """Fields of a job posting that can be edited; omitted ones are kept"""
+
+    title: Optional[str] = None
+    description: Optional[str] = None
+    skills_requirements: Optional[Dict] = None
+    wellbeing_preferences: Optional[Dict] = None
+    values_alignment: Optional[Dict] = None
+    salary_range: Optional[str] = None
+    remote_policy: Optional[str] = None
+    application_deadline: Optional[str] = None
+
+    @field_validator("title")
+    @classmethod
+    def _title_not_null(cls, title: Optional[str]) -> str:
+        # Omitted keeps the title; null would clear a NOT NULL column
+        if title is None:
+            raise ValueError("title cannot be null")
+        return title
+
+
+class CompanyUpdate(BaseModel):
+    """Fields of a company that can be edited; omitted ones are kept"""
+
+    name: Optional[str] = None
+    description: Optional[str] = None
+    industry: Optional[str] = None
+    location: Optional[str] = None
+    logo_url: Optional[str] = None
+    wellbeing_profile: Optional[Dict] = None
+    values_profile: Optional[Dict] = None
+
+    @field_validator("name")
+    @classmethod
+    def _name_not_null(cls, name: Optional[str]) -> str:
+        # Omitted keeps the name; null would clear a NOT NULL column
+        if name is None:
+            raise ValueError("name cannot be null")
+        return name
@@ -1,6 +1,7 @@
-from pydantic import BaseModel, UUID4
-from typing import Optional
+from pydantic import BaseModel, Field, UUID4
+from typing import Dict, List, Optional
 from datetime import datetime
+from uuid import UUID
 
 
 class JobApplicationBase(BaseModel):
@@ -31,3 +32,28 @@ class JobMatch(BaseModel):
     wellbeing_match: Optional[float] = None
     values_match: Optional[float] = None
     matched_dimensions: list[str]
+
+
+# Upper bound on pairs per POST /match/batch request
+MAX_BATCH_PAIRS = 5000
+
+
+class MatchPair(BaseModel):
+    user_email: str
+    job_id: UUID
+
+
+class BatchMatchRequest(BaseModel):
+    pairs: List[MatchPair] = Field(..., min_length=1, max_length=MAX_BATCH_PAIRS)
+
+
+class BatchMatchResult(BaseModel):
+    user_email: str
+    job_id: UUID
+    match_score: Optional[Dict[str, float]] = None
+    matched_dimensions: Optional[List[str]] = None
+    error: Optional[str] = None  # Set instead of the scores when a pair fails
+
+
+class BatchMatchResponse(BaseModel):
+    results: List[BatchMatchResult]  # In request order
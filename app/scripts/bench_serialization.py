@@ -0,0 +1,159 @@
+"""Compare per-endpoint serialization cost of the stock and the fast JSON path.
+
+"before" is what FastAPI does for a route returning content: validate it
+against response_model (if any), turn it into plain Python with
+jsonable_encoder and encode it with stdlib json. "after" is the path in
+app/api/responses.py. Payloads are synthetic but shaped like production ones.
+
+    python -m app.scripts.bench_serialization --repeat 200
+"""
+
+import argparse
+import json
+import timeit
+import uuid
+from datetime import datetime
+
+from fastapi.encoders import jsonable_encoder
+
+from app.api.responses import dumps
+from app.core.dimensions import AssessmentDimensions, AssessmentType
+from app.schemas.adapters import (
+    company_list_adapter,
+    profile_adapter,
+    table_data_adapter,
+)
+from app.schemas.assessment import ProfileResponse
+from app.schemas.table import TableDataResponse, TableRowResponse
+
+
+def _profile(assessment_type: AssessmentType) -> dict:
+    return {
+        dimension: {
+            "score": 7.5,
+            "title": data["title"],
+            "description": data["description"],
+        }
+        for dimension, data in AssessmentDimensions.get_dimensions(
+            assessment_type
+        ).items()
+    }
+
+
+def _requirements(assessment_type: AssessmentType) -> dict:
+    dimensions = AssessmentDimensions.get_dimensions(assessment_type)
+    return {dimension: {"score": 8} for dimension in dimensions}
+
+
+def build_payloads(jobs: int) -> dict:
+    now = datetime.now()
+    profiles = {
+        "wellbeing_profile": _profile(AssessmentType.WELLBEING),
+        "skills_profile": _profile(AssessmentType.SKILLS),
+        "values_profile": _profile(AssessmentType.VALUES),
+    }
+    companies = [
+        {
+            "id": uuid.uuid4(),
+            "name": f"Company {c}",
+            "description": "A company",
+            "industry": "Technology",
+            "wellbeing_profile": _requirements(AssessmentType.WELLBEING),
+            "values_profile": _requirements(AssessmentType.VALUES),
+            "jobs": [
+                {
+                    "id": uuid.uuid4(),
+                    "company_id": uuid.uuid4(),
+                    "title": f"Job {j}",
+                    "description": "A job",
+                    "created_at": now,
+                    "skills_requirements": _requirements(AssessmentType.SKILLS),
+                    "wellbeing_preferences": _requirements(AssessmentType.WELLBEING),
+                    "values_alignment": _requirements(AssessmentType.VALUES),
+                }
+                for j in range(10)
+            ],
+        }
+        for c in range(jobs // 10)
+    ]
+    match_score = {
+        "skills_match": 0.8,
+        "wellbeing_match": 0.7,
+        "values_match": 0.9,
+        "overall_match": 0.8,
+    }
+    matches = [
+        {
+            "match_score": match_score,
+            "job_type": f"Job {j}",
+            "company": "Company",
+            "job": {
+                "id": uuid.uuid4(),
+                "title": f"Job {j}",
+                "company": "Company",
+                "description": "A job",
+            },
+        }
+        for j in range(jobs)
+    ]
+    table = TableDataResponse(
+        jobs=[
+            TableRowResponse(
+                company_name="Company",
+                company_location="Technology",
+                company_logo_url="/api/placeholder/40/40",
+                job_title=f"Job {j}",
+                apply_link=str(uuid.uuid4()),
+                compatibility_score=80.0,
+                wellbeing_score=70.0,
+                application_deadline="1.5.2025",
+            )
+            for j in range(jobs)
+        ],
+        total=jobs,
+    )
+    profile = ProfileResponse(
+        email="user@example.com",
+        assessment_status={"wellbeing": True, "skills": True, "values": True},
+        **profiles,
+    )
+    return {
+        "companies": (company_list_adapter, companies),
+        "profile": (profile_adapter, profile),
+        "job-table": (table_data_adapter, table),
+        "matching-insights": (None, {"best_matches": matches[:3], "all": matches}),
+    }
+
+
+def before(adapter, content) -> bytes:
+    if adapter is not None:
+        content = adapter.dump_python(adapter.validate_python(content), mode="json")
+    return json.dumps(jsonable_encoder(content), separators=(",", ":")).encode()
+
+
+def after(adapter, content) -> bytes:
+    if adapter is None:
+        return dumps(content)
+    if isinstance(content, list) and content and isinstance(content[0], dict):
+        # Rows from our queries are validated once, not twice
+        content = adapter.validate_python(content)
+    return adapter.dump_json(content)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark JSON serialization")
+    parser.add_argument("--jobs", type=int, default=500, help="Jobs per payload")
+    parser.add_argument("--repeat", type=int, default=100, help="Runs per endpoint")
+    args = parser.parse_args()
+
+    print(f"{'endpoint':<20}{'before ms':>12}{'after ms':>12}{'speedup':>10}")
+    for name, (adapter, content) in build_payloads(args.jobs).items():
+        assert json.loads(before(adapter, content)) == json.loads(
+            after(adapter, content)
+        ), f"{name}: outputs differ"
+        slow = timeit.timeit(lambda: before(adapter, content), number=args.repeat)
+        fast = timeit.timeit(lambda: after(adapter, content), number=args.repeat)
+        print(
+            f"{name:<20}{slow / args.repeat * 1000:>12.3f}"
+            f"{fast / args.repeat * 1000:>12.3f}{slow / fast:>9.1f}x"
+        )
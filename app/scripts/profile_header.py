@@ -0,0 +1,26 @@
+"""Print an X-Profile header that has a request profiled.
+
+Needs PROFILER_ENABLED and the server's PROFILER_SECRET. The signature covers
+the path only (no query string) and expires after --ttl seconds:
+
+    curl -H "$(python -m app.scripts.profile_header /api/v1/users/a@b.c/job-table)" ...
+    curl -H "X-Profiler-Token: $PROFILER_SECRET" .../admin/profiles
+"""
+
+import argparse
+
+from app.config import get_settings
+from app.core.profiler import sign_request
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Sign a request for profiling")
+    parser.add_argument("path", help="Request path, e.g. /api/v1/jobs")
+    parser.add_argument(
+        "--ttl", type=int, default=300, help="Seconds the header stays valid"
+    )
+    args = parser.parse_args()
+
+    secret = get_settings().PROFILER_SECRET
+    if not secret:
+        parser.error("PROFILER_SECRET is not set")
+    print(f"X-Profile: {sign_request(secret, args.path, args.ttl)}")
@@ -0,0 +1,22 @@
+"""
+Tests for the application status endpoint's input validation.
+"""
+
+import asyncio
+import uuid
+
+import httpx
+
+from app.main import app
+
+
+def test_unknown_application_status_is_rejected():
+    async def patch(status):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://t") as c:
+            return await c.patch(
+                f"/api/v1/applications/{uuid.uuid4()}/status",
+                params={"status": status},
+            )
+
+    assert asyncio.run(patch("bogus")).status_code == 422
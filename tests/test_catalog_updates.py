@@ -0,0 +1,27 @@
+"""
+Tests for the job posting and company edit endpoints' input validation.
+"""
+
+import asyncio
+import uuid
+
+import httpx
+
+from app.main import app
+
+
+def _patch(path, body):
+    async def patch():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://t") as c:
+            return await c.patch(path, json=body)
+
+    return asyncio.run(patch())
+
+
+def test_required_fields_cannot_be_set_to_null():
+    job = _patch(f"/admin/jobs/{uuid.uuid4()}", {"title": None})
+    company = _patch(f"/admin/companies/{uuid.uuid4()}", {"name": None})
+
+    assert job.status_code == 422
+    assert company.status_code == 422
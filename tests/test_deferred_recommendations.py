@@ -0,0 +1,43 @@
+"""
+Deferred recommendations on assessment submit (Postgres only, see
+conftest.py).
+"""
+
+import asyncio
+
+import httpx
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+from app.db.database import get_db
+from app.main import app
+
+
+async def _submit_deferred(engine, email):
+    session_factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async def override_db():
+        async with session_factory() as session:
+            yield session
+
+    app.dependency_overrides[get_db] = override_db
+    try:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://t") as c:
+            return await c.post(
+                "/api/v1/assessments/submit",
+                params={"user_email": email, "defer": "true"},
+                json={"values": {"INNOVATION_0": 6}},
+            )
+    finally:
+        app.dependency_overrides.clear()
+        await engine.dispose()
+
+
+def test_deferred_submit_points_at_the_mounted_poll_route(pg_engine, small_catalog):
+    response = asyncio.run(_submit_deferred(pg_engine(), small_catalog["email"]))
+
+    assert response.status_code == 202
+    job = response.json()["recommendations_job"]
+    assert job["poll_url"] == (f"http://t/api/v1/recommendation-jobs/{job['id']}")
+    assert response.headers["Location"] == job["poll_url"]
@@ -0,0 +1,101 @@
+"""
+Tests for the queued JSON logging pipeline (app/core/logging.py) and the
+request id middleware.
+"""
+
+import asyncio
+import json
+import logging
+import queue
+import threading
+
+import httpx
+
+from app.core.logging import (
+    JsonFormatter,
+    NonBlockingQueueHandler,
+    current_request_id,
+    log_records_dropped,
+)
+from app.middleware.request_id import REQUEST_ID_HEADER, RequestIdMiddleware
+
+
+def _queued_logger(maxsize=0):
+    log_queue = queue.Queue(maxsize=maxsize)
+    logger = logging.getLogger(f"test.logging.{maxsize}")
+    logger.handlers = [NonBlockingQueueHandler(log_queue)]
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    return logger, log_queue
+
+
+def test_records_are_json_with_request_id_extra_and_traceback():
+    logger, log_queue = _queued_logger()
+    token = current_request_id.set("req-1")
+    try:
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logger.exception("Failed for %s", "job", extra={"job_id": 7})
+    finally:
+        current_request_id.reset(token)
+
+    entry = json.loads(JsonFormatter().format(log_queue.get_nowait()))
+    assert entry["message"] == "Failed for job"
+    assert (entry["level"], entry["request_id"], entry["job_id"]) == (
+        "ERROR",
+        "req-1",
+        7,
+    )
+    assert "ValueError: boom" in entry["exception"]
+
+
+def test_full_queue_drops_records_instead_of_blocking():
+    logger, log_queue = _queued_logger(maxsize=1)
+    before = log_records_dropped._series.get(("WARNING",), 0)
+
+    logger.warning("kept")
+    logger.warning("dropped")
+
+    assert log_queue.qsize() == 1
+    assert log_records_dropped._series[("WARNING",)] == before + 1
+
+
+def test_drops_are_counted_from_any_thread():
+    logger, _ = _queued_logger(maxsize=1)
+    logger.error("fills the queue")
+    before = log_records_dropped._series.get(("ERROR",), 0)
+
+    def log_many():
+        for _ in range(1000):
+            logger.error("dropped")
+
+    threads = [threading.Thread(target=log_many) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert log_records_dropped._series[("ERROR",)] == before + 4000
+
+
+def test_request_id_is_set_for_the_request_and_echoed():
+    seen = []
+
+    async def app(scope, receive, send):
+        seen.append(current_request_id.get())
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    async def get(headers=None):
+        transport = httpx.ASGITransport(app=RequestIdMiddleware(app))
+        async with httpx.AsyncClient(transport=transport, base_url="http://t") as c:
+            return await c.get("/", headers=headers)
+
+    given = asyncio.run(get({REQUEST_ID_HEADER: "proxy-42"}))
+    fresh = asyncio.run(get({REQUEST_ID_HEADER: "not valid!"}))
+
+    assert given.headers[REQUEST_ID_HEADER] == "proxy-42"
+    assert fresh.headers[REQUEST_ID_HEADER] not in ("", "not valid!")
+    assert seen == ["proxy-42", fresh.headers[REQUEST_ID_HEADER]]
+    assert current_request_id.get() is None
@@ -0,0 +1,164 @@
+"""
+Tests for the match scoring policies (app/core/matching.py).
+"""
+
+import random
+
+import pytest
+
+from app.core.matching import MATCH_SOURCES, MatchingSystem
+
+USER = {
+    "wellbeing_profile": {"AUTONOMY": {"score": 8}, "MASTERY": {"score": 4}},
+    "skills_profile": {"TECHNICAL": {"score": 9}, "LEADERSHIP": {"score": 3}},
+}
+JOBS = [
+    (
+        {
+            "skills_requirements": {"TECHNICAL": {"score": 7}},
+            "wellbeing_preferences": {"AUTONOMY": {"score": 6}},
+        },
+        {"wellbeing_profile": {"AUTONOMY": {"score": 9}, "PURPOSE": {"score": 5}}},
+    ),
+    ({}, {}),
+]
+
+
+def _reference_match(user_profiles, job_requirements, company_profiles):
+    """The dense formula written out plainly, one job at a time"""
+
+    def side(user_score, target):
+        diff = user_score - target
+        return 1.0 + diff if diff < 0 else 1.0 - diff * 0.5
+
+    matches = {}
+    for match_type, (user_key, job_key, company_key) in MATCH_SOURCES.items():
+        if user_key not in user_profiles:
+            continue
+        job = job_requirements.get(job_key) or {}
+        company = company_profiles.get(company_key) or {}
+        dimension_scores = []
+        for dimension, data in user_profiles[user_key].items():
+            user_score = data.get("score", 0) / 10.0
+            job_score = job.get(dimension, {}).get("score", 0) / 10.0
+            company_score = company.get(dimension, {}).get("score", 0) / 10.0
+            match = (
+                side(user_score, job_score) * 0.6
+                + side(user_score, company_score) * 0.4
+            )
+            dimension_scores.append(max(0.0, min(1.0, match)))
+        matches[f"{match_type}_match"] = (
+            sum(dimension_scores) / len(dimension_scores) if dimension_scores else 0.0
+        )
+    weights = {"skills": 0.4, "wellbeing": 0.3, "values": 0.3}
+    present = [t for t in weights if f"{t}_match" in matches]
+    total = sum(weights[t] for t in present)
+    matches["overall_match"] = (
+        sum(matches[f"{t}_match"] * weights[t] for t in present) / total
+        if total
+        else 0.0
+    )
+    return matches
+
+
+def _random_profiles(rng, keys, dimensions):
+    return {
+        key: {
+            dimension: {"score": rng.randint(0, 10)}
+            for dimension in rng.sample(dimensions, rng.randint(0, len(dimensions)))
+        }
+        for key in keys
+        if rng.random() < 0.8
+    }
+
+
+def test_dense_scoring_matches_reference_formula():
+    rng = random.Random(38)
+    dimensions = ["A", "B", "C", "D", "E"]
+    user_keys = [user_key for user_key, _, _ in MATCH_SOURCES.values()]
+    job_keys = [job_key for _, job_key, _ in MATCH_SOURCES.values()]
+    matching = MatchingSystem()
+    for _ in range(50):
+        user = _random_profiles(rng, user_keys, dimensions)
+        # Jobs share their company's dict, as the callers batch them
+        companies = [_random_profiles(rng, user_keys, dimensions) for _ in range(3)]
+        jobs = [
+            (_random_profiles(rng, job_keys, dimensions), rng.choice(companies))
+            for _ in range(8)
+        ]
+        expected = [_reference_match(user, *job) for job in jobs]
+
+        assert matching.score_jobs(user, jobs) == [
+            pytest.approx(result) for result in expected
+        ]
+        assert [matching.calculate_match(user, *job) for job in jobs] == [
+            pytest.approx(result) for result in expected
+        ]
+
+
+def test_sparse_equals_dense_when_both_sides_define_every_dimension():
+    rng = random.Random(380)
+    dense, sparse = MatchingSystem(), MatchingSystem("sparse")
+    for _ in range(50):
+        dimensions = rng.sample(["A", "B", "C", "D", "E"], rng.randint(1, 5))
+
+        def profile():
+            return {
+                dimension: {"score": rng.randint(0, 10)} for dimension in dimensions
+            }
+
+        user, job, company = {}, {}, {}
+        for user_key, job_key, company_key in MATCH_SOURCES.values():
+            user[user_key], job[job_key], company[company_key] = (
+                profile(),
+                profile(),
+                profile(),
+            )
+
+        assert sparse.calculate_match(user, job, company) == pytest.approx(
+            dense.calculate_match(user, job, company)
+        )
+
+
+def test_sparse_scores_only_defined_dimensions():
+    matching = MatchingSystem("sparse")
+    defined, empty = matching.score_jobs(USER, JOBS)
+
+    # TECHNICAL against the job alone; LEADERSHIP is defined by neither side
+    assert defined["skills_match"] == pytest.approx(1.0 - 0.2 * 0.5)
+    # AUTONOMY against job (60%) and company (40%); MASTERY by neither side
+    assert defined["wellbeing_match"] == pytest.approx(0.6 * 0.9 + 0.4 * 0.9)
+    # A job defining nothing has nothing to score
+    assert empty == {"overall_match": 0.0}
+
+    assert matching.calculate_match(USER, *JOBS[0]) == defined
+    assert matching.score_prepared(USER, matching.prepare_jobs(JOBS)) == [
+        defined,
+        empty,
+    ]
+
+
+def test_unknown_policy_is_rejected():
+    with pytest.raises(ValueError):
+        MatchingSystem("fuzzy")
+
+
+def test_company_component_is_computed_once_per_company(monkeypatch):
+    matching = MatchingSystem()
+    company = {"wellbeing_profile": {"AUTONOMY": {"score": 3}}}
+    jobs = [
+        ({"wellbeing_preferences": {"AUTONOMY": {"score": score}}}, company)
+        for score in range(1, 11)
+    ]
+    expected = [matching.calculate_match(USER, *job) for job in jobs]
+
+    calls = []
+    company_terms = MatchingSystem._company_terms
+
+    def counting(user_scores, company_profiles):
+        calls.append(company_profiles)
+        return company_terms(user_scores, company_profiles)
+
+    monkeypatch.setattr(MatchingSystem, "_company_terms", staticmethod(counting))
+    assert matching.score_jobs(USER, jobs) == expected
+    assert calls == [company]
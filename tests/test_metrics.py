@@ -0,0 +1,56 @@
+"""
+Tests for the in-process metrics registry (app/core/metrics.py).
+"""
+
+from app.core import metrics
+from app.core.metrics import MetricsRegistry
+
+
+def test_histogram_renders_cumulative_buckets():
+    registry = MetricsRegistry()
+    histogram = registry.histogram(
+        "latency_seconds", "Latency", ("route",), buckets=(0.1, 1.0)
+    )
+    for value in (0.05, 0.1, 0.5, 3.0):
+        histogram.observe(("/jobs",), value)
+
+    lines = registry.render().splitlines()
+    assert lines[:2] == [
+        "# HELP latency_seconds Latency",
+        "# TYPE latency_seconds histogram",
+    ]
+    assert lines[2:] == [
+        'latency_seconds_bucket{route="/jobs",le="0.1"} 2',
+        'latency_seconds_bucket{route="/jobs",le="1.0"} 3',
+        'latency_seconds_bucket{route="/jobs",le="+Inf"} 4',
+        'latency_seconds_sum{route="/jobs"} 3.65',
+        'latency_seconds_count{route="/jobs"} 4',
+    ]
+
+
+def test_label_sets_beyond_the_cap_share_one_series(monkeypatch):
+    monkeypatch.setattr(metrics, "MAX_SERIES", 2)
+    registry = MetricsRegistry()
+    counter = registry.counter("requests_total", "Requests", ("route",))
+    for route in ("/a", "/b", "/c", "/d", "/a"):
+        counter.inc((route,))
+
+    assert registry.render().splitlines()[2:] == [
+        'requests_total{route="/a"} 2',
+        'requests_total{route="/b"} 1',
+        'requests_total{route="__overflow__"} 2',
+    ]
+
+
+def test_callback_metrics_are_read_at_render_time():
+    registry = MetricsRegistry()
+    state = {"size": 5}
+    registry.callback(
+        "pool_size",
+        "Pool size",
+        ("engine",),
+        "gauge",
+        lambda: [(("primary",), state["size"])],
+    )
+    state["size"] = 7
+    assert registry.render().splitlines()[2:] == ['pool_size{engine="primary"} 7']
@@ -0,0 +1,53 @@
+"""
+Tests for keyset pagination cursors (app/db/pagination.py).
+"""
+
+import asyncio
+import base64
+import uuid
+
+import httpx
+import pytest
+
+from app.db.pagination import decode_cursor, encode_cursor
+from app.main import app
+
+APPLICANT_KEY = [(int, float, type(None)), str]
+
+
+def test_cursor_round_trip():
+    application_id = uuid.uuid4()
+    cursor = encode_cursor([0.75, application_id])
+
+    assert decode_cursor(cursor, APPLICANT_KEY) == [0.75, str(application_id)]
+    assert decode_cursor(encode_cursor([None, "x"]), APPLICANT_KEY) == [None, "x"]
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not base64!",
+        base64.urlsafe_b64encode(b"not json").decode(),
+        encode_cursor([0.5]),
+        encode_cursor({"a": 1}),
+        # Well-formed JSON with the wrong value types
+        encode_cursor([0.5, 42]),
+        encode_cursor([0.5, ["list"]]),
+        encode_cursor(["0.5", str(uuid.uuid4())]),
+    ],
+)
+def test_malformed_cursor_raises_value_error(cursor):
+    with pytest.raises(ValueError):
+        decode_cursor(cursor, APPLICANT_KEY)
+
+
+def test_malformed_applicants_cursor_is_a_bad_request():
+    async def get():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://t") as c:
+            return await c.get(
+                f"/api/v1/companies/{uuid.uuid4()}/jobs/{uuid.uuid4()}/applications",
+                params={"cursor": encode_cursor([0.5, [1]])},
+            )
+
+    assert asyncio.run(get()).status_code == 400
@@ -0,0 +1,37 @@
+"""
+Tests for profile cache invalidation on user writes (app/db/crud.py).
+"""
+
+import asyncio
+
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.cache import profile_cache
+from app.db import crud
+from app.db.models import Base
+
+
+async def _change_email(old: str, new: str):
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    try:
+        async with session_factory() as db:
+            user = await crud.create_user(db, old)
+            assert await crud.get_cached_user(db, old) is not None
+            user.email = new
+            await db.commit()
+            return user.id
+    finally:
+        await engine.dispose()
+
+
+def test_email_change_evicts_both_emails():
+    profile_cache.clear()
+    user_id = asyncio.run(_change_email("old@example.com", "new@example.com"))
+
+    assert profile_cache.by_email("old@example.com") is None
+    assert profile_cache.by_email("new@example.com") is None
+    assert profile_cache.by_id(user_id) is None
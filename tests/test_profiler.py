@@ -0,0 +1,76 @@
+"""
+Tests for the on-demand request profiler (app/core/profiler.py and
+app/middleware/profiling.py).
+"""
+
+import asyncio
+import cProfile
+import pstats
+
+import httpx
+
+from app.core.profiler import ProfileStore, sign_request, verify_request
+from app.middleware.profiling import ProfilingMiddleware
+
+SECRET = "s3cret"
+
+
+def test_signature_covers_path_and_expiry():
+    header = sign_request(SECRET, "/api/v1/jobs")
+
+    assert verify_request(SECRET, "/api/v1/jobs", header)
+    assert not verify_request(SECRET, "/api/v1/companies", header)
+    assert not verify_request("other", "/api/v1/jobs", header)
+    assert not verify_request(SECRET, "/api/v1/jobs", "9" + header)
+    assert not verify_request(SECRET, "/api/v1/jobs", "garbage")
+    assert not verify_request(SECRET, "/api/v1/jobs", sign_request(SECRET, "/", -1))
+
+
+def test_store_keeps_the_newest_profiles(tmp_path):
+    store = ProfileStore(str(tmp_path), max_profiles=2)
+    names = [store.save(cProfile.Profile(), {"path": f"/{i}"}) for i in range(3)]
+
+    listed = store.list()
+    assert [profile["name"] for profile in listed] == names[:0:-1]
+    assert [profile["path"] for profile in listed] == ["/2", "/1"]
+    assert store.path(names[0]) is None
+    assert store.path("../secrets.pstats") is None
+    assert len(list(tmp_path.iterdir())) == 4
+
+
+async def _ok(scope, receive, send):
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"ok"})
+
+
+async def _get(app, path, headers=None):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://t") as client:
+        return await client.get(path, headers=headers)
+
+
+def test_middleware_profiles_signed_requests_only(tmp_path):
+    store = ProfileStore(str(tmp_path), max_profiles=5)
+    app = ProfilingMiddleware(_ok, store=store, secret=SECRET, sample_rate=0.0)
+
+    asyncio.run(_get(app, "/jobs"))
+    asyncio.run(_get(app, "/jobs", {"X-Profile": sign_request(SECRET, "/other")}))
+    assert store.list() == []
+
+    response = asyncio.run(
+        _get(app, "/jobs", {"X-Profile": sign_request(SECRET, "/jobs")})
+    )
+    assert response.text == "ok"
+    [profile] = store.list()
+    assert profile["path"] == "/jobs"
+    assert (profile["status"], profile["trigger"]) == (200, "signed")
+    pstats.Stats(str(store.path(profile["name"])))
+
+
+def test_middleware_samples_requests(tmp_path):
+    store = ProfileStore(str(tmp_path), max_profiles=5)
+    app = ProfilingMiddleware(_ok, store=store, secret="", sample_rate=1.0)
+
+    asyncio.run(_get(app, "/jobs"))
+
+    assert [profile["trigger"] for profile in store.list()] == ["sampled"]
@@ -0,0 +1,28 @@
+"""
+Tests for Accept-Encoding negotiation of the pre-rendered question catalogs.
+"""
+
+import pytest
+
+from app.api.question_catalog import _accepts_gzip
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        (None, False),
+        ("gzip", True),
+        ("br, gzip;q=0.5", True),
+        ("gzip;q=0", False),
+        ("*", True),
+        ("*;q=0", False),
+        ("gzip;q=0, *", False),
+        ("identity", False),
+        # Other parameters and malformed q values don't fail the request
+        ("gzip;level=9", True),
+        ("gzip;q=high", True),
+        ("gzip;;q=0.0", False),
+    ],
+)
+def test_accepts_gzip(header, expected):
+    assert _accepts_gzip(header) is expected
@@ -0,0 +1,82 @@
+"""
+Tests for read-replica routing (app/db/database.py), against two local SQLite
+databases standing in for the replicas.
+"""
+
+import asyncio
+
+from sqlalchemy import text
+
+from app.db.database import AsyncSessionLocal, ReplicaRouter
+
+
+async def _make_router(tmp_path, window=5.0, names=("a", "b")) -> ReplicaRouter:
+    """Router over one SQLite database per name; a name with a "/" in it is a
+    database that can't be opened"""
+    router = ReplicaRouter(
+        [f"sqlite+aiosqlite:///{tmp_path / name}.db" for name in names], window
+    )
+    for name, replica in zip(names, router.engines):
+        if "/" in name:
+            continue
+        async with replica.begin() as conn:
+            await conn.execute(text("CREATE TABLE replica (name TEXT)"))
+            await conn.execute(text(f"INSERT INTO replica VALUES ('{name}')"))
+    return router
+
+
+async def _served_by(router: ReplicaRouter, user_key=None) -> str:
+    factory = router.session_factory(user_key)
+    if factory is AsyncSessionLocal:
+        return "primary"
+    async with factory() as session:
+        return await session.scalar(text("SELECT name FROM replica"))
+
+
+def test_reads_round_robin_over_replicas(tmp_path):
+    async def run():
+        router = await _make_router(tmp_path)
+        try:
+            return [await _served_by(router) for _ in range(4)]
+        finally:
+            await router.dispose()
+
+    assert sorted(asyncio.run(run())) == ["a", "a", "b", "b"]
+
+
+def test_unhealthy_replicas_are_skipped_then_fall_back_to_primary(tmp_path):
+    async def run():
+        router = await _make_router(tmp_path, names=("a", "missing/b"))
+        try:
+            await router.check_health()
+            one_down = [await _served_by(router) for _ in range(3)]
+            health = list(router.healthy)
+            router.healthy = [False, False]
+            all_down = await _served_by(router)
+            return health, one_down, all_down
+        finally:
+            await router.dispose()
+
+    health, one_down, all_down = asyncio.run(run())
+    assert health == [True, False]
+    assert one_down == ["a", "a", "a"]
+    assert all_down == "primary"
+
+
+def test_writer_reads_from_primary_within_the_window(tmp_path):
+    async def run():
+        router = await _make_router(tmp_path, window=0.2)
+        try:
+            router.mark_write("writer@example.com")
+            during = await _served_by(router, "writer@example.com")
+            other = await _served_by(router, "reader@example.com")
+            await asyncio.sleep(0.25)
+            after = await _served_by(router, "writer@example.com")
+            return during, other, after
+        finally:
+            await router.dispose()
+
+    during, other, after = asyncio.run(run())
+    assert during == "primary"
+    assert other in ("a", "b")
+    assert after in ("a", "b")
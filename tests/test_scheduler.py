@@ -0,0 +1,111 @@
+"""
+Tests for the in-process background scheduler (app/core/scheduler.py).
+"""
+
+import asyncio
+
+import pytest
+
+from app.core.scheduler import Priority, Scheduler, SchedulerBusy
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+def test_interactive_jobs_run_before_batch_jobs():
+    async def scenario():
+        scheduler = Scheduler()
+        scheduler.add_queue("q", concurrency=1, maxsize=10)
+        order = []
+
+        async def job(name):
+            order.append(name)
+            await asyncio.sleep(0.01)
+
+        scheduler.start()
+        first = scheduler.submit_nowait("q", job, "first")
+        await asyncio.sleep(0)
+        rest = [
+            scheduler.submit_nowait("q", job, "batch"),
+            scheduler.submit_nowait(
+                "q", job, "interactive", priority=Priority.INTERACTIVE
+            ),
+        ]
+        await asyncio.gather(first, *rest)
+        await scheduler.shutdown()
+        return order
+
+    assert _run(scenario()) == ["first", "interactive", "batch"]
+
+
+def test_full_queue_applies_backpressure():
+    async def scenario():
+        scheduler = Scheduler()
+        scheduler.add_queue("q", concurrency=1, maxsize=1)
+        release = asyncio.Event()
+
+        async def job():
+            await release.wait()
+
+        scheduler.start()
+        running = scheduler.submit_nowait("q", job)
+        await asyncio.sleep(0)
+        queued = scheduler.submit_nowait("q", job)
+        with pytest.raises(SchedulerBusy):
+            scheduler.submit_nowait("q", job)
+
+        waiting = asyncio.create_task(scheduler.submit("q", job))
+        await asyncio.sleep(0.01)
+        assert not waiting.done()
+
+        release.set()
+        await asyncio.gather(running, queued, await waiting)
+        stats = scheduler.stats()["queues"]["q"]
+        await scheduler.shutdown()
+        return stats
+
+    stats = _run(scenario())
+    assert stats["rejected"] == 1
+    assert stats["completed"] == 3
+
+
+def test_failures_reach_the_future_and_the_stats():
+    async def scenario():
+        scheduler = Scheduler()
+        scheduler.add_queue("q", concurrency=2, maxsize=10)
+
+        async def boom():
+            raise RuntimeError("boom")
+
+        scheduler.start()
+        future = scheduler.submit_nowait("q", boom)
+        with pytest.raises(RuntimeError):
+            await future
+        stats = scheduler.stats()["queues"]["q"]
+        await scheduler.shutdown()
+        return stats
+
+    assert _run(scenario())["failed"] == 1
+
+
+def test_periodic_jobs_skip_ticks_while_running():
+    async def scenario():
+        scheduler = Scheduler()
+        scheduler.add_queue("q", concurrency=1, maxsize=10)
+        runs = []
+
+        async def slow():
+            runs.append(1)
+            await asyncio.sleep(0.1)
+
+        scheduler.every("slow", 0.02, "q", slow)
+        scheduler.start()
+        await asyncio.sleep(0.15)
+        stats = scheduler.stats()["periodic"]["slow"]
+        await scheduler.shutdown()
+        return len(runs), stats
+
+    started, stats = _run(scenario())
+    assert started == 2
+    assert stats["skipped"] > 0
@@ -0,0 +1,133 @@
+"""
+Which recommendation snapshots a catalog change recomputes (Postgres only, see
+conftest.py).
+"""
+
+import asyncio
+import uuid
+
+import httpx
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+from app.core import recommendations
+from app.core.scheduler import Priority
+from app.db.crud import STALE_CATALOG_VERSION, save_recommendation_snapshot
+from app.db.database import get_read_db
+from app.db.models import RecommendationSnapshot, User
+from app.main import app
+
+# The catalog user's skills against a catalog job score about 0.86
+SNAPSHOTS = {
+    # name: (listed job, score_bound)
+    "listing": ("changed", 0.99),
+    "outscored": ("other", 0.5),
+    "partial": ("other", None),
+    "unaffected": ("other", 0.99),
+}
+
+
+async def _propagate(engine, monkeypatch, catalog):
+    session_factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    jobs = {"changed": catalog["job_ids"][0], "other": catalog["job_ids"][1]}
+    users = {name: uuid.uuid4() for name in SNAPSHOTS}
+    async with session_factory() as db:
+        await db.execute(
+            insert(User),
+            [
+                {
+                    "id": user_id,
+                    "email": f"{name}@example.com",
+                    "skills_profile": {"TECHNICAL": {"score": 7}},
+                    "profile_version": 1,
+                }
+                for name, user_id in users.items()
+            ],
+        )
+        await db.commit()
+        for name, (job, score_bound) in SNAPSHOTS.items():
+            listed = {"job": {"id": str(jobs[job])}, "match_score": {}}
+            await save_recommendation_snapshot(
+                db, users[name], 1, 1, [listed], score_bound
+            )
+
+    refreshed = {}
+
+    async def refresh(user_id, profile_version):
+        refreshed[user_id] = profile_version
+
+    monkeypatch.setattr(recommendations, "AsyncSessionLocal", session_factory)
+    monkeypatch.setattr(recommendations.recommendation_jobs, "refresh", refresh)
+    try:
+        affected = await recommendations.propagate_catalog_change([jobs["changed"]], 2)
+        async with session_factory() as db:
+            result = await db.execute(
+                select(
+                    RecommendationSnapshot.user_id,
+                    RecommendationSnapshot.catalog_version,
+                )
+            )
+            versions = dict(result.all())
+    finally:
+        await engine.dispose()
+
+    names = {user_id: name for name, user_id in users.items()}
+    return (
+        affected,
+        {names[user_id]: version for user_id, version in refreshed.items()},
+        {names[user_id]: version for user_id, version in versions.items()},
+    )
+
+
+def test_catalog_change_recomputes_only_affected_snapshots(
+    pg_engine, small_catalog, monkeypatch
+):
+    affected, refreshed, versions = asyncio.run(
+        _propagate(pg_engine(), monkeypatch, small_catalog)
+    )
+
+    # Listing the changed job, outscored by it, and a list that wasn't full
+    assert affected == 3
+    assert refreshed == {"listing": 1, "outscored": 1, "partial": 1}
+    assert versions == {
+        "listing": STALE_CATALOG_VERSION,
+        "outscored": STALE_CATALOG_VERSION,
+        "partial": STALE_CATALOG_VERSION,
+        "unaffected": 2,
+    }
+
+
+async def _read_without_snapshot(engine, monkeypatch, email):
+    session_factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    scheduled = []
+
+    async def override_db():
+        async with session_factory() as session:
+            yield session
+
+    def schedule(user_id, profile_version, priority=Priority.INTERACTIVE):
+        scheduled.append((profile_version, priority))
+
+    monkeypatch.setattr(recommendations.recommendation_jobs, "schedule", schedule)
+    app.dependency_overrides[get_read_db] = override_db
+    try:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://t") as c:
+            response = await c.get(f"/api/v1/users/{email}/recommendations")
+    finally:
+        app.dependency_overrides.clear()
+        await engine.dispose()
+    return response, scheduled
+
+
+def test_read_without_current_snapshot_schedules_a_refresh(
+    pg_engine, small_catalog, monkeypatch
+):
+    response, scheduled = asyncio.run(
+        _read_without_snapshot(pg_engine(), monkeypatch, small_catalog["email"])
+    )
+
+    # Served now, and stored in the background so the next read is a hit
+    assert response.status_code == 200
+    assert scheduled == [(1, Priority.BATCH)]
@@ -0,0 +1,81 @@
+"""
+Webhook deduplication (crud.enqueue_webhook_submission) against Postgres: a
+resubmission is only dropped when it repeats the submitter's latest live
+submission.
+"""
+
+import asyncio
+
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+from app.db import crud
+from app.db.models import SubmissionStatus, WebhookSubmission
+
+A = {"values": {"INNOVATION_0": 6}}
+B = {"values": {"INNOVATION_0": 2}}
+
+
+async def _enqueue_all(engine, email, submissions):
+    session_factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    results = []
+    for answers in submissions:
+        async with session_factory() as db:
+            results.append(
+                await crud.enqueue_webhook_submission(db, email, answers, 300)
+            )
+    await engine.dispose()
+    return results
+
+
+def test_repeat_of_latest_submission_is_dropped(pg_engine):
+    (first, stored), (again, stored_again) = asyncio.run(
+        _enqueue_all(pg_engine(), "repeat@example.com", [A, A])
+    )
+    assert (stored, stored_again) == (True, False)
+    assert again == first
+
+
+def test_resubmission_after_a_different_one_is_stored(pg_engine):
+    results = asyncio.run(_enqueue_all(pg_engine(), "aba@example.com", [A, B, A]))
+
+    assert [stored for _, stored in results] == [True, True, True]
+    assert len({submission_id for submission_id, _ in results}) == 3
+
+
+def test_resubmission_after_dead_letter_is_stored(pg_engine):
+    async def run(engine):
+        [(dead_id, _)] = await _enqueue_all(engine, "dead@example.com", [A])
+        async with engine.begin() as conn:
+            await conn.execute(
+                update(WebhookSubmission)
+                .where(WebhookSubmission.id == dead_id)
+                .values(status=SubmissionStatus.DEAD.value)
+            )
+        [(retry_id, stored)] = await _enqueue_all(engine, "dead@example.com", [A])
+        return dead_id, retry_id, stored
+
+    dead_id, retry_id, stored = asyncio.run(run(pg_engine()))
+    assert stored and retry_id != dead_id
+
+
+def test_concurrent_identical_submissions_store_one(pg_engine):
+    async def run(engine):
+        session_factory = sessionmaker(
+            engine, class_=AsyncSession, expire_on_commit=False
+        )
+
+        async def enqueue():
+            async with session_factory() as db:
+                return await crud.enqueue_webhook_submission(
+                    db, "race@example.com", A, 300
+                )
+
+        results = await asyncio.gather(*(enqueue() for _ in range(5)))
+        await engine.dispose()
+        return results
+
+    results = asyncio.run(run(pg_engine()))
+    assert sum(stored for _, stored in results) == 1
+    assert len({submission_id for submission_id, _ in results}) == 1
@@ -0,0 +1,70 @@
+"""
+Webhook queue workers storing queued submissions end to end (Postgres only,
+see conftest.py).
+"""
+
+import asyncio
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+from app.api.webhooks import process_webhook_submission
+from app.core import webhook_queue as queue_module
+from app.core.recommendations import recommendation_jobs
+from app.core.webhook_queue import WebhookQueue
+from app.db import crud
+from app.db.models import SubmissionStatus, User, WebhookSubmission
+
+EMAIL = "queued@example.com"
+
+
+async def _process(engine, monkeypatch):
+    session_factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    scheduled = []
+    monkeypatch.setattr(queue_module, "AsyncSessionLocal", session_factory)
+    monkeypatch.setattr(
+        recommendation_jobs,
+        "schedule",
+        lambda user_id, profile_version: scheduled.append(profile_version),
+    )
+    queue = WebhookQueue(
+        batch_size=10,
+        poll_interval=1.0,
+        lease=30.0,
+        max_attempts=3,
+        retry_backoff=1.0,
+        dedup_window=0,
+        coalesce_delay=0,
+    )
+    try:
+        for answers in (
+            {"values": {"INNOVATION_0": 6}},
+            {"skills": {"TECHNICAL_0": 8}},
+        ):
+            async with session_factory() as db:
+                await crud.enqueue_webhook_submission(db, EMAIL, answers)
+
+        claimed = await queue.process_batch(process_webhook_submission)
+        async with session_factory() as db:
+            statuses = (
+                await db.scalars(
+                    select(WebhookSubmission.status).where(
+                        WebhookSubmission.email == EMAIL
+                    )
+                )
+            ).all()
+            user = await db.scalar(select(User).where(User.email == EMAIL))
+    finally:
+        await engine.dispose()
+    return claimed, statuses, user, scheduled
+
+
+def test_queued_submissions_are_stored_and_marked_done(pg_engine, monkeypatch):
+    claimed, statuses, user, scheduled = asyncio.run(_process(pg_engine(), monkeypatch))
+
+    assert claimed == 2
+    assert statuses == [SubmissionStatus.DONE.value] * 2
+    # Both of the submitter's submissions are stored as one submit
+    assert user.values_profile and user.skills_profile
+    assert scheduled == [user.profile_version]